@@ -1,7 +1,9 @@
+import functools
 import os
 import pdfplumber
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from typing import List, Optional, Dict, Any
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -10,30 +12,102 @@ import numpy as np
 import faiss
 import pickle
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from cachetools import LRUCache
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 
+# Chunks per embeddings request, and how many requests load_data_async keeps in flight
+RAG_EMBED_BATCH_SIZE = int(os.getenv("RAG_EMBED_BATCH_SIZE", "256"))
+RAG_EMBED_CONCURRENCY = int(os.getenv("RAG_EMBED_CONCURRENCY", "2"))
+
+# Worker processes for PDF/Excel text extraction in load_data_async; parsing is
+# CPU-bound and holds the GIL, so threads do not overlap it. 0 keeps it on threads.
+RAG_INGEST_PROCESSES = int(os.getenv("RAG_INGEST_PROCESSES", "0"))
+
+# faiss.index_factory description for new indexes (inner product on normalized
+# vectors = cosine). The default "SQfp16" stores vectors as float16 (half the
+# memory and index file size of float32 "Flat", no training, negligible recall
+# loss on unit vectors); "SQ8" stores 8-bit codes (4x less memory) and
+# "SQ8,Refine(Flat)" re-ranks them exactly.
+RAG_INDEX_FACTORY = os.getenv("RAG_INDEX_FACTORY", "SQfp16")
+
+# Graph build/search breadth for HNSW indexes (e.g. RAG_INDEX_FACTORY="HNSW24");
+# higher values raise recall at the cost of build time/latency
+RAG_HNSW_EF_CONSTRUCTION = int(os.getenv("RAG_HNSW_EF_CONSTRUCTION", "128"))
+RAG_HNSW_EF_SEARCH = int(os.getenv("RAG_HNSW_EF_SEARCH", "100"))
+
+# Normalized query embeddings kept in memory, so repeated searches skip the embeddings API
+RAG_QUERY_CACHE_SIZE = int(os.getenv("RAG_QUERY_CACHE_SIZE", "1024"))
+
+
+def _extract_pdf_text(pdf_path: str) -> str:
+    """Extract text from a PDF file using pdfplumber (module-level so worker processes can run it)."""
+    text = ""
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    text += page_text + "\n"
+        return text
+    except Exception as e:
+        raise Exception(f"Error reading PDF: {str(e)}")
+
+
+def _extract_excel_text(excel_path: str) -> str:
+    """Extract text from an Excel file using pandas (module-level so worker processes can run it)."""
+    try:
+        df = pd.read_excel(excel_path)
+        text = df.to_string(index=False)
+        return text
+    except Exception as e:
+        raise Exception(f"Error reading Excel: {str(e)}")
+
+
 class RAGService:
     """
     RAG Service using FAISS for fast vector search with data ingestion capabilities.
     """
     
-    def __init__(self, openai_api_key: str, index_path: str = "./faiss_index"):
+    def __init__(
+        self,
+        openai_api_key: str,
+        index_path: str = "./faiss_index",
+        embed_batch_size: int = RAG_EMBED_BATCH_SIZE,
+        embed_concurrency: int = RAG_EMBED_CONCURRENCY,
+        ingest_processes: int = RAG_INGEST_PROCESSES
+    ):
         """
         Initialize RAG Service with FAISS and OpenAI credentials.
         
         Args:
             openai_api_key: API key for OpenAI
             index_path: Directory path to store FAISS index and metadata
+            embed_batch_size: Chunks sent per embeddings request during async ingestion
+            embed_concurrency: Embeddings requests in flight at once during async ingestion
+            ingest_processes: Worker processes for async PDF/Excel extraction (0 uses the thread pool)
         """
         self.embeddings = OpenAIEmbeddings(openai_api_key=openai_api_key)
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
+        self._query_cache = LRUCache(maxsize=RAG_QUERY_CACHE_SIZE)  # query text -> (d,) float32
+        self._query_cache_lock = threading.Lock()
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=1000,
             chunk_overlap=200,
             length_function=len
         )
         self.executor = ThreadPoolExecutor(max_workers=5)
+        self.ingest_processes = ingest_processes
+        self._process_executor: Optional[ProcessPoolExecutor] = None  # started on first use
+        
+        # Keep-alive connection pool for website ingestion (sized to the executor)
+        self.http = requests.Session()
+        self.http.mount('http://', HTTPAdapter(pool_maxsize=5))
+        self.http.mount('https://', HTTPAdapter(pool_maxsize=5))
         
         # FAISS setup
         self.index_path = Path(index_path)
@@ -41,6 +115,9 @@ class RAGService:
         
         self.index = None  # FAISS index
         self.metadata = []  # List of dicts with text, collection, chunk_index
+        self._collection_counts = Counter()  # collection -> chunk count, kept in step with metadata
+        self._collection_codes: Dict[str, int] = {}  # collection -> integer code
+        self._chunk_codes = np.empty(0, dtype=np.int32)  # collection code of each indexed chunk
         self.dimension = 1536  # OpenAI embedding dimension
         
         # Load existing index if available
@@ -54,8 +131,12 @@ class RAGService:
         if index_file.exists() and metadata_file.exists():
             try:
                 self.index = faiss.read_index(str(index_file))
+                if self.index.d != self.dimension:
+                    raise ValueError(f"index dimension {self.index.d} does not match embeddings ({self.dimension})")
+                self._tune_hnsw()
                 with open(metadata_file, 'rb') as f:
                     self.metadata = pickle.load(f)
+                self._count_collections()
                 print(f"✓ Loaded FAISS index with {len(self.metadata)} vectors")
             except Exception as e:
                 print(f"Warning: Could not load existing index: {e}")
@@ -65,42 +146,63 @@ class RAGService:
     
     def _initialize_index(self):
         """Initialize a new FAISS index."""
-        # Use IndexFlatIP for cosine similarity (after L2 normalization)
-        # For better performance with large datasets, consider IndexIVFFlat
-        self.index = faiss.IndexFlatIP(self.dimension)
+        # Inner product gives cosine similarity (after L2 normalization)
+        self.index = faiss.index_factory(self.dimension, RAG_INDEX_FACTORY, faiss.METRIC_INNER_PRODUCT)
+        self._tune_hnsw()
         self.metadata = []
+        self._count_collections()
         print("✓ Initialized new FAISS index")
     
+    def _tune_hnsw(self):
+        """Apply the efConstruction/efSearch settings if the index (or its base index) is HNSW."""
+        index = faiss.downcast_index(self.index)
+        while not hasattr(index, "hnsw") and hasattr(index, "base_index"):
+            index = faiss.downcast_index(index.base_index)
+        if hasattr(index, "hnsw"):
+            index.hnsw.efConstruction = RAG_HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = RAG_HNSW_EF_SEARCH
+    
+    def _count_collections(self):
+        """Recount chunks per collection and recode chunk collections after metadata has changed."""
+        self._collection_counts = Counter(meta["collection"] for meta in self.metadata)
+        self._collection_codes = {name: code for code, name in enumerate(self._collection_counts)}
+        self._chunk_codes = np.fromiter(
+            (self._collection_codes[meta["collection"]] for meta in self.metadata),
+            dtype=np.int32, count=len(self.metadata)
+        )
+    
     def _save_index(self):
         """Save FAISS index and metadata to disk."""
+        # Every change to the metadata is followed by a save
+        self._count_collections()
         try:
             index_file = self.index_path / "faiss.index"
             metadata_file = self.index_path / "metadata.pkl"
             
-            faiss.write_index(self.index, str(index_file))
+            # Write the index on a pool thread (FAISS releases the GIL) while the
+            # metadata is pickled here, instead of one file after the other
+            index_write = self.executor.submit(faiss.write_index, self.index, str(index_file))
             with open(metadata_file, 'wb') as f:
                 pickle.dump(self.metadata, f)
+            index_write.result()
             print(f"✓ Saved FAISS index with {len(self.metadata)} vectors")
         except Exception as e:
             print(f"Error saving index: {e}")
     
+    def _add_vectors(self, vectors: np.ndarray):
+        """Add normalized vectors, first training the index on them if it needs it (e.g. SQ8)."""
+        if not self.index.is_trained:
+            self.index.train(vectors)
+        self.index.add(vectors)
+    
     def data_ingestion_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF files using pdfplumber."""
-        text = ""
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
-        except Exception as e:
-            raise Exception(f"Error reading PDF: {str(e)}")
+        return _extract_pdf_text(pdf_path)
     
     def data_ingestion_websites(self, url: str) -> str:
         """Extract text from websites using BeautifulSoup."""
         try:
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -118,12 +220,7 @@ class RAGService:
     
     def data_ingestion_excel(self, excel_path: str) -> str:
         """Extract text from Excel files using pandas."""
-        try:
-            df = pd.read_excel(excel_path)
-            text = df.to_string(index=False)
-            return text
-        except Exception as e:
-            raise Exception(f"Error reading Excel: {str(e)}")
+        return _extract_excel_text(excel_path)
     
     def load_data(
         self,
@@ -160,18 +257,15 @@ class RAGService:
             # Split text into chunks
             chunks = self.text_splitter.split_text(text)
             
-            # Generate embeddings
-            embeddings_list = []
-            for chunk in chunks:
-                embedding = self.embeddings.embed_query(chunk)
-                embeddings_list.append(embedding)
+            # Generate embeddings (batched into as few API requests as possible)
+            embeddings_list = self.embeddings.embed_documents(chunks)
             
             # Convert to numpy array and normalize for cosine similarity
             vectors = np.array(embeddings_list, dtype=np.float32)
             faiss.normalize_L2(vectors)  # Normalize for cosine similarity
             
             # Add to FAISS index
-            self.index.add(vectors)
+            self._add_vectors(vectors)
             
             # Store metadata
             for i, chunk in enumerate(chunks):
@@ -216,13 +310,15 @@ class RAGService:
                     tasks.append(self.async_data_ingestion_websites(url))
                     source_types.append(f"URL: {url}")
             
+            # Start the biggest files first so one large file does not end up
+            # running alone after the smaller ones have finished
             if pdf_files:
-                for pdf in pdf_files:
+                for pdf in self._largest_first(pdf_files):
                     tasks.append(self.async_data_ingestion_pdf(pdf))
                     source_types.append(f"PDF: {pdf}")
             
             if excel_files:
-                for excel in excel_files:
+                for excel in self._largest_first(excel_files):
                     tasks.append(self.async_data_ingestion_excel(excel))
                     source_types.append(f"Excel: {excel}")
             
@@ -233,7 +329,6 @@ class RAGService:
             texts = await asyncio.gather(*tasks, return_exceptions=True)
             
             all_chunks = []
-            all_embeddings = []
             successful_sources = []
             failed_sources = []
             
@@ -244,11 +339,7 @@ class RAGService:
                     continue
                 
                 chunks = self.text_splitter.split_text(text)
-                
-                # Generate embeddings for these chunks
                 for chunk in chunks:
-                    embedding = self.embeddings.embed_query(chunk)
-                    all_embeddings.append(embedding)
                     all_chunks.append({
                         "text": chunk,
                         "collection": collection_name,
@@ -261,12 +352,16 @@ class RAGService:
             if not all_chunks:
                 raise Exception("No data extracted from any source")
             
+            # Embed the chunks of every source together in batched requests,
+            # without blocking the event loop
+            all_embeddings = await self._aembed_batched([c["text"] for c in all_chunks])
+            
             # Convert to numpy array and normalize
             vectors = np.array(all_embeddings, dtype=np.float32)
             faiss.normalize_L2(vectors)
             
             # Add to FAISS index
-            self.index.add(vectors)
+            self._add_vectors(vectors)
             
             # Add metadata with chunk indices
             for i, chunk_meta in enumerate(all_chunks):
@@ -277,8 +372,8 @@ class RAGService:
                     "source": chunk_meta["source"]
                 })
             
-            # Save index
-            self._save_index()
+            # Save index off the event loop
+            await asyncio.to_thread(self._save_index)
             
             print(f"✓ Loaded {len(all_chunks)} total chunks to collection '{collection_name}'")
             
@@ -294,10 +389,42 @@ class RAGService:
         except Exception as e:
             raise Exception(f"Error loading data: {str(e)}")
     
+    async def _aembed_batched(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in embed_batch_size requests, embed_concurrency at a time, keeping order."""
+        semaphore = asyncio.Semaphore(self.embed_concurrency)
+        
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(batch)
+        
+        batches = await asyncio.gather(*(
+            embed_batch(texts[i:i + self.embed_batch_size])
+            for i in range(0, len(texts), self.embed_batch_size)
+        ))
+        return [vector for batch in batches for vector in batch]
+    
+    @staticmethod
+    def _largest_first(paths: List[str]) -> List[str]:
+        """Sort file paths by size, largest first; missing files sort last."""
+        def size(path: str) -> int:
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return -1
+        return sorted(paths, key=size, reverse=True)
+    
+    def _file_executor(self):
+        """Executor for PDF/Excel parsing: the process pool when configured, else the thread pool."""
+        if self.ingest_processes <= 0:
+            return self.executor
+        if self._process_executor is None:
+            self._process_executor = ProcessPoolExecutor(max_workers=self.ingest_processes)
+        return self._process_executor
+    
     async def async_data_ingestion_pdf(self, pdf_path: str) -> str:
         """Async PDF ingestion."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, self.data_ingestion_pdf, pdf_path)
+        return await loop.run_in_executor(self._file_executor(), _extract_pdf_text, pdf_path)
     
     async def async_data_ingestion_websites(self, url: str) -> str:
         """Async website ingestion."""
@@ -307,7 +434,7 @@ class RAGService:
     async def async_data_ingestion_excel(self, excel_path: str) -> str:
         """Async Excel ingestion."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, self.data_ingestion_excel, excel_path)
+        return await loop.run_in_executor(self._file_executor(), _extract_excel_text, excel_path)
     
     def retrieval_based_search(
         self, 
@@ -331,43 +458,101 @@ class RAGService:
                 print("Warning: Index is empty")
                 return []
             
-            # Generate query embedding
-            query_embedding = self.embeddings.embed_query(query)
-            query_vector = np.array([query_embedding], dtype=np.float32)
-            faiss.normalize_L2(query_vector)
+            query_vector = self._embed_queries([query])
+            return self._search_vectors(query_vector, collections, top_k)[0]
+        
+        except Exception as e:
+            raise Exception(f"Error performing search: {str(e)}")
+    
+    def retrieval_based_search_batch(
+        self,
+        queries: List[str],
+        collections: Optional[List[str]] = None,
+        top_k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries with one embeddings request and one FAISS search.
+        
+        Args:
+            queries: Search queries
+            collections: List of collection names to filter by (optional)
+            top_k: Number of top results to return per query
+            
+        Returns:
+            One list of search results per query, in the same order as queries
+        """
+        try:
+            if self.index.ntotal == 0:
+                print("Warning: Index is empty")
+                return [[] for _ in queries]
+            if not queries:
+                return []
             
-            # Search FAISS index (get more results for filtering)
-            search_k = min(top_k * 10, self.index.ntotal) if collections else top_k
-            distances, indices = self.index.search(query_vector, search_k)
+            query_vectors = self._embed_queries(queries)
+            return self._search_vectors(query_vectors, collections, top_k)
+        
+        except Exception as e:
+            raise Exception(f"Error performing search: {str(e)}")
+    
+    def _embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Return the normalized (n, d) embeddings of queries; uncached ones are embedded in one request."""
+        with self._query_cache_lock:
+            vectors = [self._query_cache.get(query) for query in queries]
+        
+        missing = list(dict.fromkeys(query for query, vector in zip(queries, vectors) if vector is None))
+        if missing:
+            new_vectors = np.array(self.embeddings.embed_documents(missing), dtype=np.float32)
+            faiss.normalize_L2(new_vectors)
+            embedded = dict(zip(missing, new_vectors))
+            with self._query_cache_lock:
+                self._query_cache.update(embedded)
+            vectors = [embedded[query] if vector is None else vector for query, vector in zip(queries, vectors)]
+        
+        return np.vstack(vectors)
+    
+    def _search_vectors(
+        self,
+        query_vectors: np.ndarray,
+        collections: Optional[List[str]],
+        top_k: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search the index for every row of query_vectors in one FAISS call.
+        
+        Args:
+            query_vectors: Normalized float32 query embeddings, one per row
+            collections: List of collection names to filter by (optional)
+            top_k: Number of top results to return per query
             
-            # Prepare results
+        Returns:
+            One result list per query, in the same format as retrieval_based_search
+        """
+        # Search FAISS index (get more results for filtering)
+        search_k = min(top_k * 10, self.index.ntotal) if collections else top_k
+        distances, indices = self.index.search(query_vectors, search_k)
+        
+        # Mask out empty slots (-1) and other collections' chunks for every query at once
+        keep = indices >= 0
+        if collections:
+            wanted = [self._collection_codes[c] for c in collections if c in self._collection_codes]
+            keep &= indices < len(self._chunk_codes)
+            keep &= np.isin(self._chunk_codes.take(indices, mode="clip"), wanted)
+        
+        all_results = []
+        for row_distances, row_indices, row_keep in zip(distances, indices, keep):
             results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx == -1:  # FAISS returns -1 for empty results
-                    continue
-                
-                meta = self.metadata[idx]
-                
-                # Filter by collection if specified
-                if collections and meta["collection"] not in collections:
-                    continue
-                
+            for col in np.flatnonzero(row_keep)[:top_k]:
+                meta = self.metadata[row_indices[col]]
                 results.append({
                     "text": meta["text"],
-                    "score": float(dist),  # Cosine similarity score
+                    "score": float(row_distances[col]),  # Cosine similarity score
                     "collection": meta["collection"],
                     "chunk_index": meta["chunk_index"],
                     "source": meta.get("source", "unknown")
                 })
-                
-                # Stop if we have enough results
-                if len(results) >= top_k:
-                    break
-            
-            return results
+            all_results.append(results)
         
-        except Exception as e:
-            raise Exception(f"Error performing search: {str(e)}")
+        return all_results
     
     def clear_index(self):
         """Clear the entire FAISS index and metadata."""
@@ -378,30 +563,32 @@ class RAGService:
     def delete_collection(self, collection_name: str):
         """
         Remove all vectors belonging to a specific collection.
-        Note: FAISS doesn't support efficient deletion, so we rebuild the index.
+        Note: FAISS doesn't support efficient deletion, so we rebuild the index
+        from the vectors it already stores (re-embedding only if the index type
+        cannot return them).
         """
         try:
             # Filter out metadata for this collection
-            remaining_metadata = [m for m in self.metadata if m["collection"] != collection_name]
+            keep = [i for i, m in enumerate(self.metadata) if m["collection"] != collection_name]
+            remaining_metadata = [self.metadata[i] for i in keep]
             removed_count = len(self.metadata) - len(remaining_metadata)
             
             if removed_count == 0:
                 print(f"No data found for collection '{collection_name}'")
                 return
             
+            vectors = self._stored_vectors(keep) if remaining_metadata else None
+            
             # Rebuild index with remaining data
             self._initialize_index()
             
             if remaining_metadata:
-                # Re-embed and add remaining chunks
-                vectors = []
-                for meta in remaining_metadata:
-                    embedding = self.embeddings.embed_query(meta["text"])
-                    vectors.append(embedding)
-                
-                vectors = np.array(vectors, dtype=np.float32)
+                if vectors is None:
+                    # Re-embed remaining chunks
+                    vectors = self.embeddings.embed_documents([meta["text"] for meta in remaining_metadata])
+                    vectors = np.array(vectors, dtype=np.float32)
                 faiss.normalize_L2(vectors)
-                self.index.add(vectors)
+                self._add_vectors(vectors)
             
             self.metadata = remaining_metadata
             self._save_index()
@@ -411,16 +598,28 @@ class RAGService:
         except Exception as e:
             raise Exception(f"Error deleting collection: {str(e)}")
     
+    def _stored_vectors(self, positions: List[int]) -> Optional[np.ndarray]:
+        """Return the indexed vectors at positions, or None if the index type cannot reconstruct them."""
+        try:
+            return self.index.reconstruct_n(0, self.index.ntotal)[positions]
+        except RuntimeError:
+            return None
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the current index."""
-        collections = {}
-        for meta in self.metadata:
-            coll = meta["collection"]
-            collections[coll] = collections.get(coll, 0) + 1
-        
         return {
             "total_vectors": self.index.ntotal,
             "dimension": self.dimension,
-            "collections": collections,
+            "collections": dict(self._collection_counts),
             "index_path": str(self.index_path)
-        }
\ No newline at end of file
+        }
+
+
+@functools.cache
+def get_rag_service() -> RAGService:
+    """Return the process-wide RAGService.
+    
+    Every caller shares one loaded FAISS index, embeddings client, HTTP
+    session and thread pool instead of building its own.
+    """
+    return RAGService(openai_api_key=os.getenv("OPENAI_API_KEY"), index_path="./faiss_index")
@@ -1,5 +1,6 @@
 """Main telephony agent for insurance quote collection."""
 
+import asyncio
 import logging
 import os
 from datetime import datetime
@@ -29,12 +30,14 @@ from motor.motor_asyncio import AsyncIOMotorClient
 
 # from RAGService import RAGService
 from services.insurance_service import InsuranceService
-from services.ams360 import AMS360Service
-from services.agencyzoom import AgencyZoomService
+from services.ams360 import AMS360Service, get_ams360_service
+from services.agencyzoom import AgencyZoomService, get_agencyzoom_service
 from tools.base_tools import BaseTools
 from tools.insurance_tools import InsuranceTools
+from utils.logger import setup_queued_logging
 from config import (
     AgentConfig,
+    RAGConfig,
     default_config,
     AGENT_SYSTEM_INSTRUCTIONS,
     get_greeting_prompt
@@ -49,11 +52,12 @@ logger = logging.getLogger("telephony-agent")
 
 # Load configuration
 config = AgentConfig(
-    rag=default_config.rag
+    rag=RAGConfig(
+        qdrant_url=os.getenv("QDRANT_URL", default_config.rag.qdrant_url),
+        qdrant_api_key=os.getenv("QDRANT_API_KEY", default_config.rag.qdrant_api_key),
+        openai_api_key=os.getenv("OPENAI_API_KEY", default_config.rag.openai_api_key)
+    )
 )
-config.rag.qdrant_url = os.getenv("QDRANT_URL", config.rag.qdrant_url)
-config.rag.qdrant_api_key = os.getenv("QDRANT_API_KEY", config.rag.qdrant_api_key)
-config.rag.openai_api_key = os.getenv("OPENAI_API_KEY", config.rag.openai_api_key)
 
 # Initialize RAG Service
 # rag_service = RAGService(
@@ -409,11 +413,11 @@ class TelephonyAgent(Agent):
         try:
             from formating.full_policy import extract_policy_fields, extract_customer_fields
             
-            result = self.ams360_service.get_policy_by_number(policy_number)
+            result = await asyncio.to_thread(self.ams360_service.get_policy_by_number, policy_number)
             if result:
                 try:
-                    # Unpack the three return values: policy_details, customer_data, policy_list
-                    policy_details, customer_data, policy_list = result
+                    # Unpack the three return values: policy_details, policy_list, customer_data
+                    policy_details, policy_list, customer_data = result
                     
                     # Extract policy fields using the formatting function
                     policy_info = extract_policy_fields(policy_details)
@@ -543,7 +547,7 @@ class TelephonyAgent(Agent):
             lead_data["appointment_requested"] = appointment_requested
         
         try:
-            result = self.agencyzoom_service.create_lead(lead_data)
+            result = await asyncio.to_thread(self.agencyzoom_service.create_lead, lead_data)
             if result:
                 detail_msg = f"Successfully created lead in AgencyZoom for {first_name} {last_name}. "
                 detail_msg += f"They are interested in {insurance_type} insurance."
@@ -571,7 +575,7 @@ class TelephonyAgent(Agent):
         logger.info(f"🔧 Agent tool called: search_agencyzoom_contact_by_phone({phone})")
         
         try:
-            result = self.agencyzoom_service.search_contact_by_phone(phone)
+            result = await asyncio.to_thread(self.agencyzoom_service.search_contact_by_phone, phone)
             if result and result.get('contacts'):
                 count = len(result['contacts'])
                 return f"Found {count} contact(s) in AgencyZoom with phone number {phone}."
@@ -594,7 +598,7 @@ class TelephonyAgent(Agent):
         logger.info(f"🔧 Agent tool called: search_agencyzoom_contact_by_email({email})")
         
         try:
-            result = self.agencyzoom_service.search_contact_by_email(email)
+            result = await asyncio.to_thread(self.agencyzoom_service.search_contact_by_email, email)
             if result and result.get('contacts'):
                 count = len(result['contacts'])
                 return f"Found {count} contact(s) in AgencyZoom with email {email}."
@@ -618,7 +622,7 @@ class TelephonyAgent(Agent):
         logger.info(f"🔧 Agent tool called: add_note_to_agencyzoom_contact({contact_id})")
         
         try:
-            result = self.agencyzoom_service.add_note_to_contact(contact_id, note)
+            result = await asyncio.to_thread(self.agencyzoom_service.add_note_to_contact, contact_id, note)
             if result:
                 return f"Successfully added note to contact {contact_id} in AgencyZoom."
             else:
@@ -719,10 +723,7 @@ class TelephonyAgent(Agent):
             # Extract data based on insurance type
             if insurance_type == "home":
                 full_name = insurance_data.get("primary_insured", {}).get("full_name", "")
-                if full_name:
-                    name_parts = full_name.split(" ", 1)
-                    first_name = name_parts[0]
-                    last_name = name_parts[1] if len(name_parts) > 1 else ""
+                first_name, _, last_name = full_name.partition(" ")
                 contact_info = insurance_data.get("contact", {})
                 email = contact_info.get("email", "")
                 phone = contact_info.get("phone", "")
@@ -731,29 +732,20 @@ class TelephonyAgent(Agent):
                 drivers = insurance_data.get("drivers", [])
                 if drivers:
                     full_name = drivers[0].get("full_name", "")
-                    if full_name:
-                        name_parts = full_name.split(" ", 1)
-                        first_name = name_parts[0]
-                        last_name = name_parts[1] if len(name_parts) > 1 else ""
+                    first_name, _, last_name = full_name.partition(" ")
                 contact_info = insurance_data.get("contact", {})
                 email = contact_info.get("email", "")
                 phone = contact_info.get("phone", "")
                 
             elif insurance_type == "flood":
                 full_name = insurance_data.get("full_name", "")
-                if full_name:
-                    name_parts = full_name.split(" ", 1)
-                    first_name = name_parts[0]
-                    last_name = name_parts[1] if len(name_parts) > 1 else ""
+                first_name, _, last_name = full_name.partition(" ")
                 email = insurance_data.get("email", "")
                 phone = insurance_data.get("phone", "")
                 
             elif insurance_type == "life":
                 full_name = insurance_data.get("insured", {}).get("full_name", "")
-                if full_name:
-                    name_parts = full_name.split(" ", 1)
-                    first_name = name_parts[0]
-                    last_name = name_parts[1] if len(name_parts) > 1 else ""
+                first_name, _, last_name = full_name.partition(" ")
                 contact_info = insurance_data.get("contact", {})
                 email = contact_info.get("email", "")
                 phone = contact_info.get("phone", "")
@@ -839,7 +831,7 @@ class TelephonyAgent(Agent):
                 lead_data["current_provider"] = insurance_data.get("current_policy", {}).get("current_provider", "")
             
             # Submit to AgencyZoom
-            result = self.agencyzoom_service.create_lead(lead_data)
+            result = await asyncio.to_thread(self.agencyzoom_service.create_lead, lead_data)
             
             if result:
                 logger.info(f"Successfully submitted comprehensive {insurance_type} insurance data to AgencyZoom")
@@ -870,8 +862,8 @@ async def entrypoint(ctx: JobContext):
         logger.info("No custom system_prompt found in MongoDB, using default instructions only")
     
     # Initialize all services
-    ams360_service = AMS360Service()
-    agencyzoom_service = AgencyZoomService()
+    ams360_service = get_ams360_service()
+    agencyzoom_service = get_agencyzoom_service()
     insurance_service = InsuranceService(agencyzoom_service=agencyzoom_service)
     
     # Build comprehensive instructions with knowledge base
@@ -985,24 +977,12 @@ VIN: Must be exactly 17 characters"""
 
 
 if __name__ == "__main__":
-    # Configure logging for better debugging - log to both console and file
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    # Create file handler
-    file_handler = logging.FileHandler('agent.log', mode='a', encoding='utf-8')
-    file_handler.setLevel(getattr(logging, config.log_level))
-    file_handler.setFormatter(logging.Formatter(log_format))
-    
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, config.log_level))
-    console_handler.setFormatter(logging.Formatter(log_format))
-    
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, config.log_level),
-        format=log_format,
-        handlers=[file_handler, console_handler]
+    # Configure logging for better debugging - log to both console and file.
+    # Queued, so tool-call logging never waits on console/file writes.
+    setup_queued_logging(
+        logging.FileHandler('agent.log', mode='a', encoding='utf-8'),
+        logging.StreamHandler(),
+        level=getattr(logging, config.log_level)
     )
     
     logger.info("Starting telephony agent - logs will be saved to agent.log")
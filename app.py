@@ -5,25 +5,49 @@ Combines Chatbot, SMS, and Email services
 
 import logging
 import os
-import json
+import re
+import asyncio
+import weakref
+import httpx
+import msgspec
+import numpy as np
+import orjson
 from datetime import datetime
-from typing import Dict, Optional, List
+from operator import attrgetter
+from typing import Callable, Dict, Optional, List, Set, Tuple, Union
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-import openai
+from cachetools import LRUCache
+from openai import AsyncOpenAI
 from outboundService.services.call_service import make_outbound_call
 import tempfile
 import shutil
 
 from outboundService.common.update_config import update_config_async
-from models.model import OutboundCallRequest, StatusResponse
+from models.messaging import OutboundCallRequest, StatusResponse
+from models.tool_args import (
+    SetUserActionArgs,
+    HomeInsuranceArgs,
+    AutoInsuranceArgs,
+    FloodInsuranceArgs,
+    LifeInsuranceArgs,
+    CommercialInsuranceArgs,
+    PolicyNumberArgs,
+    CreateLeadArgs,
+    KnowledgeBaseSearchArgs,
+    decode_tool_arguments
+)
 from services.insurance_service import InsuranceService
-from services.ams360 import AMS360Service
-from services.agencyzoom import AgencyZoomService
-from config import AGENT_SYSTEM_INSTRUCTIONS, CHATBOT_SYSTEM_INSTRUCTIONS, get_knowledge_base
-from RAGService import RAGService
+from services.ams360 import get_ams360_service
+from services.agencyzoom import get_agencyzoom_service
+from services.conversation_store import ConversationStore, trim_messages
+from services.semantic_cache import SemanticCache
+from config import AGENT_SYSTEM_INSTRUCTIONS, CHATBOT_SYSTEM_INSTRUCTIONS
+from RAGService import get_rag_service
+from utils.logger import setup_queued_logging
 
 # Import routers
 from routers import sms, email
@@ -31,15 +55,11 @@ from routers import sms, email
 load_dotenv()
 logger = logging.getLogger("unified-api")
 
-# Load Knowledge Base for chatbot
-KNOWLEDGE_BASE = get_knowledge_base()
-logger.info("Inshora Knowledge Base loaded successfully for chatbot")
+# The Inshora knowledge base is embedded in CHATBOT_SYSTEM_INSTRUCTIONS once, when config is imported
+logger.info(f"Inshora Knowledge Base loaded for chatbot ({len(CHATBOT_SYSTEM_INSTRUCTIONS)} characters of system prompt)")
 
 # Initialize RAG Service
-rag_service = RAGService(
-    openai_api_key=os.getenv("OPENAI_API_KEY"),
-    index_path="./faiss_index"
-)
+rag_service = get_rag_service()
 logger.info("RAG Service initialized successfully")
 
 
@@ -99,21 +119,19 @@ def validate_phone_number(phone: str) -> bool:
     return True
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('api.log', mode='a', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+# Configure logging (queued so file/console writes happen off the event loop)
+setup_queued_logging(
+    logging.FileHandler('api.log', mode='a', encoding='utf-8'),
+    logging.StreamHandler(),
+    level=logging.INFO
 )
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Unified Insurance API",
     version="1.0.0",
-    description="Comprehensive API for Insurance Chatbot, SMS, and Email services"
+    description="Comprehensive API for Insurance Chatbot, SMS, and Email services",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -129,21 +147,61 @@ app.add_middleware(
 app.include_router(sms.router)
 app.include_router(email.router)
 
-# Initialize OpenAI
-openai.api_key = os.getenv("OPENAI_API_KEY")
+# Initialize OpenAI (one shared async client). The HTTP/2 transport multiplexes
+# concurrent chat turns over a few long-lived TLS connections.
+openai_http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=120),
+    timeout=httpx.Timeout(60.0, connect=5.0)
+)
+openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=openai_http_client)
+
+# Conversation storage (thread_id -> messages list), capped per thread with a TTL.
+# Uses Redis when REDIS_URL is set so history is shared across workers.
+conversation_store = ConversationStore()
 
-# In-memory conversation storage (thread_id -> messages list)
-# In production, you'd use a database like PostgreSQL, MongoDB, or Redis
-conversation_threads: Dict[str, List[Dict]] = {}
+# Optional semantic cache of replies to paraphrased questions (SEMANTIC_CACHE_ENABLED)
+semantic_cache = SemanticCache(openai_client)
+
+# Per-thread state below stays process-local; each map is an LRU bounded to the
+# same number of threads as the local conversation cache, so idle threads are evicted.
+MAX_THREAD_STATE = int(os.getenv("CONVERSATION_MAX_LOCAL_THREADS", "1024"))
 
 # Store service instances per thread (for maintaining session state)
-thread_services: Dict[str, Dict] = {}
+thread_services: LRUCache = LRUCache(maxsize=MAX_THREAD_STATE)
 
 # Store detailed policy information per thread (for on-demand retrieval)
-thread_policy_details: Dict[str, Dict] = {}
+thread_policy_details: LRUCache = LRUCache(maxsize=MAX_THREAD_STATE)
+
+# Escalation (handover) state lives in conversation_store so every worker sees it
+
+
+# Optional path of a prebuilt OpenAPI document. When the file exists it is served
+# as-is; otherwise the schema is generated once at startup and written there.
+OPENAPI_STATIC_PATH = os.getenv("OPENAPI_STATIC_PATH")
 
-# Store escalation state per thread (for tracking handover status)
-thread_escalation_state: Dict[str, Dict] = {}
+
+@app.on_event("startup")
+async def freeze_openapi_schema():
+    """Build (or load) the OpenAPI schema once at startup instead of on the first /docs request."""
+    if OPENAPI_STATIC_PATH and os.path.exists(OPENAPI_STATIC_PATH):
+        with open(OPENAPI_STATIC_PATH, "rb") as f:
+            app.openapi_schema = orjson.loads(f.read())
+        logger.info(f"Loaded static OpenAPI schema from {OPENAPI_STATIC_PATH}")
+        return
+
+    schema = app.openapi()
+    if OPENAPI_STATIC_PATH:
+        with open(OPENAPI_STATIC_PATH, "wb") as f:
+            f.write(orjson.dumps(schema))
+        logger.info(f"Wrote OpenAPI schema to {OPENAPI_STATIC_PATH}")
+
+
+@app.on_event("shutdown")
+async def close_conversation_store():
+    """Close the conversation store and OpenAI connections on shutdown."""
+    await conversation_store.close()
+    await openai_client.close()
 
 
 # ===========================
@@ -177,9 +235,10 @@ class ChatResponse(BaseModel):
 def get_or_create_thread_services(thread_id: str) -> Dict:
     """Get or create service instances for a thread."""
     if thread_id not in thread_services:
-        # Initialize services for this thread
-        ams360_service = AMS360Service()
-        agencyzoom_service = AgencyZoomService()
+        # AMS360/AgencyZoom clients are shared process-wide; only the
+        # InsuranceService (collected data for this conversation) is per thread
+        ams360_service = get_ams360_service()
+        agencyzoom_service = get_agencyzoom_service()
         insurance_service = InsuranceService(agencyzoom_service=agencyzoom_service)
         
         thread_services[thread_id] = {
@@ -192,7 +251,20 @@ def get_or_create_thread_services(thread_id: str) -> Dict:
     return thread_services[thread_id]
 
 
-def get_or_create_thread(thread_id: str, custom_prompt: Optional[str] = None) -> List[Dict]:
+# The first system message is always exactly CHATBOT_SYSTEM_INSTRUCTIONS so that the
+# request prefix (tools + system prompt) is byte-identical for every thread and turn,
+# which lets OpenAI's automatic prompt caching reuse it. Per-thread custom instructions
+# go in a separate system message after it. Never interpolate thread ids/timestamps here.
+BASE_SYSTEM_MESSAGE = {"role": "system", "content": CHATBOT_SYSTEM_INSTRUCTIONS}
+CUSTOM_INSTRUCTIONS_HEADER = f"{'='*50}\nADDITIONAL INSTRUCTIONS:\n{'='*50}\n"
+
+
+def _has_custom_instructions(messages: List[Dict]) -> bool:
+    """Return True if the thread carries a custom-instructions system message."""
+    return len(messages) > 1 and messages[1]["role"] == "system"
+
+
+async def get_or_create_thread(thread_id: str, custom_prompt: Optional[str] = None) -> List[Dict]:
     """
     Get or create a conversation thread.
     
@@ -202,643 +274,1256 @@ def get_or_create_thread(thread_id: str, custom_prompt: Optional[str] = None) ->
                       If provided, it will be added after the default instructions.
     
     Returns:
-        List of conversation messages for the thread
+        List of conversation messages for the thread. Changes are not persisted
+        until they are passed to conversation_store.save().
     """
-    # Build the system prompt - append custom prompt to default instructions
+    custom_message = None
     if custom_prompt is not None and custom_prompt.strip():
-        system_prompt = f"{CHATBOT_SYSTEM_INSTRUCTIONS}\n\n{'='*50}\nADDITIONAL INSTRUCTIONS:\n{'='*50}\n{custom_prompt}"
-    else:
-        system_prompt = CHATBOT_SYSTEM_INSTRUCTIONS
-    
-    if thread_id not in conversation_threads:
-        # Initialize with system message
-        conversation_threads[thread_id] = [
-            {
-                "role": "system",
-                "content": system_prompt
-            }
-        ]
+        custom_message = {
+            "role": "system",
+            "content": f"{CUSTOM_INSTRUCTIONS_HEADER}{custom_prompt}"
+        }
+    
+    messages = await conversation_store.get(thread_id)
+    if messages is None:
+        # Initialize with the shared system message (+ custom instructions if any)
+        messages = [dict(BASE_SYSTEM_MESSAGE)]
+        if custom_message:
+            messages.append(custom_message)
         prompt_type = "with custom instructions appended" if custom_prompt else "default instructions"
         logger.info(f"Created new conversation thread {prompt_type}: {thread_id}")
     else:
-        # Thread exists - update system message if custom prompt is provided
+        # Thread exists - update custom instructions if a custom prompt is provided
         if custom_prompt is not None:
-            conversation_threads[thread_id][0] = {
-                "role": "system",
-                "content": system_prompt
-            }
+            if custom_message:
+                if _has_custom_instructions(messages):
+                    messages[1] = custom_message
+                else:
+                    messages.insert(1, custom_message)
+            elif _has_custom_instructions(messages):
+                del messages[1]
             logger.info(f"Updated system prompt with custom instructions for thread: {thread_id}")
     
-    return conversation_threads[thread_id]
+    return messages
+
+
+# Older turns are folded into one summary note so each request re-sends a bounded
+# amount of history. The note sits after the system messages, keeping the cached
+# tools + system prompt prefix intact.
+HISTORY_SUMMARY_TRIGGER = int(os.getenv("HISTORY_SUMMARY_TRIGGER", "24"))
+HISTORY_SUMMARY_KEEP = int(os.getenv("HISTORY_SUMMARY_KEEP", "16"))
+HISTORY_SUMMARY_HEADER = "Summary of the earlier conversation:\n"
+HISTORY_SUMMARY_PROMPT = (
+    "Summarize this insurance chatbot conversation for the assistant that continues it. "
+    "Keep every detail the user provided (names, dates, contact info, addresses, vehicles, "
+    "policy numbers), the insurance type and action, what was already submitted, and any "
+    "open questions. Be concise and factual."
+)
 
 
-def get_available_tools() -> List[Dict]:
-    """Define available function tools for the chatbot."""
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "set_user_action",
-                "description": "Set the user action type (add/update) and insurance type.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "action_type": {
-                            "type": "string",
-                            "enum": ["add", "update"],
-                            "description": "Either 'add' for new insurance or 'update' for existing policy"
-                        },
-                        "insurance_type": {
-                            "type": "string",
-                            "enum": ["home", "auto", "flood", "life", "commercial"],
-                            "description": "Type of insurance"
-                        }
+def _format_for_summary(message: Dict) -> str:
+    """Render one history message as a transcript line for the summarizer."""
+    if message["role"] == "tool":
+        return f"tool {message.get('name', '')}: {message['content']}"
+    if message.get("tool_calls"):
+        calls = ", ".join(tc["function"]["name"] for tc in message["tool_calls"])
+        return f"assistant (called {calls}): {message['content']}"
+    return f"{message['role']}: {message['content']}"
+
+
+async def summarize_old_history(messages: List[Dict]) -> List[Dict]:
+    """
+    Replace older turns with a single summary note once the history gets long.
+    
+    Keeps the system messages and the last HISTORY_SUMMARY_KEEP messages (starting
+    at a user message); everything in between, including an earlier summary, is
+    condensed by a cheap model call. On failure the history is returned unchanged.
+    
+    Args:
+        messages: Full conversation history
+    
+    Returns:
+        The (possibly) shortened conversation history
+    """
+    prefix_len = 0
+    while prefix_len < len(messages) and messages[prefix_len]["role"] == "system":
+        prefix_len += 1
+    
+    if len(messages) - prefix_len <= HISTORY_SUMMARY_TRIGGER:
+        return messages
+    
+    kept = trim_messages(messages, HISTORY_SUMMARY_KEEP)[prefix_len:]
+    old = messages[prefix_len:len(messages) - len(kept)]
+    if not old:
+        return messages
+    
+    try:
+        response = await openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": HISTORY_SUMMARY_PROMPT},
+                {"role": "user", "content": "\n".join(_format_for_summary(m) for m in old)}
+            ],
+            temperature=0.2,
+            max_tokens=400
+        )
+        summary = response.choices[0].message.content or ""
+    except Exception as e:
+        logger.warning(f"Could not summarize conversation history: {e}")
+        return messages
+    
+    logger.info(f"Summarized {len(old)} older message(s) into one note")
+    return messages[:prefix_len] + [
+        {"role": "assistant", "content": f"{HISTORY_SUMMARY_HEADER}{summary}"}
+    ] + kept
+
+
+# Tool schemas are constant, so build them once at import time instead of per turn.
+_TOOLS_SCHEMA = [
+    {
+        "type": "function",
+        "function": {
+            "name": "set_user_action",
+            "description": "Set the user action type (add/update) and insurance type.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "action_type": {
+                        "type": "string",
+                        "enum": ["add", "update"],
+                        "description": "Either 'add' for new insurance or 'update' for existing policy"
                     },
-                    "required": ["action_type", "insurance_type"]
-                }
+                    "insurance_type": {
+                        "type": "string",
+                        "enum": ["home", "auto", "flood", "life", "commercial"],
+                        "description": "Type of insurance"
+                    }
+                },
+                "required": ["action_type", "insurance_type"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "collect_home_insurance_data",
-                "description": "Collect home insurance information from the user.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "full_name": {"type": "string", "description": "Full name of primary insured"},
-                        "date_of_birth": {"type": "string", "description": "Date of birth (YYYY-MM-DD format)"},
-                        "property_address": {"type": "string", "description": "Property address"},
-                        "phone": {"type": "string", "description": "Phone number"},
-                        "email": {"type": "string", "description": "Email address"},
-                        "spouse_name": {"type": "string", "description": "Spouse name (optional)"},
-                        "spouse_dob": {"type": "string", "description": "Spouse date of birth (YYYY-MM-DD format, optional)"},
-                        "has_solar_panels": {"type": "boolean", "description": "Whether property has solar panels"},
-                        "has_pool": {"type": "boolean", "description": "Whether property has a pool"},
-                        "roof_age": {"type": "integer", "description": "Age of roof in years"},
-                        "has_pets": {"type": "boolean", "description": "Whether household has pets"},
-                        "current_provider": {"type": "string", "description": "Current insurance provider (optional)"},
-                        "renewal_date": {"type": "string", "description": "Current policy renewal date (YYYY-MM-DD format, optional)"},
-                        "renewal_premium": {"type": "number", "description": "Current renewal premium amount (optional)"}
-                    },
-                    "required": ["full_name", "date_of_birth", "property_address", "phone", "email"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "collect_home_insurance_data",
+            "description": "Collect home insurance information from the user.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "full_name": {"type": "string", "description": "Full name of primary insured"},
+                    "date_of_birth": {"type": "string", "description": "Date of birth (YYYY-MM-DD format)"},
+                    "property_address": {"type": "string", "description": "Property address"},
+                    "phone": {"type": "string", "description": "Phone number"},
+                    "email": {"type": "string", "description": "Email address"},
+                    "spouse_name": {"type": "string", "description": "Spouse name (optional)"},
+                    "spouse_dob": {"type": "string", "description": "Spouse date of birth (YYYY-MM-DD format, optional)"},
+                    "has_solar_panels": {"type": "boolean", "description": "Whether property has solar panels"},
+                    "has_pool": {"type": "boolean", "description": "Whether property has a pool"},
+                    "roof_age": {"type": "integer", "description": "Age of roof in years"},
+                    "has_pets": {"type": "boolean", "description": "Whether household has pets"},
+                    "current_provider": {"type": "string", "description": "Current insurance provider (optional)"},
+                    "renewal_date": {"type": "string", "description": "Current policy renewal date (YYYY-MM-DD format, optional)"},
+                    "renewal_premium": {"type": "number", "description": "Current renewal premium amount (optional)"}
+                },
+                "required": ["full_name", "date_of_birth", "property_address", "phone", "email"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "collect_auto_insurance_data",
-                "description": "Collect auto insurance information from the user.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "driver_name": {"type": "string", "description": "Full name of driver"},
-                        "driver_dob": {"type": "string", "description": "Driver date of birth (YYYY-MM-DD format)"},
-                        "license_number": {"type": "string", "description": "Driver's license number"},
-                        "qualification": {"type": "string", "description": "Driver qualification"},
-                        "profession": {"type": "string", "description": "Driver profession"},
-                        "vin": {"type": "string", "description": "Vehicle VIN (17 characters)"},
-                        "vehicle_make": {"type": "string", "description": "Vehicle make"},
-                        "vehicle_model": {"type": "string", "description": "Vehicle model"},
-                        "phone": {"type": "string", "description": "Phone number"},
-                        "email": {"type": "string", "description": "Email address"},
-                        "gpa": {"type": "number", "description": "GPA if driver under 21 (optional)"},
-                        "coverage_type": {"type": "string", "description": "Coverage type - 'liability' or 'full'"},
-                        "current_provider": {"type": "string", "description": "Current insurance provider (optional)"},
-                        "renewal_date": {"type": "string", "description": "Current policy renewal date (YYYY-MM-DD format, optional)"},
-                        "renewal_premium": {"type": "number", "description": "Current renewal premium amount (optional)"}
-                    },
-                    "required": ["driver_name", "driver_dob", "license_number", "qualification", "profession", "vin", "vehicle_make", "vehicle_model", "phone", "email"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "collect_auto_insurance_data",
+            "description": "Collect auto insurance information from the user.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "driver_name": {"type": "string", "description": "Full name of driver"},
+                    "driver_dob": {"type": "string", "description": "Driver date of birth (YYYY-MM-DD format)"},
+                    "license_number": {"type": "string", "description": "Driver's license number"},
+                    "qualification": {"type": "string", "description": "Driver qualification"},
+                    "profession": {"type": "string", "description": "Driver profession"},
+                    "vin": {"type": "string", "description": "Vehicle VIN (17 characters)"},
+                    "vehicle_make": {"type": "string", "description": "Vehicle make"},
+                    "vehicle_model": {"type": "string", "description": "Vehicle model"},
+                    "phone": {"type": "string", "description": "Phone number"},
+                    "email": {"type": "string", "description": "Email address"},
+                    "gpa": {"type": "number", "description": "GPA if driver under 21 (optional)"},
+                    "coverage_type": {"type": "string", "description": "Coverage type - 'liability' or 'full'"},
+                    "current_provider": {"type": "string", "description": "Current insurance provider (optional)"},
+                    "renewal_date": {"type": "string", "description": "Current policy renewal date (YYYY-MM-DD format, optional)"},
+                    "renewal_premium": {"type": "number", "description": "Current renewal premium amount (optional)"}
+                },
+                "required": ["driver_name", "driver_dob", "license_number", "qualification", "profession", "vin", "vehicle_make", "vehicle_model", "phone", "email"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "collect_flood_insurance_data",
-                "description": "Collect flood insurance information from the user.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "full_name": {"type": "string", "description": "Full name of insured"},
-                        "home_address": {"type": "string", "description": "Home address for flood insurance"},
-                        "email": {"type": "string", "description": "Email address"}
-                    },
-                    "required": ["full_name", "home_address", "email"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "collect_flood_insurance_data",
+            "description": "Collect flood insurance information from the user.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "full_name": {"type": "string", "description": "Full name of insured"},
+                    "home_address": {"type": "string", "description": "Home address for flood insurance"},
+                    "email": {"type": "string", "description": "Email address"}
+                },
+                "required": ["full_name", "home_address", "email"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "collect_life_insurance_data",
-                "description": "Collect life insurance information from the user.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "full_name": {"type": "string", "description": "Full name of insured"},
-                        "date_of_birth": {"type": "string", "description": "Date of birth (YYYY-MM-DD format)"},
-                        "appointment_requested": {"type": "boolean", "description": "Whether customer wants an appointment"},
-                        "phone": {"type": "string", "description": "Phone number"},
-                        "email": {"type": "string", "description": "Email address"},
-                        "appointment_date": {"type": "string", "description": "Requested appointment date and time (YYYY-MM-DD HH:MM format, optional)"},
-                        "policy_type": {"type": "string", "description": "Type of policy - 'term', 'whole', 'universal', 'annuity', or 'long_term_care' (optional)"}
-                    },
-                    "required": ["full_name", "date_of_birth", "appointment_requested", "phone", "email"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "collect_life_insurance_data",
+            "description": "Collect life insurance information from the user.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "full_name": {"type": "string", "description": "Full name of insured"},
+                    "date_of_birth": {"type": "string", "description": "Date of birth (YYYY-MM-DD format)"},
+                    "appointment_requested": {"type": "boolean", "description": "Whether customer wants an appointment"},
+                    "phone": {"type": "string", "description": "Phone number"},
+                    "email": {"type": "string", "description": "Email address"},
+                    "appointment_date": {"type": "string", "description": "Requested appointment date and time (YYYY-MM-DD HH:MM format, optional)"},
+                    "policy_type": {"type": "string", "description": "Type of policy - 'term', 'whole', 'universal', 'annuity', or 'long_term_care' (optional)"}
+                },
+                "required": ["full_name", "date_of_birth", "appointment_requested", "phone", "email"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "collect_commercial_insurance_data",
-                "description": "Collect commercial insurance information from the user.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "business_name": {"type": "string", "description": "Name of the business"},
-                        "business_type": {"type": "string", "description": "Type of business"},
-                        "business_address": {"type": "string", "description": "Business address"},
-                        "phone": {"type": "string", "description": "Phone number"},
-                        "email": {"type": "string", "description": "Email address"},
-                        "inventory_limit": {"type": "number", "description": "Inventory coverage limit (optional)"},
-                        "building_coverage": {"type": "boolean", "description": "Whether building coverage is needed"},
-                        "building_coverage_limit": {"type": "number", "description": "Building coverage limit (optional)"},
-                        "current_provider": {"type": "string", "description": "Current insurance provider (optional)"},
-                        "renewal_date": {"type": "string", "description": "Current policy renewal date (YYYY-MM-DD format, optional)"},
-                        "renewal_premium": {"type": "number", "description": "Current renewal premium amount (optional)"}
-                    },
-                    "required": ["business_name", "business_type", "business_address", "phone", "email"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "collect_commercial_insurance_data",
+            "description": "Collect commercial insurance information from the user.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "business_name": {"type": "string", "description": "Name of the business"},
+                    "business_type": {"type": "string", "description": "Type of business"},
+                    "business_address": {"type": "string", "description": "Business address"},
+                    "phone": {"type": "string", "description": "Phone number"},
+                    "email": {"type": "string", "description": "Email address"},
+                    "inventory_limit": {"type": "number", "description": "Inventory coverage limit (optional)"},
+                    "building_coverage": {"type": "boolean", "description": "Whether building coverage is needed"},
+                    "building_coverage_limit": {"type": "number", "description": "Building coverage limit (optional)"},
+                    "current_provider": {"type": "string", "description": "Current insurance provider (optional)"},
+                    "renewal_date": {"type": "string", "description": "Current policy renewal date (YYYY-MM-DD format, optional)"},
+                    "renewal_premium": {"type": "number", "description": "Current renewal premium amount (optional)"}
+                },
+                "required": ["business_name", "business_type", "business_address", "phone", "email"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "submit_quote_request",
-                "description": "Submit the collected insurance quote request.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {}
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "submit_quote_request",
+            "description": "Submit the collected insurance quote request.",
+            "parameters": {
+                "type": "object",
+                "properties": {}
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "get_policy_by_number",
-                "description": "Get policy information or lookup for existing policy by policy number from AMS360. Returns basic/major information.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "policy_number": {"type": "string", "description": "The policy number to search for"}
-                    },
-                    "required": ["policy_number"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_policy_by_number",
+            "description": "Get policy information or lookup for existing policy by policy number from AMS360. Returns basic/major information.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "policy_number": {"type": "string", "description": "The policy number to search for"}
+                },
+                "required": ["policy_number"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "get_detailed_policy_info",
-                "description": "Get additional detailed information about a previously looked up policy (transactions, customer contact details, etc.).",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "policy_number": {"type": "string", "description": "The policy number to get details for"}
-                    },
-                    "required": ["policy_number"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_detailed_policy_info",
+            "description": "Get additional detailed information about a previously looked up policy (transactions, customer contact details, etc.).",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "policy_number": {"type": "string", "description": "The policy number to get details for"}
+                },
+                "required": ["policy_number"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "create_agencyzoom_lead",
-                "description": "Create a new lead in AgencyZoom with detailed information.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "first_name": {"type": "string"},
-                        "last_name": {"type": "string"},
-                        "email": {"type": "string"},
-                        "phone": {"type": "string"},
-                        "insurance_type": {"type": "string"},
-                        "notes": {"type": "string"},
-                        "address": {"type": "string"},
-                        "date_of_birth": {"type": "string"},
-                        "current_provider": {"type": "string"},
-                        "vehicle_info": {"type": "string"},
-                        "property_info": {"type": "string"},
-                        "business_name": {"type": "string"},
-                        "appointment_requested": {"type": "boolean"}
-                    },
-                    "required": ["first_name", "last_name", "email", "phone", "insurance_type"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "create_agencyzoom_lead",
+            "description": "Create a new lead in AgencyZoom with detailed information.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "first_name": {"type": "string"},
+                    "last_name": {"type": "string"},
+                    "email": {"type": "string"},
+                    "phone": {"type": "string"},
+                    "insurance_type": {"type": "string"},
+                    "notes": {"type": "string"},
+                    "address": {"type": "string"},
+                    "date_of_birth": {"type": "string"},
+                    "current_provider": {"type": "string"},
+                    "vehicle_info": {"type": "string"},
+                    "property_info": {"type": "string"},
+                    "business_name": {"type": "string"},
+                    "appointment_requested": {"type": "boolean"}
+                },
+                "required": ["first_name", "last_name", "email", "phone", "insurance_type"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "submit_collected_data_to_agencyzoom",
-                "description": "Submit all collected insurance data to AgencyZoom as a comprehensive lead.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {}
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "submit_collected_data_to_agencyzoom",
+            "description": "Submit all collected insurance data to AgencyZoom as a comprehensive lead.",
+            "parameters": {
+                "type": "object",
+                "properties": {}
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "search_knowledge_base",
-                "description": "**MANDATORY FIRST STEP**: Search the Inshora knowledge base before answering ANY user question. You MUST call this tool for every query, even if the question seems unrelated to insurance. This ensures accurate, up-to-date information. Always search with collections=['inshora']. Only provide answers AFTER searching.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The user's question or search query. Pass the exact question they asked."
-                        },
-                        "collections": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "REQUIRED: Must be ['inshora'] to search the Inshora knowledge base."
-                        },
-                        "top_k": {
-                            "type": "integer",
-                            "description": "Number of results to return (default: 5)"
-                        }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "search_knowledge_base",
+            "description": "**MANDATORY FIRST STEP**: Search the Inshora knowledge base before answering ANY user question. You MUST call this tool for every query, even if the question seems unrelated to insurance. This ensures accurate, up-to-date information. Always search with collections=['inshora']. Only provide answers AFTER searching.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "The user's question or search query. Pass the exact question they asked."
                     },
-                    "required": ["query", "collections"]
-                }
+                    "collections": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "REQUIRED: Must be ['inshora'] to search the Inshora knowledge base."
+                    },
+                    "top_k": {
+                        "type": "integer",
+                        "description": "Number of results to return (default: 5)"
+                    }
+                },
+                "required": ["query", "collections"]
             }
         }
-    ]
+    }
+]
 
 
-def execute_function_call(function_name: str, arguments: Dict, thread_id: str) -> str:
-    """Execute a function call and return the result."""
-    services = get_or_create_thread_services(thread_id)
+def get_available_tools() -> List[Dict]:
+    """Return the available function tools for the chatbot (the shared import-time list; do not mutate)."""
+    return _TOOLS_SCHEMA
+
+
+# Insurance Service Functions
+async def _handle_set_user_action(args: SetUserActionArgs, services: Dict, thread_id: str) -> str:
+    """Handle the set_user_action tool call."""
     insurance_service = services["insurance"]
+    return insurance_service.set_user_action(
+        args.action_type,
+        args.insurance_type
+    )
+
+
+async def _handle_collect_home_insurance_data(args: HomeInsuranceArgs, services: Dict, thread_id: str) -> str:
+    """Handle the collect_home_insurance_data tool call."""
+    insurance_service = services["insurance"]
+    return insurance_service.collect_home_insurance(
+        full_name=args.full_name,
+        date_of_birth=args.date_of_birth,
+        spouse_name=args.spouse_name,
+        spouse_dob=args.spouse_dob,
+        property_address=args.property_address,
+        has_solar_panels=args.has_solar_panels,
+        has_pool=args.has_pool,
+        roof_age=args.roof_age,
+        has_pets=args.has_pets,
+        current_provider=args.current_provider,
+        renewal_date=args.renewal_date,
+        renewal_premium=args.renewal_premium,
+        phone=args.phone,
+        email=args.email
+    )
+
+
+async def _handle_collect_auto_insurance_data(args: AutoInsuranceArgs, services: Dict, thread_id: str) -> str:
+    """Handle the collect_auto_insurance_data tool call."""
+    insurance_service = services["insurance"]
+    return insurance_service.collect_auto_insurance(
+        driver_name=args.driver_name,
+        driver_dob=args.driver_dob,
+        license_number=args.license_number,
+        qualification=args.qualification,
+        profession=args.profession,
+        gpa=args.gpa,
+        vin=args.vin,
+        vehicle_make=args.vehicle_make,
+        vehicle_model=args.vehicle_model,
+        coverage_type=args.coverage_type,
+        current_provider=args.current_provider,
+        renewal_date=args.renewal_date,
+        renewal_premium=args.renewal_premium,
+        phone=args.phone,
+        email=args.email
+    )
+
+
+async def _handle_collect_flood_insurance_data(args: FloodInsuranceArgs, services: Dict, thread_id: str) -> str:
+    """Handle the collect_flood_insurance_data tool call."""
+    insurance_service = services["insurance"]
+    return insurance_service.collect_flood_insurance(
+        args.full_name,
+        args.home_address,
+        args.email
+    )
+
+
+async def _handle_collect_life_insurance_data(args: LifeInsuranceArgs, services: Dict, thread_id: str) -> str:
+    """Handle the collect_life_insurance_data tool call."""
+    insurance_service = services["insurance"]
+    return insurance_service.collect_life_insurance(
+        full_name=args.full_name,
+        date_of_birth=args.date_of_birth,
+        appointment_requested=args.appointment_requested,
+        appointment_date=args.appointment_date,
+        phone=args.phone,
+        email=args.email,
+        policy_type=args.policy_type
+    )
+
+
+async def _handle_collect_commercial_insurance_data(args: CommercialInsuranceArgs, services: Dict, thread_id: str) -> str:
+    """Handle the collect_commercial_insurance_data tool call."""
+    insurance_service = services["insurance"]
+    return insurance_service.collect_commercial_insurance(
+        business_name=args.business_name,
+        business_type=args.business_type,
+        business_address=args.business_address,
+        inventory_limit=args.inventory_limit,
+        building_coverage=args.building_coverage,
+        building_coverage_limit=args.building_coverage_limit,
+        current_provider=args.current_provider,
+        renewal_date=args.renewal_date,
+        renewal_premium=args.renewal_premium,
+        phone=args.phone,
+        email=args.email
+    )
+
+
+async def _handle_submit_quote_request(arguments: Dict, services: Dict, thread_id: str) -> str:
+    """Handle the submit_quote_request tool call."""
+    insurance_service = services["insurance"]
+    return insurance_service.submit_quote_request()
+
+
+# AMS360 Functions
+
+async def _handle_get_policy_by_number(args: PolicyNumberArgs, services: Dict, thread_id: str) -> str:
+    """Handle the get_policy_by_number tool call."""
     ams360_service = services["ams360"]
-    agencyzoom_service = services["agencyzoom"]
-    
-    logger.info(f"🔧 Executing function: {function_name} with args: {arguments}")
+    from formating.full_policy import extract_policy_fields, extract_customer_fields
     
-    try:
-        # Insurance Service Functions
-        if function_name == "set_user_action":
-            return insurance_service.set_user_action(
-                arguments.get("action_type"),
-                arguments.get("insurance_type")
-            )
-        
-        elif function_name == "collect_home_insurance_data":
-            return insurance_service.collect_home_insurance(
-                full_name=arguments.get("full_name"),
-                date_of_birth=arguments.get("date_of_birth"),
-                spouse_name=arguments.get("spouse_name"),
-                spouse_dob=arguments.get("spouse_dob"),
-                property_address=arguments.get("property_address"),
-                has_solar_panels=arguments.get("has_solar_panels", False),
-                has_pool=arguments.get("has_pool", False),
-                roof_age=arguments.get("roof_age", 0),
-                has_pets=arguments.get("has_pets", False),
-                current_provider=arguments.get("current_provider"),
-                renewal_date=arguments.get("renewal_date"),
-                renewal_premium=arguments.get("renewal_premium"),
-                phone=arguments.get("phone"),
-                email=arguments.get("email")
-            )
-        
-        elif function_name == "collect_auto_insurance_data":
-            return insurance_service.collect_auto_insurance(
-                driver_name=arguments.get("driver_name"),
-                driver_dob=arguments.get("driver_dob"),
-                license_number=arguments.get("license_number"),
-                qualification=arguments.get("qualification"),
-                profession=arguments.get("profession"),
-                gpa=arguments.get("gpa"),
-                vin=arguments.get("vin"),
-                vehicle_make=arguments.get("vehicle_make"),
-                vehicle_model=arguments.get("vehicle_model"),
-                coverage_type=arguments.get("coverage_type", "full"),
-                current_provider=arguments.get("current_provider"),
-                renewal_date=arguments.get("renewal_date"),
-                renewal_premium=arguments.get("renewal_premium"),
-                phone=arguments.get("phone"),
-                email=arguments.get("email")
-            )
-        
-        elif function_name == "collect_flood_insurance_data":
-            return insurance_service.collect_flood_insurance(
-                arguments.get("full_name"),
-                arguments.get("home_address"),
-                arguments.get("email")
-            )
-        
-        elif function_name == "collect_life_insurance_data":
-            return insurance_service.collect_life_insurance(
-                full_name=arguments.get("full_name"),
-                date_of_birth=arguments.get("date_of_birth"),
-                appointment_requested=arguments.get("appointment_requested"),
-                appointment_date=arguments.get("appointment_date"),
-                phone=arguments.get("phone"),
-                email=arguments.get("email"),
-                policy_type=arguments.get("policy_type")
-            )
-        
-        elif function_name == "collect_commercial_insurance_data":
-            return insurance_service.collect_commercial_insurance(
-                business_name=arguments.get("business_name"),
-                business_type=arguments.get("business_type"),
-                business_address=arguments.get("business_address"),
-                inventory_limit=arguments.get("inventory_limit"),
-                building_coverage=arguments.get("building_coverage", False),
-                building_coverage_limit=arguments.get("building_coverage_limit"),
-                current_provider=arguments.get("current_provider"),
-                renewal_date=arguments.get("renewal_date"),
-                renewal_premium=arguments.get("renewal_premium"),
-                phone=arguments.get("phone"),
-                email=arguments.get("email")
-            )
-        
-        elif function_name == "submit_quote_request":
-            return insurance_service.submit_quote_request()
-        
-        # AMS360 Functions
-        elif function_name == "get_policy_by_number":
-            from formating.full_policy import extract_policy_fields, extract_customer_fields
+    result, customer_data, policy_id = await asyncio.to_thread(
+        ams360_service.get_policy_by_number,
+        args.policy_number
+    ) or (None, None, None)
+    if result:
+        try:
+            # Extract policy fields using the formatting function
+            policy_info = extract_policy_fields(result)
             
-            result, customer_data, policy_id = ams360_service.get_policy_by_number(arguments.get("policy_number"))
-            if result:
+            # Format dates nicely
+            def format_date(date_str):
+                if date_str and 'T' in str(date_str):
+                    return date_str.split('T')[0]
+                return date_str or 'N/A'
+            
+            # Store full details for later retrieval
+            if thread_id not in thread_policy_details:
+                thread_policy_details[thread_id] = {}
+            
+            thread_policy_details[thread_id][args.policy_number] = {
+                "policy_info": policy_info,
+                "customer_info": policy_id,
+                "format_date": format_date
+            }
+            
+            # Extract customer info if available
+            customer_name = "N/A"
+            if customer_data:
                 try:
-                    # Extract policy fields using the formatting function
-                    policy_info = extract_policy_fields(result)
-                    
-                    # Format dates nicely
-                    def format_date(date_str):
-                        if date_str and 'T' in str(date_str):
-                            return date_str.split('T')[0]
-                        return date_str or 'N/A'
-                    
-                    # Store full details for later retrieval
-                    if thread_id not in thread_policy_details:
-                        thread_policy_details[thread_id] = {}
-                    
-                    thread_policy_details[thread_id][arguments.get("policy_number")] = {
-                        "policy_info": policy_info,
-                        "customer_info": policy_id,
-                        "format_date": format_date
-                    }
-                    
-                    # Extract customer info if available
-                    customer_name = "N/A"
-                    if customer_data:
-                        try:
-                            customer_info = extract_customer_fields(policy_id)
-                            customer_name = f"{customer_info.get('FirstName', '')} {customer_info.get('LastName', '')}".strip()
-                        except Exception as e:
-                            logger.warning(f"Could not extract customer name: {e}")
-                    
-                    # Build simplified message with ONLY major/essential information
-                    message = f"✓ Found Policy in AMS360:\n\n"
-                    message += f"📋 Policy Number: {policy_info.get('PolicyNumber', 'N/A')}\n"
-                    message += f"👤 Customer: {customer_name}\n"
-                    message += f"💼 Policy Type: {policy_info.get('PolicyTypeOfBusiness', 'N/A')}\n"
-                    message += f"📅 Effective: {format_date(policy_info.get('EffectiveDate'))}\n"
-                    message += f"📅 Expires: {format_date(policy_info.get('ExpirationDate'))}\n"
-                    message += f"💰 Premium: ${policy_info.get('FullTermPremium', 'N/A')}\n"
-                    message += f"\n💡 Ask me if you need more details (transactions, contact info, etc.)"
-                    
-                    return message
-                    
+                    customer_info = extract_customer_fields(policy_id)
+                    customer_name = f"{customer_info.get('FirstName', '')} {customer_info.get('LastName', '')}".strip()
                 except Exception as e:
-                    logger.warning(f"Error formatting policy details: {e}")
-                    return f"Found policy information in AMS360 for policy number {arguments.get('policy_number')}."
-            else:
-                return f"❌ No policy found in AMS360 with policy number {arguments.get('policy_number')}."
-        
-        elif function_name == "get_detailed_policy_info":
-            policy_number = arguments.get("policy_number")
+                    logger.warning(f"Could not extract customer name: {e}")
             
-            # Check if we have stored details for this policy
-            if thread_id not in thread_policy_details or policy_number not in thread_policy_details[thread_id]:
-                return f"No cached details found for policy {policy_number}. Please look up the policy first using get_policy_by_number."
+            # Build simplified message with ONLY major/essential information
+            message = f"✓ Found Policy in AMS360:\n\n"
+            message += f"📋 Policy Number: {policy_info.get('PolicyNumber', 'N/A')}\n"
+            message += f"👤 Customer: {customer_name}\n"
+            message += f"💼 Policy Type: {policy_info.get('PolicyTypeOfBusiness', 'N/A')}\n"
+            message += f"📅 Effective: {format_date(policy_info.get('EffectiveDate'))}\n"
+            message += f"📅 Expires: {format_date(policy_info.get('ExpirationDate'))}\n"
+            message += f"💰 Premium: ${policy_info.get('FullTermPremium', 'N/A')}\n"
+            message += f"\n💡 Ask me if you need more details (transactions, contact info, etc.)"
             
-            stored_data = thread_policy_details[thread_id][policy_number]
-            policy_info = stored_data["policy_info"]
-            customer_data = stored_data["customer_data"]
-            format_date = stored_data["format_date"]
+            return message
             
-            from formating.full_policy import extract_customer_fields
+        except Exception as e:
+            logger.warning(f"Error formatting policy details: {e}")
+            return f"Found policy information in AMS360 for policy number {args.policy_number}."
+    else:
+        return f"❌ No policy found in AMS360 with policy number {args.policy_number}."
+
+
+async def _handle_get_detailed_policy_info(args: PolicyNumberArgs, services: Dict, thread_id: str) -> str:
+    """Handle the get_detailed_policy_info tool call."""
+    policy_number = args.policy_number
+    
+    # Check if we have stored details for this policy
+    if thread_id not in thread_policy_details or policy_number not in thread_policy_details[thread_id]:
+        return f"No cached details found for policy {policy_number}. Please look up the policy first using get_policy_by_number."
+    
+    stored_data = thread_policy_details[thread_id][policy_number]
+    policy_info = stored_data["policy_info"]
+    customer_data = stored_data["customer_data"]
+    format_date = stored_data["format_date"]
+    
+    from formating.full_policy import extract_customer_fields
+    
+    # Build detailed message
+    message = f"📋 Detailed Information for Policy {policy_number}:\n\n"
+    
+    # Additional policy details
+    message += f"━━━━━━━━━━━━━━━━━━━━━━\n"
+    message += f"📊 POLICY DETAILS:\n"
+    message += f"   Line of Business: {policy_info.get('LineDescription', 'N/A')}\n"
+    message += f"   Bill Method: {policy_info.get('BillMethod', 'N/A')}\n"
+    message += f"   Status: {policy_info.get('PolicyStatus', 'N/A')}\n"
+    
+    # Latest transaction info if available
+    if policy_info.get('LatestTransactionType'):
+        message += f"\n📝 LATEST TRANSACTION:\n"
+        message += f"   Type: {policy_info.get('LatestTransactionType', 'N/A')}\n"
+        message += f"   Date: {format_date(policy_info.get('LatestTransactionDate'))}\n"
+        message += f"   Premium: ${policy_info.get('LatestPremium', 'N/A')}\n"
+    
+    # Customer contact info if available
+    if customer_data:
+        try:
+            customer_info = extract_customer_fields(customer_data)
+            message += f"\n👤 CUSTOMER CONTACT INFO:\n"
+            message += f"   Name: {customer_info.get('FirstName', '')} {customer_info.get('LastName', '')}\n"
+            message += f"   Customer ID: {customer_info.get('CustomerId', 'N/A')}\n"
             
-            # Build detailed message
-            message = f"📋 Detailed Information for Policy {policy_number}:\n\n"
+            # Add contact info if available
+            if customer_info.get('Email'):
+                message += f"   Email: {customer_info.get('Email')}\n"
+            if customer_info.get('CellPhone'):
+                message += f"   Phone: {customer_info.get('CellAreaCode', '')}{customer_info.get('CellPhone', '')}\n"
+            if customer_info.get('City') and customer_info.get('State'):
+                message += f"   Location: {customer_info.get('City')}, {customer_info.get('State')}\n"
+        except Exception as e:
+            logger.warning(f"Could not extract customer details: {e}")
+    
+    return message
+
+
+async def _handle_get_ams360_customer_policies(arguments: Dict, services: Dict, thread_id: str) -> str:
+    """Handle the get_ams360_customer_policies tool call."""
+    ams360_service = services["ams360"]
+    
+    customer_id = arguments.get("customer_id")
+    
+    # Streamed straight into flat policy summaries keyed by POLICY_INFO_FIELDS
+    policy_list = await asyncio.to_thread(ams360_service.get_customer_policy_list, customer_id)
+    if policy_list is not None:
+        try:
+            if not policy_list:
+                return f"No policies found for customer {customer_id} in AMS360."
             
-            # Additional policy details
-            message += f"━━━━━━━━━━━━━━━━━━━━━━\n"
-            message += f"📊 POLICY DETAILS:\n"
-            message += f"   Line of Business: {policy_info.get('LineDescription', 'N/A')}\n"
-            message += f"   Bill Method: {policy_info.get('BillMethod', 'N/A')}\n"
-            message += f"   Status: {policy_info.get('PolicyStatus', 'N/A')}\n"
+            # Format dates nicely
+            def format_date(date_str):
+                if date_str and 'T' in str(date_str):
+                    return date_str.split('T')[0]
+                return date_str or 'N/A'
             
-            # Latest transaction info if available
-            if policy_info.get('LatestTransactionType'):
-                message += f"\n📝 LATEST TRANSACTION:\n"
-                message += f"   Type: {policy_info.get('LatestTransactionType', 'N/A')}\n"
-                message += f"   Date: {format_date(policy_info.get('LatestTransactionDate'))}\n"
-                message += f"   Premium: ${policy_info.get('LatestPremium', 'N/A')}\n"
+            # Build user-friendly message
+            message = f"✓ Found {len(policy_list)} Policy(ies) for Customer ID: {customer_id}\n\n"
             
-            # Customer contact info if available
-            if customer_data:
-                try:
-                    customer_info = extract_customer_fields(customer_data)
-                    message += f"\n👤 CUSTOMER CONTACT INFO:\n"
-                    message += f"   Name: {customer_info.get('FirstName', '')} {customer_info.get('LastName', '')}\n"
-                    message += f"   Customer ID: {customer_info.get('CustomerId', 'N/A')}\n"
-                    
-                    # Add contact info if available
-                    if customer_info.get('Email'):
-                        message += f"   Email: {customer_info.get('Email')}\n"
-                    if customer_info.get('CellPhone'):
-                        message += f"   Phone: {customer_info.get('CellAreaCode', '')}{customer_info.get('CellPhone', '')}\n"
-                    if customer_info.get('City') and customer_info.get('State'):
-                        message += f"   Location: {customer_info.get('City')}, {customer_info.get('State')}\n"
-                except Exception as e:
-                    logger.warning(f"Could not extract customer details: {e}")
+            for idx, policy in enumerate(policy_list, 1):
+                message += f"━━━━━━━━━━━━━━━━━━━━━━\n"
+                message += f"Policy #{idx}:\n"
+                message += f"📋 Policy Number: {policy.get('PolicyNumber', 'N/A')}\n"
+                message += f"💼 Type: {policy.get('PolicyTypeOfBusiness', 'N/A')}\n"
+                message += f"📊 Status: {policy.get('PolicyStatus', 'N/A')}\n"
+                message += f"📅 Effective: {format_date(policy.get('PolicyEffectiveDate'))}\n"
+                message += f"📅 Expiration: {format_date(policy.get('PolicyExpirationDate'))}\n"
+                message += f"🏢 Company: {policy.get('WritingCompanyCode', 'N/A')}\n"
+                message += "\n"
             
             return message
-        
-        elif function_name == "get_ams360_customer_policies":
-            from formating.full_policy import extract_policy_list
             
-            result = ams360_service.get_customer_policies(arguments.get("customer_id"))
-            if result:
-                try:
-                    # Extract policy list using the formatting function
-                    policy_list = extract_policy_list(result)
-                    
-                    if not policy_list:
-                        return f"No policies found for customer {arguments.get('customer_id')} in AMS360."
-                    
-                    # Format dates nicely
-                    def format_date(date_str):
-                        if date_str and 'T' in str(date_str):
-                            return date_str.split('T')[0]
-                        return date_str or 'N/A'
-                    
-                    # Build user-friendly message
-                    message = f"✓ Found {len(policy_list)} Policy(ies) for Customer ID: {arguments.get('customer_id')}\n\n"
-                    
-                    for idx, policy in enumerate(policy_list, 1):
-                        message += f"━━━━━━━━━━━━━━━━━━━━━━\n"
-                        message += f"Policy #{idx}:\n"
-                        message += f"📋 Policy Number: {policy.get('PolicyNumber', 'N/A')}\n"
-                        message += f"💼 Type: {policy.get('PolicyTypeOfBusiness', 'N/A')}\n"
-                        message += f"📊 Status: {policy.get('PolicyStatus', 'N/A')}\n"
-                        message += f"📅 Effective: {format_date(policy.get('PolicyEffectiveDate'))}\n"
-                        message += f"📅 Expiration: {format_date(policy.get('PolicyExpirationDate'))}\n"
-                        message += f"🏢 Company: {policy.get('WritingCompanyCode', 'N/A')}\n"
-                        message += "\n"
-                    
-                    return message
-                    
-                except Exception as e:
-                    logger.warning(f"Error formatting policy list: {e}")
-                    return f"Retrieved policies for customer {arguments.get('customer_id')} from AMS360 successfully."
-            else:
-                return f"❌ No policies found for customer {arguments.get('customer_id')} in AMS360."
+        except Exception as e:
+            logger.warning(f"Error formatting policy list: {e}")
+            return f"Retrieved policies for customer {customer_id} from AMS360 successfully."
+    else:
+        return f"❌ No policies found for customer {customer_id} in AMS360."
+
+
+# AgencyZoom Functions
+
+# Optional create_agencyzoom_lead fields, read from the args struct in one C-level call
+_LEAD_OPTIONAL_FIELDS = ("address", "date_of_birth", "current_provider", "vehicle_info",
+                         "property_info", "business_name", "appointment_requested")
+_get_lead_optional_fields = attrgetter(*_LEAD_OPTIONAL_FIELDS)
+
+
+async def _handle_create_agencyzoom_lead(args: CreateLeadArgs, services: Dict, thread_id: str) -> str:
+    """Handle the create_agencyzoom_lead tool call."""
+    agencyzoom_service = services["agencyzoom"]
+    lead_data = {
+        "first_name": args.first_name,
+        "last_name": args.last_name,
+        "email": args.email,
+        "phone": args.phone,
+        "insurance_type": args.insurance_type,
+        "notes": args.notes,
+        "source": "AI Chatbot"
+    }
+    
+    # Add optional fields
+    for field, value in zip(_LEAD_OPTIONAL_FIELDS, _get_lead_optional_fields(args)):
+        if value:
+            lead_data[field] = value
+    
+    result = await asyncio.to_thread(agencyzoom_service.create_lead, lead_data)
+    if result:
+        return f"Successfully created lead in AgencyZoom for {args.first_name} {args.last_name}."
+    else:
+        return "Failed to create lead in AgencyZoom. Please check the logs for details."
+
+
+async def _handle_search_agencyzoom_contact_by_phone(arguments: Dict, services: Dict, thread_id: str) -> str:
+    """Handle the search_agencyzoom_contact_by_phone tool call."""
+    agencyzoom_service = services["agencyzoom"]
+    phone = arguments.get("phone")
+    result = await asyncio.to_thread(agencyzoom_service.search_contact_by_phone, phone)
+    if result and result.get('contacts'):
+        count = len(result['contacts'])
+        return f"Found {count} contact(s) in AgencyZoom with phone number {phone}."
+    else:
+        return f"No contact found in AgencyZoom with phone number {phone}."
+
+
+async def _handle_search_agencyzoom_contact_by_email(arguments: Dict, services: Dict, thread_id: str) -> str:
+    """Handle the search_agencyzoom_contact_by_email tool call."""
+    agencyzoom_service = services["agencyzoom"]
+    email = arguments.get("email")
+    result = await asyncio.to_thread(agencyzoom_service.search_contact_by_email, email)
+    if result and result.get('contacts'):
+        count = len(result['contacts'])
+        return f"Found {count} contact(s) in AgencyZoom with email {email}."
+    else:
+        return f"No contact found in AgencyZoom with email {email}."
+
+
+async def _handle_submit_collected_data_to_agencyzoom(arguments: Dict, services: Dict, thread_id: str) -> str:
+    """Handle the submit_collected_data_to_agencyzoom tool call."""
+    insurance_service = services["insurance"]
+    agencyzoom_service = services["agencyzoom"]
+    if not insurance_service.insurance_type:
+        return "No insurance data has been collected yet. Please collect insurance information first."
+    
+    insurance_type = insurance_service.insurance_type
+    insurance_key = f"{insurance_type}_insurance"
+    
+    if insurance_key not in insurance_service.collected_data:
+        return f"No {insurance_type} insurance data found. Please collect the information first."
+    
+    insurance_data = insurance_service.collected_data[insurance_key]
+    
+    # Extract basic info
+    full_name = insurance_data.get("full_name", "")
+    first_name, _, last_name = full_name.partition(" ")
+    
+    lead_data = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": insurance_data.get("email", "noemail@pending.com"),
+        "phone": insurance_data.get("phone", ""),
+        "insurance_type": insurance_type,
+        "source": "AI Chatbot",
+        "notes": f"Lead collected via AI chatbot. Thread ID: {thread_id}",
+        "insurance_details": insurance_data
+    }
+    
+    result = await asyncio.to_thread(agencyzoom_service.create_lead, lead_data)
+    if result:
+        return f"Excellent! I've successfully submitted all your {insurance_type} insurance information to AgencyZoom. Our team will follow up with you shortly!"
+    else:
+        return "Failed to submit data to AgencyZoom. The information is saved and can be submitted manually."
+
+
+# RAG Service Functions
+async def _handle_search_knowledge_base(args: KnowledgeBaseSearchArgs, services: Dict, thread_id: str) -> str:
+    """Handle the search_knowledge_base tool call."""
+    query = args.query
+    collections = args.collections
+    top_k = args.top_k
+    
+    logger.info(f"🔍 Searching knowledge base - Query: '{query}', Collections: {collections}")
+    
+    try:
+        results = await asyncio.to_thread(
+            rag_service.retrieval_based_search,
+            query=query,
+            collections=collections,
+            top_k=top_k
+        )
         
-        # AgencyZoom Functions
-        elif function_name == "create_agencyzoom_lead":
-            lead_data = {
-                "first_name": arguments.get("first_name"),
-                "last_name": arguments.get("last_name"),
-                "email": arguments.get("email"),
-                "phone": arguments.get("phone"),
-                "insurance_type": arguments.get("insurance_type"),
-                "notes": arguments.get("notes", ""),
-                "source": "AI Chatbot"
-            }
-            
-            # Add optional fields
-            optional_fields = ["address", "date_of_birth", "current_provider", "vehicle_info", 
-                             "property_info", "business_name", "appointment_requested"]
-            for field in optional_fields:
-                if arguments.get(field):
-                    lead_data[field] = arguments.get(field)
-            
-            result = agencyzoom_service.create_lead(lead_data)
-            if result:
-                return f"Successfully created lead in AgencyZoom for {arguments.get('first_name')} {arguments.get('last_name')}."
-            else:
-                return "Failed to create lead in AgencyZoom. Please check the logs for details."
+        if not results:
+            logger.info(f"No results found for query: '{query}'")
+            return f"I searched the knowledge base for '{query}' but didn't find any relevant information. I'll provide a general response based on my training."
         
-        elif function_name == "search_agencyzoom_contact_by_phone":
-            result = agencyzoom_service.search_contact_by_phone(arguments.get("phone"))
-            if result and result.get('contacts'):
-                count = len(result['contacts'])
-                return f"Found {count} contact(s) in AgencyZoom with phone number {arguments.get('phone')}."
-            else:
-                return f"No contact found in AgencyZoom with phone number {arguments.get('phone')}."
+        # Format results for the chatbot
+        logger.info(f"Found {len(results)} results for query: '{query}'")
+        message = f"📚 Knowledge Base Results (found {len(results)} relevant document(s)):\n\n"
         
-        elif function_name == "search_agencyzoom_contact_by_email":
-            result = agencyzoom_service.search_contact_by_email(arguments.get("email"))
-            if result and result.get('contacts'):
-                count = len(result['contacts'])
-                return f"Found {count} contact(s) in AgencyZoom with email {arguments.get('email')}."
-            else:
-                return f"No contact found in AgencyZoom with email {arguments.get('email')}."
+        for i, result in enumerate(results, 1):
+            message += f"━━━━━━━━━━━━━━━━━━━━━━\n"
+            message += f"Result #{i} (Relevance: {result['score']:.3f}):\n"
+            message += f"Collection: {result['collection']}\n"
+            message += f"Source: {result['source']}\n"
+            message += f"\nContent:\n{result['text'][:500]}{'...' if len(result['text']) > 500 else ''}\n\n"
         
-        elif function_name == "submit_collected_data_to_agencyzoom":
-            if not insurance_service.insurance_type:
-                return "No insurance data has been collected yet. Please collect insurance information first."
-            
-            insurance_type = insurance_service.insurance_type
-            insurance_key = f"{insurance_type}_insurance"
-            
-            if insurance_key not in insurance_service.collected_data:
-                return f"No {insurance_type} insurance data found. Please collect the information first."
-            
-            insurance_data = insurance_service.collected_data[insurance_key]
-            
-            # Extract basic info
-            full_name = insurance_data.get("full_name", "")
-            name_parts = full_name.split(" ", 1)
-            first_name = name_parts[0] if name_parts else "Unknown"
-            last_name = name_parts[1] if len(name_parts) > 1 else ""
-            
-            lead_data = {
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": insurance_data.get("email", "noemail@pending.com"),
-                "phone": insurance_data.get("phone", ""),
-                "insurance_type": insurance_type,
-                "source": "AI Chatbot",
-                "notes": f"Lead collected via AI chatbot. Thread ID: {thread_id}",
-                "insurance_details": insurance_data
-            }
-            
-            result = agencyzoom_service.create_lead(lead_data)
-            if result:
-                return f"Excellent! I've successfully submitted all your {insurance_type} insurance information to AgencyZoom. Our team will follow up with you shortly!"
-            else:
-                return "Failed to submit data to AgencyZoom. The information is saved and can be submitted manually."
+        message += "\n💡 Use the above information to answer the user's question accurately."
         
-        # RAG Service Functions
-        elif function_name == "search_knowledge_base":
-            query = arguments.get("query")
-            collections = arguments.get("collections", ["inshora"])  # Default to inshora
-            top_k = arguments.get("top_k", 5)
-            
-            logger.info(f"🔍 Searching knowledge base - Query: '{query}', Collections: {collections}")
-            
-            try:
-                results = rag_service.retrieval_based_search(
-                    query=query,
-                    collections=collections,
-                    top_k=top_k
-                )
-                
-                if not results:
-                    logger.info(f"No results found for query: '{query}'")
-                    return f"I searched the knowledge base for '{query}' but didn't find any relevant information. I'll provide a general response based on my training."
-                
-                # Format results for the chatbot
-                logger.info(f"Found {len(results)} results for query: '{query}'")
-                message = f"📚 Knowledge Base Results (found {len(results)} relevant document(s)):\n\n"
-                
-                for i, result in enumerate(results, 1):
-                    message += f"━━━━━━━━━━━━━━━━━━━━━━\n"
-                    message += f"Result #{i} (Relevance: {result['score']:.3f}):\n"
-                    message += f"Collection: {result['collection']}\n"
-                    message += f"Source: {result['source']}\n"
-                    message += f"\nContent:\n{result['text'][:500]}{'...' if len(result['text']) > 500 else ''}\n\n"
-                
-                message += "\n💡 Use the above information to answer the user's question accurately."
-                
-                return message
-                
-            except Exception as e:
-                logger.error(f"Error searching knowledge base: {e}", exc_info=True)
-                return f"Error searching knowledge base: {str(e)}. Proceeding with general knowledge."
+        return message
         
-        else:
-            return f"Unknown function: {function_name}"
+    except Exception as e:
+        logger.error(f"Error searching knowledge base: {e}", exc_info=True)
+        return f"Error searching knowledge base: {str(e)}. Proceeding with general knowledge."
+
+
+# Tool name -> handler. Each handler takes (arguments, services, thread_id) and returns the tool result text.
+_DISPATCH = {
+    "set_user_action": _handle_set_user_action,
+    "collect_home_insurance_data": _handle_collect_home_insurance_data,
+    "collect_auto_insurance_data": _handle_collect_auto_insurance_data,
+    "collect_flood_insurance_data": _handle_collect_flood_insurance_data,
+    "collect_life_insurance_data": _handle_collect_life_insurance_data,
+    "collect_commercial_insurance_data": _handle_collect_commercial_insurance_data,
+    "submit_quote_request": _handle_submit_quote_request,
+    "get_policy_by_number": _handle_get_policy_by_number,
+    "get_detailed_policy_info": _handle_get_detailed_policy_info,
+    "get_ams360_customer_policies": _handle_get_ams360_customer_policies,
+    "create_agencyzoom_lead": _handle_create_agencyzoom_lead,
+    "search_agencyzoom_contact_by_phone": _handle_search_agencyzoom_contact_by_phone,
+    "search_agencyzoom_contact_by_email": _handle_search_agencyzoom_contact_by_email,
+    "submit_collected_data_to_agencyzoom": _handle_submit_collected_data_to_agencyzoom,
+    "search_knowledge_base": _handle_search_knowledge_base,
+}
+
+
+async def execute_function_call(function_name: str, arguments: Union[Dict, msgspec.Struct], thread_id: str) -> str:
+    """Execute a function call and return the result.
     
+    arguments is the output of decode_tool_arguments: a typed struct for tools
+    registered in models.tool_args.TOOL_ARG_STRUCTS, otherwise a plain dict.
+    """
+    services = get_or_create_thread_services(thread_id)
+    
+    logger.info(f"🔧 Executing function: {function_name} with args: {arguments}")
+    
+    handler = _DISPATCH.get(function_name)
+    if handler is None:
+        return f"Unknown function: {function_name}"
+    
+    try:
+        return await handler(arguments, services, thread_id)
     except Exception as e:
         logger.error(f"Error executing function {function_name}: {e}", exc_info=True)
         return f"Error executing {function_name}: {str(e)}"
 
 
+# Trivial turns answered locally without an OpenAI round trip. Only unambiguous
+# messages are matched; anything that could be an answer to a question (yes/no,
+# numbers) still goes to the model.
+_GREETING_RE = re.compile(r"^(hi|hello|hey|hiya|good (morning|afternoon|evening))( there)?[\s!.,]*$", re.IGNORECASE)
+_THANKS_RE = re.compile(r"^(thanks|thank you|thx|ty)( (so|very) much)?[\s!.,]*$", re.IGNORECASE)
+_RESET_RE = re.compile(r"^(clear( chat)?|reset( chat)?|start over|new chat)[\s!.]*$", re.IGNORECASE)
+
+GREETING_REPLY = "Hello! I'm the AI insurance assistant from Inshora Group. Are you looking to add new insurance or look up an existing policy?"
+THANKS_REPLY = "You're welcome! Is there anything else I can help you with today?"
+RESET_REPLY = "Sure, let's start fresh. How can I help you with your insurance today?"
+
+
+def get_trivial_reply(query: str) -> Optional[str]:
+    """Return a canned reply for a greeting/thanks/reset message, or None to use the LLM."""
+    text = query.strip()
+    if len(text) > 40:
+        return None
+    if _GREETING_RE.match(text):
+        return GREETING_REPLY
+    if _THANKS_RE.match(text):
+        return THANKS_REPLY
+    if _RESET_RE.match(text):
+        return RESET_REPLY
+    return None
+
+
 # ===========================
 # CHATBOT ENDPOINTS
 # ===========================
 
-@app.post("/chat", response_model=ChatResponse, tags=["Chatbot"])
+CHAT_MODEL = "gpt-4o-mini"
+
+# Every chat completion (streaming or not) sends the same model, tools and
+# sampling settings, so the tools + system prompt prefix is byte-identical
+# across endpoints. The cache key routes these requests to the same prompt
+# cache on OpenAI's side.
+CHAT_PROMPT_CACHE_KEY = os.getenv("CHAT_PROMPT_CACHE_KEY", "inshora-chatbot")
+_CHAT_COMPLETION_OPTIONS = {
+    "model": CHAT_MODEL,
+    "tools": _TOOLS_SCHEMA,
+    "tool_choice": "auto",
+    "temperature": 0.7,
+    "extra_body": {"prompt_cache_key": CHAT_PROMPT_CACHE_KEY}
+}
+ESCALATED_REPLY = "This conversation has been escalated to a human agent. Please wait for a human representative to assist you. If you'd like to continue with the AI assistant, please indicate so."
+
+
+async def _reset_escalation_if_requested(request: ChatRequest) -> bool:
+    """Clear the thread's escalation state when requested. Returns True if it was reset."""
+    if request.reset_escalation and await conversation_store.clear_escalation(request.thread_id):
+        logger.info(f"Escalation state reset for thread: {request.thread_id}")
+        return True
+    return False
+
+
+async def _escalated_payload(request: ChatRequest) -> Optional[Dict]:
+    """Return the handover response body if the thread is still escalated, else None."""
+    if request.reset_escalation:
+        return None
+    current_escalation_state = await conversation_store.get_escalation(request.thread_id) or {}
+    if not current_escalation_state.get("active", False):
+        return None
+    
+    logger.info(f"Thread {request.thread_id} is in escalated state - human handover required")
+    return {
+        "response": ESCALATED_REPLY,
+        "thread_id": request.thread_id,
+        "timestamp": datetime.now(),
+        "requires_handover": True,
+        "handover_reason": current_escalation_state.get("reason", "Previously escalated"),
+        "escalation_active": True,
+        "escalation_reset": False
+    }
+
+
+async def _answer_trivial_turn(request: ChatRequest) -> Optional[str]:
+    """
+    Answer greeting/thanks/reset turns locally and record them in the thread.
+    
+    Skipped with custom instructions, which may change the assistant's persona
+    or required wording. Returns None when the turn needs the LLM.
+    """
+    trivial_reply = None if request.prompt else get_trivial_reply(request.query)
+    if trivial_reply is None:
+        return None
+    
+    if trivial_reply == RESET_REPLY:
+        await conversation_store.delete(request.thread_id)
+        thread_services.pop(request.thread_id, None)
+        thread_policy_details.pop(request.thread_id, None)
+        logger.info(f"Thread {request.thread_id} reset by user")
+    else:
+        messages = await get_or_create_thread(request.thread_id)
+        messages.append({"role": "user", "content": request.query})
+        messages.append({"role": "assistant", "content": trivial_reply})
+        await conversation_store.save(request.thread_id, messages)
+    
+    logger.info(f"Answered trivial turn locally - Thread: {request.thread_id}")
+    return trivial_reply
+
+
+async def _prepare_turn_messages(request: ChatRequest) -> List[Dict]:
+    """Load the thread, append the user's message and fold old turns into a summary."""
+    # Get or create conversation thread with custom prompt if provided
+    messages = await get_or_create_thread(request.thread_id, custom_prompt=request.prompt)
+    
+    # Log if custom prompt is being used
+    if request.prompt:
+        logger.info(f"Custom instructions appended to system prompt for thread: {request.thread_id}")
+    
+    # Add user message to conversation history
+    messages.append({
+        "role": "user",
+        "content": request.query
+    })
+    
+    # Fold older turns into a summary so the request size stays bounded
+    return await summarize_old_history(messages)
+
+
+async def run_tool_call(function_name: str, raw_arguments: str, thread_id: str) -> str:
+    """Decode a tool call's raw JSON arguments and execute it, returning the tool result text."""
+    try:
+        function_args = decode_tool_arguments(function_name, raw_arguments)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        # Report bad arguments back to the model so it can correct the call
+        logger.warning(f"Invalid arguments for {function_name}: {e}")
+        return f"Invalid arguments for {function_name}: {e}. Please ask the user for the missing information and try again."
+    
+    return await execute_function_call(function_name, function_args, thread_id)
+
+
+def _canonical_arguments(raw_arguments: str) -> str:
+    """Normalize a tool call's JSON arguments so key order and whitespace don't matter."""
+    try:
+        return orjson.dumps(orjson.loads(raw_arguments or "{}"), option=orjson.OPT_SORT_KEYS).decode()
+    except orjson.JSONDecodeError:
+        return raw_arguments
+
+
+async def run_tool_calls(calls: List[Tuple[str, str]], thread_id: str) -> List[str]:
+    """
+    Execute one model turn's tool calls concurrently, returning results in call order.
+    
+    Identical calls (same name and arguments) within the turn share a single
+    execution. Handlers that don't await (the InsuranceService collectors) still
+    run to completion in call order, so their state updates are not reordered.
+    
+    Args:
+        calls: (function_name, raw JSON arguments) for each tool call
+        thread_id: Conversation thread the calls belong to
+    
+    Returns:
+        The tool result text for each call
+    """
+    unique: Dict[Tuple[str, str], int] = {}
+    unique_calls: List[Tuple[str, str]] = []
+    positions = []
+    for function_name, raw_arguments in calls:
+        key = (function_name, _canonical_arguments(raw_arguments))
+        if key not in unique:
+            unique[key] = len(unique_calls)
+            unique_calls.append((function_name, raw_arguments))
+        positions.append(unique[key])
+    
+    if len(unique_calls) < len(calls):
+        logger.info(f"Collapsed {len(calls)} tool calls into {len(unique_calls)} unique call(s)")
+    
+    results = await asyncio.gather(
+        *(run_tool_call(function_name, raw_arguments, thread_id) for function_name, raw_arguments in unique_calls)
+    )
+    return [results[position] for position in positions]
+
+
+async def _evaluate_escalation(request: ChatRequest, reply: str) -> Tuple[bool, Optional[str]]:
+    """
+    Ask the model whether the request's escalation condition is met by the latest exchange.
+    
+    Records the escalation state for the thread when it is. Returns
+    (requires_handover, handover_reason); failures are logged and treated as not met.
+    """
+    if not request.escalation_condition:
+        return False, None
+    
+    logger.info(f"Checking escalation condition: {request.escalation_condition}")
+    try:
+        # Use OpenAI to evaluate if the escalation condition is met
+        escalation_check = await openai_client.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"""You are an escalation evaluator. Analyze the conversation and determine if the following escalation condition is met:
+
+Escalation Condition: {request.escalation_condition}
+
+Respond with ONLY a JSON object in this exact format:
+{{"requires_handover": true/false, "reason": "brief explanation"}}
+
+If the condition is met, set requires_handover to true and provide a reason.
+If not met, set requires_handover to false."""
+                },
+                {
+                    "role": "user",
+                    "content": f"Latest user message: {request.query}\n\nLatest assistant response: {reply}"
+                }
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        )
+        
+        escalation_result = orjson.loads(escalation_check.choices[0].message.content)
+        requires_handover = escalation_result.get("requires_handover", False)
+        handover_reason = escalation_result.get("reason")
+        
+        if requires_handover:
+            logger.info(f"Escalation triggered - Reason: {handover_reason}")
+            # Store escalation state for this thread
+            await conversation_store.set_escalation(request.thread_id, {
+                "active": True,
+                "reason": handover_reason,
+                "timestamp": datetime.now().isoformat()
+            })
+        else:
+            logger.info("Escalation condition not met, continuing conversation")
+        
+        return requires_handover, handover_reason
+    
+    except Exception as e:
+        logger.error(f"Error checking escalation condition: {e}", exc_info=True)
+        # Continue without escalation if check fails
+        return False, None
+
+
+# Replies are only cached when the turn called nothing but read-only knowledge
+# base searches; lookups and data-collection tools depend on per-user state.
+_SEMANTIC_CACHEABLE_TOOLS = frozenset({"search_knowledge_base"})
+SEMANTIC_CONTEXT_MESSAGES = 4
+
+
+def _semantic_context_hash(messages: List[Dict]) -> int:
+    """Hash the custom instructions and the last few turns before the current query."""
+    custom = messages[1]["content"] if _has_custom_instructions(messages) else ""
+    recent = tuple(
+        m["content"] for m in messages[:-1][-SEMANTIC_CONTEXT_MESSAGES:]
+        if m["role"] in ("user", "assistant")
+    )
+    return hash((custom, recent))
+
+
+async def _lookup_semantic_cache(query: str, messages: List[Dict]) -> Tuple[Optional[np.ndarray], int, Optional[str]]:
+    """
+    Embed the query and look for a cached reply in the same conversation context.
+    
+    Returns (embedding, context_hash, cached_reply). The embedding is None if
+    it could not be computed, in which case the turn is neither served from nor
+    stored in the cache.
+    """
+    try:
+        embedding = await semantic_cache.embed(query)
+    except Exception as e:
+        logger.warning(f"Could not embed query for semantic cache: {e}")
+        return None, 0, None
+    
+    context_hash = _semantic_context_hash(messages)
+    return embedding, context_hash, semantic_cache.lookup(embedding, context_hash)
+
+
+def _chat_payload(request: ChatRequest, reply: str, requires_handover: bool,
+                  handover_reason: Optional[str], escalation_reset: bool) -> Dict:
+    """
+    Build the ChatResponse body for a completed turn.
+    
+    Turns only reach the model when the thread was not escalated (or was just
+    reset), so the thread is escalated exactly when this turn triggered a handover.
+    """
+    return {
+        "response": reply,
+        "thread_id": request.thread_id,
+        "timestamp": datetime.now(),
+        "requires_handover": requires_handover,
+        "handover_reason": handover_reason,
+        "escalation_active": requires_handover,
+        "escalation_reset": escalation_reset
+    }
+
+
+async def _complete_turn(messages: List[Dict], thread_id: str) -> Tuple[str, Set[str]]:
+    """
+    Run the model/tool-call loop for a turn whose user message is already in messages.
+    
+    Tool calls and their results are appended to messages as they happen.
+    Returns the final reply text and the names of the tools called.
+    """
+    tools_used = set()
+    
+    # Call OpenAI API with function calling
+    response = await openai_client.chat.completions.create(
+        messages=messages,
+        **_CHAT_COMPLETION_OPTIONS
+    )
+    
+    assistant_message = response.choices[0].message
+    
+    # Handle function calls if present
+    while assistant_message.tool_calls:
+        tools_used.update(tc.function.name for tc in assistant_message.tool_calls)
+        
+        # Add assistant's response with tool calls to history
+        # Note: content can be None when tool calls are present, so we use empty string as fallback
+        messages.append({
+            "role": "assistant",
+            "content": assistant_message.content or "",
+            "tool_calls": [
+                {
+                    "id": tc.id,
+                    "type": tc.type,
+                    "function": {
+                        "name": tc.function.name,
+                        "arguments": tc.function.arguments
+                    }
+                } for tc in assistant_message.tool_calls
+            ]
+        })
+        
+        # Execute the tool calls (concurrently, duplicates run once)
+        function_results = await run_tool_calls(
+            [(tc.function.name, tc.function.arguments) for tc in assistant_message.tool_calls],
+            thread_id
+        )
+        
+        for tool_call, function_result in zip(assistant_message.tool_calls, function_results):
+            # Add function result to messages
+            messages.append({
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "name": tool_call.function.name,
+                "content": function_result
+            })
+        
+        # Get next response from OpenAI
+        response = await openai_client.chat.completions.create(
+            messages=messages,
+            **_CHAT_COMPLETION_OPTIONS
+        )
+        
+        assistant_message = response.choices[0].message
+    
+    return assistant_message.content or "", tools_used
+
+
+async def _run_chat_turn(request: ChatRequest) -> Tuple[str, bool, Optional[str]]:
+    """
+    Answer one (possibly merged) user message with the model and persist the turn.
+    
+    Returns (reply, requires_handover, handover_reason).
+    """
+    messages = await _prepare_turn_messages(request)
+    
+    # Reuse the reply to a paraphrase of this question in the same context, if enabled
+    reply = None
+    cache_embedding = None
+    if semantic_cache.enabled:
+        cache_embedding, context_hash, reply = await _lookup_semantic_cache(request.query, messages)
+    
+    if reply is None:
+        reply, tools_used = await _complete_turn(messages, request.thread_id)
+        if cache_embedding is not None and tools_used <= _SEMANTIC_CACHEABLE_TOOLS:
+            semantic_cache.store(cache_embedding, context_hash, reply)
+    
+    # Add final assistant message to history, then persist the turn while
+    # the escalation condition (if provided) is evaluated
+    messages.append({
+        "role": "assistant",
+        "content": reply
+    })
+    _, (requires_handover, handover_reason) = await asyncio.gather(
+        conversation_store.save(request.thread_id, messages),
+        _evaluate_escalation(request, reply)
+    )
+    
+    logger.info(f"Chat response generated - Thread: {request.thread_id}")
+    return reply, requires_handover, handover_reason
+
+
+class ChatTurnCoalescer:
+    """
+    Merges messages sent to the same thread in quick succession into one model turn.
+    
+    Messages arriving while that thread's turn is still running (or, with a
+    window_seconds > 0, within that window after the first one) are joined with
+    newlines into the next turn, and every caller in a batch receives the same
+    reply. A lone message is answered right away unless a window is set.
+    
+    Turns hold the thread's lock from thread_lock(); every other code path that
+    reads and writes a thread's history (trivial replies, /chat/stream) takes
+    the same lock, so concurrent requests can't overwrite each other's history.
+    """
+    
+    def __init__(self, run_turn: Callable, window_seconds: float = 0.0):
+        self.run_turn = run_turn
+        self.window_seconds = window_seconds
+        self._pending: Dict[str, List[Tuple[ChatRequest, asyncio.Future]]] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+    
+    def thread_lock(self, thread_id: str) -> asyncio.Lock:
+        """Lock serializing history updates for one thread (dropped once nobody holds or awaits it)."""
+        lock = self._locks.get(thread_id)
+        if lock is None:
+            lock = self._locks[thread_id] = asyncio.Lock()
+        return lock
+    
+    async def submit(self, request: ChatRequest):
+        """Queue a chat message for its thread and wait for the reply to its batch."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(request.thread_id, []).append((request, future))
+        
+        if request.thread_id not in self._workers:
+            self._workers[request.thread_id] = asyncio.create_task(self._drain(request.thread_id))
+        
+        return await future
+    
+    async def _drain(self, thread_id: str):
+        try:
+            while self._pending.get(thread_id):
+                if self.window_seconds > 0:
+                    await asyncio.sleep(self.window_seconds)
+                batch = self._pending.pop(thread_id)
+                
+                # The latest message decides the custom prompt and escalation condition
+                latest = batch[-1][0]
+                if len(batch) > 1:
+                    logger.info(f"Merged {len(batch)} messages into one turn - Thread: {thread_id}")
+                    latest = ChatRequest(
+                        query="\n".join(request.query for request, _ in batch),
+                        thread_id=thread_id,
+                        prompt=latest.prompt,
+                        escalation_condition=latest.escalation_condition
+                    )
+                
+                try:
+                    async with self.thread_lock(thread_id):
+                        result = await self.run_turn(latest)
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(result)
+        finally:
+            self._workers.pop(thread_id, None)
+
+
+chat_turn_coalescer = ChatTurnCoalescer(
+    _run_chat_turn,
+    window_seconds=int(os.getenv("BATCH_WINDOW_MS", "0")) / 1000
+)
+
+
+# response_model documents the schema; returning ORJSONResponse skips re-validation and encoding
+@app.post("/chat", response_model=ChatResponse, response_class=ORJSONResponse, tags=["Chatbot"])
 async def chat(request: ChatRequest):
     """
     Chat endpoint with conversation memory and optional escalation handling.
@@ -869,179 +1554,154 @@ async def chat(request: ChatRequest):
         logger.info(f"Received chat request - Thread: {request.thread_id}, Query: {request.query}")
         
         # Check if escalation reset is requested
-        escalation_reset = False
-        if request.reset_escalation:
-            if request.thread_id in thread_escalation_state:
-                del thread_escalation_state[request.thread_id]
-                logger.info(f"Escalation state reset for thread: {request.thread_id}")
-                escalation_reset = True
-        
-        # Check current escalation state
-        current_escalation_state = thread_escalation_state.get(request.thread_id, {})
-        escalation_active = current_escalation_state.get("active", False)
+        escalation_reset = await _reset_escalation_if_requested(request)
         
         # If escalation is active and not reset, inform that handover is required
-        if escalation_active and not request.reset_escalation:
-            logger.info(f"Thread {request.thread_id} is in escalated state - human handover required")
-            return ChatResponse(
-                response="This conversation has been escalated to a human agent. Please wait for a human representative to assist you. If you'd like to continue with the AI assistant, please indicate so.",
-                thread_id=request.thread_id,
-                timestamp=datetime.now().isoformat(),
-                requires_handover=True,
-                handover_reason=current_escalation_state.get("reason", "Previously escalated"),
-                escalation_active=True,
-                escalation_reset=False
-            )
+        escalated = await _escalated_payload(request)
+        if escalated is not None:
+            return ORJSONResponse(escalated)
         
-        # Get or create conversation thread with custom prompt if provided
-        messages = get_or_create_thread(request.thread_id, custom_prompt=request.prompt)
+        # Answer trivial turns locally
+        async with chat_turn_coalescer.thread_lock(request.thread_id):
+            trivial_reply = await _answer_trivial_turn(request)
+        if trivial_reply is not None:
+            return ORJSONResponse(_chat_payload(request, trivial_reply, False, None, escalation_reset))
         
-        # Log if custom prompt is being used
-        if request.prompt:
-            logger.info(f"Custom instructions appended to system prompt for thread: {request.thread_id}")
+        # Messages sent to this thread in quick succession share one model turn
+        reply, requires_handover, handover_reason = await chat_turn_coalescer.submit(request)
         
-        # Add user message to conversation history
-        messages.append({
-            "role": "user",
-            "content": request.query
-        })
-        
-        # Get available tools
-        tools = get_available_tools()
-        
-        # Call OpenAI API with function calling
-        response = openai.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            tools=tools,
-            tool_choice="auto",
-            temperature=0.7
-        )
-        
-        assistant_message = response.choices[0].message
-        
-        # Handle function calls if present
-        while assistant_message.tool_calls:
-            # Add assistant's response with tool calls to history
-            # Note: content can be None when tool calls are present, so we use empty string as fallback
-            messages.append({
-                "role": "assistant",
-                "content": assistant_message.content or "",
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "type": tc.type,
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
-                        }
-                    } for tc in assistant_message.tool_calls
-                ]
-            })
-            
-            # Execute each tool call
-            for tool_call in assistant_message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-                
-                # Execute the function
-                function_result = execute_function_call(
-                    function_name,
-                    function_args,
-                    request.thread_id
-                )
-                
-                # Add function result to messages
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": function_name,
-                    "content": function_result
-                })
-            
-            # Get next response from OpenAI
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-                tools=tools,
-                tool_choice="auto",
-                temperature=0.7
-            )
-            
-            assistant_message = response.choices[0].message
-        
-        # Add final assistant message to history
-        messages.append({
-            "role": "assistant",
-            "content": assistant_message.content or ""
-        })
-        
-        logger.info(f"Chat response generated - Thread: {request.thread_id}")
-        
-        # Check escalation condition if provided
-        requires_handover = False
-        handover_reason = None
-        
-        if request.escalation_condition:
-            logger.info(f"Checking escalation condition: {request.escalation_condition}")
-            try:
-                # Use OpenAI to evaluate if the escalation condition is met
-                escalation_check = openai.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": f"""You are an escalation evaluator. Analyze the conversation and determine if the following escalation condition is met:
+        return ORJSONResponse(_chat_payload(request, reply, requires_handover, handover_reason, escalation_reset))
+    
+    except Exception as e:
+        logger.error(f"Error processing chat request: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
 
-Escalation Condition: {request.escalation_condition}
 
-Respond with ONLY a JSON object in this exact format:
-{{"requires_handover": true/false, "reason": "brief explanation"}}
+def _sse_event(data: Dict, event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Event with a JSON data payload."""
+    body = b"data: " + orjson.dumps(data) + b"\n\n"
+    return b"event: " + event.encode() + b"\n" + body if event else body
 
-If the condition is met, set requires_handover to true and provide a reason.
-If not met, set requires_handover to false."""
-                        },
-                        {
-                            "role": "user",
-                            "content": f"Latest user message: {request.query}\n\nLatest assistant response: {assistant_message.content}"
-                        }
-                    ],
-                    temperature=0.3,
-                    response_format={"type": "json_object"}
-                )
+
+async def _stream_completion(messages: List[Dict], tool_calls: List[Dict]):
+    """
+    Stream one chat completion, yielding content deltas as they arrive.
+    
+    Tool call deltas are accumulated into tool_calls (in the history format
+    used by /chat) so the caller can execute them once the stream ends.
+    """
+    stream = await openai_client.chat.completions.create(
+        messages=messages,
+        stream=True,
+        **_CHAT_COMPLETION_OPTIONS
+    )
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta.content:
+            yield delta.content
+        for tc in delta.tool_calls or ():
+            while len(tool_calls) <= tc.index:
+                tool_calls.append({"id": "", "type": "function", "function": {"name": "", "arguments": ""}})
+            entry = tool_calls[tc.index]
+            if tc.id:
+                entry["id"] = tc.id
+            if tc.function is not None:
+                if tc.function.name:
+                    entry["function"]["name"] += tc.function.name
+                if tc.function.arguments:
+                    entry["function"]["arguments"] += tc.function.arguments
+
+
+@app.post("/chat/stream", tags=["Chatbot"])
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming variant of /chat using Server-Sent Events.
+    
+    Takes the same ChatRequest. Each content token is sent as
+    `data: {"delta": "..."}`; tool calls are run between model rounds as in
+    /chat, announced by an `event: tool` listing the tool names so clients can
+    show progress. The stream ends with an `event: done` carrying the
+    ChatResponse fields, or an `event: error` with a `detail` message.
+    """
+    logger.info(f"Received streaming chat request - Thread: {request.thread_id}, Query: {request.query}")
+    
+    async def event_stream():
+        try:
+            escalation_reset = await _reset_escalation_if_requested(request)
+            
+            escalated = await _escalated_payload(request)
+            if escalated is not None:
+                yield _sse_event({"delta": escalated["response"]})
+                yield _sse_event(escalated, event="done")
+                return
+            
+            # Same per-thread serialization as /chat, held until the turn is saved
+            async with chat_turn_coalescer.thread_lock(request.thread_id):
+                trivial_reply = await _answer_trivial_turn(request)
+                if trivial_reply is not None:
+                    yield _sse_event({"delta": trivial_reply})
+                    yield _sse_event(_chat_payload(request, trivial_reply, False, None, escalation_reset), event="done")
+                    return
+            
+                messages = await _prepare_turn_messages(request)
+            
+                content = None
+                cache_embedding = None
+                if semantic_cache.enabled:
+                    cache_embedding, context_hash, content = await _lookup_semantic_cache(request.query, messages)
+            
+                if content is not None:
+                    yield _sse_event({"delta": content})
+            
+                tools_used = set()
+                while content is None:
+                    parts = []
+                    tool_calls = []
+                    async for text in _stream_completion(messages, tool_calls):
+                        parts.append(text)
+                        yield _sse_event({"delta": text})
                 
-                escalation_result = json.loads(escalation_check.choices[0].message.content)
-                requires_handover = escalation_result.get("requires_handover", False)
-                handover_reason = escalation_result.get("reason")
+                    text = "".join(parts)
+                    if not tool_calls:
+                        content = text
+                        if cache_embedding is not None and tools_used <= _SEMANTIC_CACHEABLE_TOOLS:
+                            semantic_cache.store(cache_embedding, context_hash, content)
+                        break
                 
-                if requires_handover:
-                    logger.info(f"Escalation triggered - Reason: {handover_reason}")
-                    # Store escalation state for this thread
-                    thread_escalation_state[request.thread_id] = {
-                        "active": True,
-                        "reason": handover_reason,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    logger.info("Escalation condition not met, continuing conversation")
-                    
-            except Exception as e:
-                logger.error(f"Error checking escalation condition: {e}", exc_info=True)
-                # Continue without escalation if check fails
+                    tools_used.update(tc["function"]["name"] for tc in tool_calls)
+                    yield _sse_event({"tools": [tc["function"]["name"] for tc in tool_calls]}, event="tool")
+                    messages.append({"role": "assistant", "content": text, "tool_calls": tool_calls})
+                    function_results = await run_tool_calls(
+                        [(tc["function"]["name"], tc["function"]["arguments"]) for tc in tool_calls],
+                        request.thread_id
+                    )
+                    for tool_call, function_result in zip(tool_calls, function_results):
+                        messages.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call["id"],
+                            "name": tool_call["function"]["name"],
+                            "content": function_result
+                        })
+            
+                messages.append({"role": "assistant", "content": content})
+                _, (requires_handover, handover_reason) = await asyncio.gather(
+                    conversation_store.save(request.thread_id, messages),
+                    _evaluate_escalation(request, content)
+                )
+                logger.info(f"Streamed chat response - Thread: {request.thread_id}")
+                yield _sse_event(_chat_payload(request, content, requires_handover, handover_reason, escalation_reset), event="done")
         
-        return ChatResponse(
-            response=assistant_message.content,
-            thread_id=request.thread_id,
-            timestamp=datetime.now().isoformat(),
-            requires_handover=requires_handover,
-            handover_reason=handover_reason,
-            escalation_active=thread_escalation_state.get(request.thread_id, {}).get("active", False),
-            escalation_reset=escalation_reset
-        )
+        except Exception as e:
+            logger.error(f"Error processing streaming chat request: {e}", exc_info=True)
+            yield _sse_event({"detail": str(e)}, event="error")
     
-    except Exception as e:
-        logger.error(f"Error processing chat request: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 
@@ -1220,27 +1880,28 @@ async def outbound_call(request: OutboundCallRequest):
 @app.get("/thread/{thread_id}/history", tags=["Chatbot"])
 async def get_thread_history(thread_id: str):
     """Get conversation history for a thread."""
-    if thread_id not in conversation_threads:
+    messages = await conversation_store.get(thread_id)
+    if messages is None:
         raise HTTPException(status_code=404, detail=f"Thread {thread_id} not found")
     
     return {
         "thread_id": thread_id,
-        "message_count": len(conversation_threads[thread_id]),
-        "messages": conversation_threads[thread_id]
+        "message_count": len(messages),
+        "messages": messages
     }
 
 
 @app.delete("/thread/{thread_id}", tags=["Chatbot"])
 async def delete_thread(thread_id: str):
     """Delete a conversation thread and its associated services."""
-    if thread_id in conversation_threads:
-        del conversation_threads[thread_id]
+    await conversation_store.delete(thread_id)
     
     if thread_id in thread_services:
         del thread_services[thread_id]
     
-    if thread_id in thread_escalation_state:
-        del thread_escalation_state[thread_id]
+    await conversation_store.clear_escalation(thread_id)
+    
+    thread_policy_details.pop(thread_id, None)
     
     logger.info(f"Deleted thread: {thread_id}")
     return {"message": f"Thread {thread_id} deleted successfully"}
@@ -1254,7 +1915,7 @@ async def get_escalation_status(thread_id: str):
     Returns information about whether the conversation is escalated,
     when it was escalated, and the reason for escalation.
     """
-    escalation_state = thread_escalation_state.get(thread_id, {})
+    escalation_state = await conversation_store.get_escalation(thread_id) or {}
     
     return {
         "thread_id": thread_id,
@@ -1273,8 +1934,7 @@ async def reset_escalation_status(thread_id: str):
     Use this endpoint to allow the user to continue chatting with the bot
     after human interaction is complete.
     """
-    if thread_id in thread_escalation_state:
-        del thread_escalation_state[thread_id]
+    if await conversation_store.clear_escalation(thread_id):
         logger.info(f"Escalation state reset for thread: {thread_id}")
         return {
             "message": "Escalation status reset successfully",
@@ -1499,7 +2159,8 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "active_threads": len(conversation_threads),
+        "conversation_store": conversation_store.backend,
+        "active_threads": conversation_store.local_thread_count(),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -1521,6 +2182,7 @@ async def root():
         "endpoints": {
             "chatbot": {
                 "POST /chat": "Send a message and get a response",
+                "POST /chat/stream": "Send a message and stream the response as Server-Sent Events",
                 "GET /thread/{thread_id}/history": "Get conversation history",
                 "DELETE /thread/{thread_id}": "Delete a conversation thread"
             },
@@ -1551,6 +2213,8 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info("Starting Unified Insurance API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    # WEB_CONCURRENCY > 1 needs REDIS_URL so threads are shared across workers
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    logger.info(f"Starting Unified Insurance API server with {workers} worker(s)...")
+    uvicorn.run("app:app" if workers > 1 else app, host="0.0.0.0", port=8000, log_level="info", workers=workers)
 
@@ -1,99 +1,266 @@
 """
 Simple backend server to handle LiveKit room creation and agent dispatch
+
+Run in production with Hypercorn (one worker per core):
+    hypercorn backend_server:app -w $(nproc) -b 0.0.0.0:8001 --worker-class uvloop
+
+Set BACKEND_DEV=1 and run `python backend_server.py` for the local debug server.
 """
 import os
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+import secrets
 import asyncio
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import weakref
+import jwt
+import orjson
+from cachetools import TTLCache
+from quart import Quart, Response, request, jsonify
+from quart.json.provider import JSONProvider
+from quart_cors import cors
 from livekit import api
 from dotenv import load_dotenv
 
+# uvloop is a faster drop-in event loop (not available on Windows). Hypercorn picks
+# it with --worker-class uvloop; only the dev server below starts it directly.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 load_dotenv()
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend access
+# Log through a queue so stream writes happen on a background thread, not the event loop
+logger = logging.getLogger("backend-server")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# LiveKit credentials
+# Enable CORS for frontend access; max_age lets browsers cache the preflight for a day
+app = cors(
+    Quart(__name__),
+    allow_methods=["POST", "GET", "OPTIONS"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
+)
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for faster request/response (de)serialization"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonProvider(app)
+
+# LiveKit credentials (read once at import; never from os.environ per request)
 LIVEKIT_URL = os.getenv("LIVEKIT_URL")
 LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY")
 LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
 
+def reload_env():
+    """Re-read the LiveKit credentials from the environment / .env file.
+    
+    The shared LiveKit client is built at startup, so restart the server for
+    new credentials to apply to room/dispatch calls as well as tokens.
+    """
+    global LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET
+    load_dotenv(override=True)
+    LIVEKIT_URL = os.getenv("LIVEKIT_URL")
+    LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY")
+    LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
+    _STATIC_CLAIMS["iss"] = LIVEKIT_API_KEY
+
+# Static part of every user access token; only sub/name/room/nbf/exp vary per request
+_TOKEN_TTL_SECONDS = 6 * 60 * 60  # Same default TTL as livekit.api.AccessToken
+_STATIC_CLAIMS = {
+    "iss": LIVEKIT_API_KEY,
+    "video": {
+        "roomJoin": True,
+        "canPublish": True,
+        "canSubscribe": True,
+    },
+}
+
+def _mint_user_token(room_name, user_identity):
+    """Sign a room-join token for the user from the precomputed static claims"""
+    now = int(time.time())
+    claims = dict(_STATIC_CLAIMS)
+    claims["video"] = {**_STATIC_CLAIMS["video"], "room": room_name}
+    claims["sub"] = user_identity
+    claims["name"] = f"User {user_identity}"
+    claims["nbf"] = now
+    claims["exp"] = now + _TOKEN_TTL_SECONDS
+    return jwt.encode(claims, LIVEKIT_API_SECRET, algorithm="HS256")
+
+# Shared LiveKit API client (reuses one HTTP session / connection pool for the process)
+_LKAPI = None
+
+# Rooms known to be live with an agent dispatched, plus per-room locks so
+# concurrent requests for the same new room only create/dispatch once
+_ROOMS = TTLCache(maxsize=10_000, ttl=3600)
+_ROOM_LOCKS = weakref.WeakValueDictionary()
+
+# Strong references to in-flight background dispatch tasks (prevents GC mid-flight)
+_PENDING_DISPATCHES = set()
+
+@app.before_serving
+async def _startup():
+    """Create the shared LiveKit API client once the event loop is running"""
+    global _LKAPI
+    _LKAPI = api.LiveKitAPI(LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET)
+    
+    # Warm the connection pool (DNS + TLS) with a cheap call so the first
+    # real /create_room doesn't pay the handshake
+    try:
+        await _LKAPI.room.list_rooms(api.ListRoomsRequest(names=[]))
+        logger.info("LiveKit connection warmed up")
+    except Exception:
+        logger.warning("LiveKit warm-up call failed; first request will connect cold", exc_info=True)
+
+@app.after_serving
+async def _shutdown():
+    """Finish pending agent dispatches and close the shared LiveKit API client"""
+    if _PENDING_DISPATCHES:
+        await asyncio.gather(*_PENDING_DISPATCHES, return_exceptions=True)
+    if _LKAPI is not None:
+        await _LKAPI.aclose()
+
 @app.route('/create_room', methods=['POST'])
-def create_room():
+async def create_room():
     """Create a room and dispatch an agent"""
     try:
         # Get user identity from request or generate one
-        data = request.json or {}
-        user_identity = data.get('identity', f'user-{os.urandom(4).hex()}')
-        room_name = data.get('room', f'call-{os.urandom(4).hex()}')
+        data = await request.get_json() or {}
+        room_name, user_identity = _room_and_identity(data)
         
-        # Run async operations in sync context
-        result = asyncio.run(_create_room_async(room_name, user_identity))
+        result = await _create_room_async(room_name, user_identity)
         return jsonify(result)
         
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("create_room failed")
         return jsonify({'success': False, 'error': str(e)}), 500
 
-async def _create_room_async(room_name, user_identity):
-    """Async function to create room and dispatch agent"""
-    lkapi = api.LiveKitAPI(LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET)
+@app.route('/create_rooms', methods=['POST'])
+async def create_rooms():
+    """Create several rooms (and dispatch agents) in one request.
     
+    Body: {"rooms": [{"room": "...", "identity": "..."}, ...]}; both keys are
+    optional per entry. Prefer this over N calls to /create_room - all LiveKit
+    calls run concurrently over the shared connection pool.
+    """
     try:
-        # Create or get room
-        try:
-            room = await lkapi.room.create_room(api.CreateRoomRequest(name=room_name))
-            print(f"✓ Room created: {room_name}")
-        except Exception as e:
-            print(f"Room might already exist: {e}")
-        
-        # Dispatch agent to the room
-        try:
-            await lkapi.agent.dispatch_room_agent(
-                api.RoomAgentDispatch(
-                    room=room_name,
-                    agent_name="inshora-agent",  # Explicitly specify agent name
-                )
-            )
-            print(f"✓ Agent 'inshora-agent' dispatched to room: {room_name}")
-        except Exception as e:
-            print(f"Agent dispatch info: {e}")
-        
-        # Generate token for user
-        token = api.AccessToken(LIVEKIT_API_KEY, LIVEKIT_API_SECRET) \
-            .with_identity(user_identity) \
-            .with_name(f"User {user_identity}") \
-            .with_grants(api.VideoGrants(
-                room_join=True,
-                room=room_name,
-                can_publish=True,
-                can_subscribe=True,
-            ))
+        data = await request.get_json() or {}
+        rooms = [_room_and_identity(entry or {}) for entry in data.get('rooms', [])]
         
-        jwt_token = token.to_jwt()
+        results = await asyncio.gather(
+            *(_create_room_async(room_name, user_identity) for room_name, user_identity in rooms),
+            return_exceptions=True,
+        )
         
-        return {
+        return jsonify({
             'success': True,
-            'room': room_name,
-            'token': jwt_token,
-            'url': LIVEKIT_URL,
-            'identity': user_identity
-        }
-    finally:
-        await lkapi.aclose()
+            'rooms': [
+                {'success': False, 'room': room_name, 'error': str(result)}
+                if isinstance(result, Exception) else result
+                for (room_name, _), result in zip(rooms, results)
+            ]
+        })
+        
+    except Exception as e:
+        logger.exception("create_rooms failed")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def _room_and_identity(data):
+    """Return (room_name, user_identity) from a request entry, generating missing values"""
+    user_identity = data.get('identity') or f'user-{secrets.token_hex(4)}'
+    room_name = data.get('room') or f'call-{secrets.token_hex(4)}'
+    return room_name, user_identity
+
+async def _create_room_async(room_name, user_identity):
+    """Create the room, return the user's token, and dispatch the agent in the background"""
+    # Rooms created/dispatched recently already have an agent - go straight to the token
+    if room_name not in _ROOMS:
+        # Every caller holds a strong reference while it waits, so the lock stays
+        # shared until the last one is done and then drops out of _ROOM_LOCKS
+        lock = _ROOM_LOCKS.setdefault(room_name, asyncio.Lock())
+        async with lock:
+            if room_name not in _ROOMS:
+                await _create_room(room_name)
+                _ROOMS[room_name] = True
+                # The agent joins asynchronously anyway, so don't hold the token for it
+                task = asyncio.create_task(_dispatch_agent(room_name))
+                _PENDING_DISPATCHES.add(task)
+                task.add_done_callback(_PENDING_DISPATCHES.discard)
+    
+    # Generate token for user
+    jwt_token = _mint_user_token(room_name, user_identity)
+    
+    return {
+        'success': True,
+        'room': room_name,
+        'token': jwt_token,
+        'url': LIVEKIT_URL,
+        'identity': user_identity
+    }
+
+async def _create_room(room_name):
+    """Create the LiveKit room (an existing room is not an error)"""
+    try:
+        await _LKAPI.room.create_room(api.CreateRoomRequest(name=room_name))
+        print(f"✓ Room created: {room_name}")
+    except Exception as e:
+        print(f"Room might already exist: {e}")
+
+async def _dispatch_agent(room_name):
+    """Background task: dispatch the agent to the room"""
+    try:
+        await _LKAPI.agent.dispatch_room_agent(
+            api.RoomAgentDispatch(
+                room=room_name,
+                agent_name="inshora-agent",  # Explicitly specify agent name
+            )
+        )
+        print(f"✓ Agent 'inshora-agent' dispatched to room: {room_name}")
+    except Exception as e:
+        print(f"Agent dispatch info: {e}")
+        # Let the next request for this room retry the dispatch
+        _ROOMS.pop(room_name, None)
+
+# Precomputed /health response body and headers (probed frequently by load balancers)
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_HEADERS = {'Cache-Control': 'no-store'}
 
 @app.route('/health', methods=['GET'])
-def health():
+async def health():
     """Health check endpoint"""
-    return jsonify({'status': 'ok'})
+    return Response(_HEALTH_BODY, mimetype='application/json', headers=_HEALTH_HEADERS)
 
 if __name__ == '__main__':
+    if os.getenv("BACKEND_DEV") != "1":
+        print("Use Hypercorn to serve this app, e.g.:")
+        print("  hypercorn backend_server:app -w $(nproc) -b 0.0.0.0:8001 --worker-class uvloop")
+        print("Set BACKEND_DEV=1 to run the local debug server instead.")
+        raise SystemExit(1)
+    
     print("=" * 60)
-    print("LiveKit Backend Server")
+    print("LiveKit Backend Server (development)")
     print("=" * 60)
     print(f"Server running on: http://localhost:8001")
     print(f"LiveKit URL: {LIVEKIT_URL}")
     print("=" * 60)
-    app.run(host='0.0.0.0', port=8001, debug=True)
+    if uvloop is not None:
+        uvloop.run(app.run_task(host='0.0.0.0', port=8001, debug=True))
+    else:
+        app.run(host='0.0.0.0', port=8001, debug=True)
@@ -1,10 +1,10 @@
-"""Configuration settings for the telephony agent."""
+"""Configuration settings for the telephony agent (immutable; build new instances instead of mutating)."""
 
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class STTConfig:
     """Speech-to-Text configuration."""
     model: str = "nova-3"
@@ -17,14 +17,14 @@ class STTConfig:
     sample_rate: int = 16000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """Large Language Model configuration."""
     model: str = "gpt-4o-mini"
     temperature: float = 0.7
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
     """Text-to-Speech configuration."""
     model: str = "sonic-2"
@@ -34,7 +34,7 @@ class TTSConfig:
     sample_rate: int = 24000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RAGConfig:
     """RAG Service configuration."""
     qdrant_url: str = "http://localhost:6333"
@@ -42,7 +42,7 @@ class RAGConfig:
     openai_api_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     """Main agent configuration."""
     agent_name: str = "inbound-agent"
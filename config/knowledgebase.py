@@ -185,25 +185,21 @@ WHEN CALLER MENTIONS COMPETITOR:
 # COMBINED KNOWLEDGE BASE
 # ===========================
 
-INSHORA_KNOWLEDGE_BASE = f"""
-=== INSHORA GROUP AI KNOWLEDGE BASE ===
-
-{TEXAS_INSURANCE_LAWS}
-
-{OBJECTION_HANDLING}
-
-{ESCALATION_PROTOCOLS}
-
-{LEAD_SCORING}
-
-{TONE_ADAPTATION}
-
-{PROMOTIONS_DISCOUNTS}
-
-{REBUTTALS}
-
-=== END OF KNOWLEDGE BASE ===
-"""
+INSHORA_KNOWLEDGE_SECTIONS = (
+    "\n=== INSHORA GROUP AI KNOWLEDGE BASE ===",
+    TEXAS_INSURANCE_LAWS,
+    OBJECTION_HANDLING,
+    ESCALATION_PROTOCOLS,
+    LEAD_SCORING,
+    TONE_ADAPTATION,
+    PROMOTIONS_DISCOUNTS,
+    REBUTTALS,
+    "=== END OF KNOWLEDGE BASE ===\n"
+)
+
+# Built once at import with a single join; the text must stay byte-identical
+# so the system prompt prefix it is embedded in remains cacheable
+INSHORA_KNOWLEDGE_BASE = "\n\n".join(INSHORA_KNOWLEDGE_SECTIONS)
 
 
 def get_knowledge_base() -> str:
@@ -137,49 +137,6 @@ def extract_customer_fields(data):
     return extracted
 
 
-def extract_policy_list(payload: dict) -> list:
-    """
-    Extract policy list from AMS360 PolicyGetListByCustomerIdResponse.
-    Safely handles missing keys and nested structures.
-    """
-
-    try:
-        policies = (
-            payload.get("s:Envelope", {})
-            .get("s:Body", {})
-            .get("PolicyGetListByCustomerIdResponse", {})
-            .get("PolicyGetListByCustomerIdResult", {})
-            .get("a:PolicyInfoList", {})
-            .get("a:PolicyInfo", [])
-        )
-    except Exception:
-        return []
-
-    # Ensure it's a list
-    if isinstance(policies, dict):
-        policies = [policies]
-
-    cleaned_list = []
-
-    for p in policies:
-        cleaned_list.append({
-            "CompanyType": p.get("a:CompanyType"),
-            "CustomerId": p.get("a:CustomerId"),
-            "IsMultiEntity": p.get("a:IsMultiEntity"),
-            "PolicyEffectiveDate": p.get("a:PolicyEffectiveDate"),
-            "PolicyExpirationDate": p.get("a:PolicyExpirationDate"),
-            "PolicyId": p.get("a:PolicyId"),
-            "PolicyNumber": p.get("a:PolicyNumber"),
-            "PolicySubType": p.get("a:PolicySubType"),
-            "PolicyTypeOfBusiness": p.get("a:PolicyTypeOfBusiness"),
-            "PolicyStatus": p.get("a:PolicyStatus"),
-            "WritingCompanyCode": p.get("a:WritingCompanyCode"),
-        })
-
-    return cleaned_list
-
-
-
 # ---------------------------
 # Example use:
 # ---------------------------
@@ -0,0 +1,43 @@
+"""
+Shared helpers for the Pydantic models: the Email field type and lazy OpenAPI examples
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import AfterValidator, Field
+
+
+EMAIL_PATTERN = r'[^@\s]+@[^@\s]+\.[^@\s]+'
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+
+def _validate_email(v: str) -> str:
+    if not _EMAIL_RE.fullmatch(v):
+        raise ValueError('value is not a valid email address')
+    return v
+
+
+# Lightweight stand-in for EmailStr: a format check only, no email-validator parsing
+Email = Annotated[str, AfterValidator(_validate_email), Field(json_schema_extra={"format": "email"})]
+
+
+# OpenAPI examples live in examples.json and are only read when a schema is generated
+_EXAMPLES_PATH = Path(__file__).with_name("examples.json")
+
+
+@lru_cache(maxsize=1)
+def _load_examples() -> dict:
+    with open(_EXAMPLES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def schema_example(schema: dict, model: type) -> None:
+    """json_schema_extra hook that attaches the model's example from examples.json."""
+    example = _load_examples().get(model.__name__)
+    if example is not None:
+        schema["example"] = example
+
@@ -0,0 +1,256 @@
+"""
+Insurance quote models: home, auto, flood, life and commercial
+"""
+
+import re
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, List, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+from typing_extensions import NotRequired, TypedDict
+
+from models.common import Email, schema_example
+
+
+# Precompiled format check (VINs never contain I, O or Q)
+VIN_PATTERN = r'[A-HJ-NPR-Z0-9]{17}'
+_VIN_RE = re.compile(VIN_PATTERN, re.ASCII)
+
+
+# ===========================
+# ENUMS
+# ===========================
+
+class CoverageType(str, Enum):
+    LIABILITY = "liability"
+    FULL = "full"
+
+
+class PolicyType(str, Enum):
+    TERM = "term"
+    WHOLE = "whole"
+    UNIVERSAL = "universal"
+    ANNUITY = "annuity"
+    LONG_TERM_CARE = "long_term_care"
+
+
+# Field annotations use the equivalent Literals: pydantic-core validates them as
+# plain strings instead of allocating Enum members. The enums remain for callers.
+CoverageTypeLiteral = Literal["liability", "full"]
+PolicyTypeLiteral = Literal["term", "whole", "universal", "annuity", "long_term_care"]
+
+
+# ===========================
+# SHARED/COMMON MODELS
+# ===========================
+
+# Leaf records are TypedDicts: validated where they are nested, stored as plain dicts
+
+class Address(TypedDict):
+    streetAddress: Annotated[str, Field(description="Street address")]
+    city: Annotated[str, Field(description="City")]
+    state: Annotated[str, Field(description="State")]
+    country: Annotated[str, Field(description="Country")]
+    zip_code: Annotated[str, Field(description="ZIP or postal code")]
+
+
+class ContactInfo(TypedDict):
+    phone: Annotated[str, Field(description="Best phone number to reach")]
+    email: Annotated[Email, Field(description="Email address")]
+
+
+class Person(BaseModel):
+    full_name: str = Field(..., description="Full legal name")
+    date_of_birth: date = Field(..., description="Date of birth")
+
+
+class PolicyInfo(TypedDict):
+    current_provider: NotRequired[Annotated[Optional[str], Field(description="Current insurance provider")]]
+    renewal_date: NotRequired[Annotated[Optional[date], Field(description="Policy renewal date")]]
+    renewal_premium: NotRequired[Annotated[Optional[float], Field(description="Renewal offer/premium amount")]]
+
+
+# ===========================
+# HOME INSURANCE MODEL
+# ===========================
+
+class PropertyDetails(BaseModel):
+    address: Address = Field(..., description="Property address")
+    has_solar_panels: bool = Field(False, description="Does property have solar panels?")
+    has_pool: bool = Field(False, description="Does property have a pool?")
+    roof_age: int = Field(0, ge=0, description="Age of roof in years")
+
+
+class HomeInsurance(BaseModel):
+    # Primary Insured
+    primary_insured: Person = Field(..., description="Primary insured person")
+    
+    # Spouse (if applicable)
+    spouse: Optional[Person] = Field(None, description="Spouse information if applicable")
+    
+    # Property Details
+    property: PropertyDetails = Field(..., description="Property details")
+    
+    # Additional Info
+    has_pets: bool = Field(..., description="Does the insured have pets?")
+    
+    # Current Policy
+    current_policy: PolicyInfo = Field(..., description="Current policy information")
+    
+    # Contact
+    contact: ContactInfo = Field(..., description="Contact information")
+
+    model_config = ConfigDict(json_schema_extra=schema_example)
+
+
+# ===========================
+# AUTO INSURANCE MODEL
+# ===========================
+
+class Driver(Person):
+    license_number: str = Field(..., description="Driver's license number")
+    qualification: str = Field(..., description="Educational qualification")
+    profession: str = Field(..., description="Current profession")
+    gpa: Optional[float] = Field(None, ge=0.0, le=4.0, description="GPA for drivers under 21")
+
+
+class Vehicle(BaseModel):
+    vin: str = Field(..., min_length=17, max_length=17, description="Vehicle Identification Number")
+    make: str = Field(..., description="Vehicle manufacturer")
+    model: str = Field(..., description="Vehicle model")
+    coverage_type: CoverageTypeLiteral = Field(..., description="Type of coverage desired")
+
+    @field_validator('vin')
+    @classmethod
+    def validate_vin(cls, v: str) -> str:
+        v = v.upper()
+        if not _VIN_RE.fullmatch(v):
+            raise ValueError('VIN must be 17 characters (letters except I, O, Q and digits)')
+        return v
+
+
+class AutoInsurance(BaseModel):
+    # Drivers
+    drivers: List[Driver] = Field(..., min_length=1, description="List of all drivers")
+    
+    # Vehicles
+    vehicles: List[Vehicle] = Field(..., min_length=1, description="List of all vehicles")
+    
+    # Current Policy
+    current_policy: PolicyInfo = Field(..., description="Current policy information")
+    
+    # Contact
+    contact: ContactInfo = Field(..., description="Contact information")
+
+    model_config = ConfigDict(json_schema_extra=schema_example)
+
+
+# ===========================
+# FLOOD INSURANCE MODEL
+# ===========================
+
+class FloodInsurance(BaseModel):
+    home_address: Address = Field(..., description="Home address for flood insurance")
+    full_name: str = Field(..., description="Full name of insured")
+    phone: str = Field(..., description="Phone number")
+    email: Email = Field(..., description="Email address")
+
+    model_config = ConfigDict(json_schema_extra=schema_example)
+
+
+# ===========================
+# LIFE INSURANCE MODEL
+# ===========================
+
+class LifeInsurance(BaseModel):
+    insured: Person = Field(..., description="Insured person")
+    address: Address = Field(..., description="Insured person's address")
+    appointment_requested: bool = Field(..., description="Is appointment requested?")
+    appointment_date: Optional[datetime] = Field(None, description="Appointment date and time")
+    contact: ContactInfo = Field(..., description="Contact information")
+    policy_type: Optional[PolicyTypeLiteral] = Field(None, description="Type of life insurance policy")
+
+    model_config = ConfigDict(json_schema_extra=schema_example)
+
+
+# ===========================
+# COMMERCIAL INSURANCE MODEL
+# ===========================
+
+class BusinessDetails(TypedDict):
+    name: Annotated[str, Field(description="Business legal name")]
+    type: Annotated[str, Field(description="Type of business")]
+    address: Annotated[Address, Field(description="Business address")]
+
+
+class CoverageDetails(BaseModel):
+    inventory_limit: Optional[float] = Field(None, ge=0, description="Inventory coverage limit")
+    building_coverage: bool = Field(..., description="Does business need building coverage?")
+    building_coverage_limit: Optional[float] = Field(None, ge=0, description="Building coverage limit")
+
+    @model_validator(mode='after')
+    def validate_building_limit(self):
+        if self.building_coverage and self.building_coverage_limit is None:
+            raise ValueError('Building coverage limit required when building coverage is True')
+        return self
+
+
+class CommercialInsurance(BaseModel):
+    # Business Details
+    business: BusinessDetails = Field(..., description="Business information")
+    
+    # Coverage Details
+    coverage: CoverageDetails = Field(..., description="Coverage requirements")
+    
+    # Current Policy
+    current_policy: PolicyInfo = Field(..., description="Current policy information")
+    
+    # Contact
+    contact: ContactInfo = Field(..., description="Contact information")
+
+    model_config = ConfigDict(json_schema_extra=schema_example)
+
+
+# ===========================
+# QUOTE REQUEST MODEL
+# ===========================
+
+class HomeQuoteRequest(BaseModel):
+    insurance_type: Literal["home"] = Field(..., description="Type of insurance quote requested")
+    home_insurance: HomeInsurance
+
+
+class AutoQuoteRequest(BaseModel):
+    insurance_type: Literal["auto"] = Field(..., description="Type of insurance quote requested")
+    auto_insurance: AutoInsurance
+
+
+class FloodQuoteRequest(BaseModel):
+    insurance_type: Literal["flood"] = Field(..., description="Type of insurance quote requested")
+    flood_insurance: FloodInsurance
+
+
+class LifeQuoteRequest(BaseModel):
+    insurance_type: Literal["life"] = Field(..., description="Type of insurance quote requested")
+    life_insurance: LifeInsurance
+
+
+class CommercialQuoteRequest(BaseModel):
+    insurance_type: Literal["commercial"] = Field(..., description="Type of insurance quote requested")
+    commercial_insurance: CommercialInsurance
+
+
+# Tagged union: insurance_type selects the single branch to validate
+QuoteRequest = Annotated[
+    Union[HomeQuoteRequest, AutoQuoteRequest, FloodQuoteRequest, LifeQuoteRequest, CommercialQuoteRequest],
+    Field(discriminator="insurance_type"),
+]
+
+
+# ===========================
+# REQUEST ADAPTERS
+# ===========================
+
+# Built once at import so request parsing reuses the compiled validators
+QUOTE_ADAPTER = TypeAdapter(QuoteRequest)
@@ -0,0 +1,142 @@
+"""
+Messaging and call models: Twilio SMS, email, outbound calls and status responses
+"""
+
+from typing import Annotated, Optional
+
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from models.common import EMAIL_PATTERN, Email, schema_example
+
+
+# ===========================
+# TWILIO SMS MODELS
+# ===========================
+
+class SMSRequest(BaseModel):
+    """Request model for sending SMS."""
+    body: str = Field(..., description="The message content to send")
+    number: str = Field(..., description="The recipient's phone number (with country code, e.g., +1234567890)")
+
+    model_config = ConfigDict(frozen=True, json_schema_extra=schema_example)
+
+
+class SMSResponse(BaseModel):
+    """Response model for SMS sending."""
+    status: str = Field(..., description="Status of the SMS operation")
+    message: str = Field(..., description="Human-readable message about the operation")
+    message_sid: str = Field(..., description="Twilio message SID for tracking")
+    to_number: str = Field(..., description="Recipient phone number")
+
+    model_config = ConfigDict(frozen=True, json_schema_extra=schema_example)
+
+
+class MessageStatusResponse(BaseModel):
+    """Response model for message status."""
+    status: str = Field(..., description="Delivery status (queued, sending, sent, failed, delivered, undelivered)")
+    message_sid: str = Field(..., description="Unique message SID")
+    to_number: str = Field(..., description="Recipient phone number")
+    from_number: str = Field(..., description="Sender phone number")
+    body: str = Field(..., description="Message content")
+    date_sent: Optional[str] = Field(None, description="When the message was sent")
+    date_updated: Optional[str] = Field(None, description="Last update time")
+    error_code: Optional[str] = Field(None, description="Error code if failed")
+    error_message: Optional[str] = Field(None, description="Error message if failed")
+    price: Optional[str] = Field(None, description="Cost of the message")
+    direction: str = Field(..., description="Message direction (outbound-api, inbound)")
+
+    model_config = ConfigDict(frozen=True, json_schema_extra=schema_example)
+
+
+# ===========================
+# EMAIL MODELS
+# ===========================
+
+class EmailRequest(BaseModel):
+    """Request model for sending email."""
+    receiver_email: Email = Field(..., description="Recipient's email address")
+    subject: str = Field(..., description="Email subject line")
+    body: str = Field(..., description="Email body content")
+    is_html: Optional[bool] = Field(False, description="Whether the body is HTML format")
+
+    model_config = ConfigDict(frozen=True, json_schema_extra=schema_example)
+
+
+class EmailResponse(BaseModel):
+    """Response model for email sending."""
+    status: str = Field(..., description="Status of the email operation")
+    message: str = Field(..., description="Human-readable message about the operation")
+    receiver_email: str = Field(..., description="Recipient email address")
+
+    model_config = ConfigDict(frozen=True, json_schema_extra=schema_example)
+
+
+class OutboundCallRequest(BaseModel):
+    """Request model for initiating an outbound call."""
+    phone_number: str
+    name: Optional[str] = None
+    dynamic_instruction: Optional[str] = None
+    language: Optional[str] = "en"  # TTS language (e.g., "en", "es", "fr")
+    voice_id: Optional[str] = "21m00Tcm4TlvDq8ikWAM"  # ElevenLabs voice ID (default: Rachel)
+    sip_trunk_id: Optional[str] = None  # SIP trunk ID (uses env variable if not provided)
+    transfer_to: Optional[str] = None  # Phone number to transfer to (e.g., +1234567890)
+    escalation_condition: Optional[str] = None  # Condition when to escalate/transfer the call
+    provider: Optional[str] = "openai"  # LLM provider ("openai" or "gemini")
+    api_key: Optional[str] = None  # Custom API key for the provider
+
+class StatusResponse(BaseModel):
+    """Generic status response model used across multiple endpoints."""
+    status: str
+    message: str
+    details: Optional[dict] = None
+    transcript: Optional[dict] = None  # Added for call transcripts
+
+    model_config = ConfigDict(frozen=True)
+
+
+# ===========================
+# REQUEST ADAPTERS
+# ===========================
+
+# Built once at import so request parsing reuses the compiled validators
+EMAIL_REQ_ADAPTER = TypeAdapter(EmailRequest)
+SMS_REQ_ADAPTER = TypeAdapter(SMSRequest)
+
+
+# ===========================
+# MSGSPEC WIRE STRUCTS
+# ===========================
+# Hot-path mirrors of the SMS/email request and response models. The send
+# endpoints decode and encode these directly with msgspec; the Pydantic models
+# above stay as the documented OpenAPI schema. msgspec matches JSON keys against
+# the struct's interned field names; gc=False is safe since every field is a scalar.
+
+class SMSRequestMsg(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    body: str
+    number: str
+
+
+class SMSResponseMsg(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    status: str
+    message: str
+    message_sid: str
+    to_number: str
+
+
+class EmailRequestMsg(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    receiver_email: Annotated[str, msgspec.Meta(pattern=rf"\A{EMAIL_PATTERN}\Z")]
+    subject: str
+    body: str
+    is_html: Optional[bool] = False
+
+
+class EmailResponseMsg(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    status: str
+    message: str
+    receiver_email: str
+
+
+# Decoders built once at import
+SMS_REQ_DECODER = msgspec.json.Decoder(SMSRequestMsg)
+EMAIL_REQ_DECODER = msgspec.json.Decoder(EmailRequestMsg)
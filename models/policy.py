@@ -0,0 +1,94 @@
+"""
+Policy management models: policy updates and document requests
+"""
+
+from enum import Enum
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from models.common import Email, schema_example
+from models.insurance import CoverageTypeLiteral, Driver
+
+
+# ===========================
+# ENUMS
+# ===========================
+
+class DocumentType(str, Enum):
+    POLICY = "policy"
+    DECLARATIONS_PAGE = "declarations_page"
+    CERTIFICATE_OF_INSURANCE = "certificate_of_insurance"
+    RENEWAL_COPY = "renewal_copy"
+
+
+class UpdateType(str, Enum):
+    ADD_VEHICLE = "add_vehicle"
+    REMOVE_VEHICLE = "remove_vehicle"
+    ADD_DRIVER = "add_driver"
+    REMOVE_DRIVER = "remove_driver"
+    UPDATE_MORTGAGEE = "update_mortgagee"
+
+
+# Field annotations use the equivalent Literals: pydantic-core validates them as
+# plain strings instead of allocating Enum members. The enums remain for callers.
+DocumentTypeLiteral = Literal["policy", "declarations_page", "certificate_of_insurance", "renewal_copy"]
+UpdateTypeLiteral = Literal["add_vehicle", "remove_vehicle", "add_driver", "remove_driver", "update_mortgagee"]
+
+
+# ===========================
+# POLICY MANAGEMENT MODELS
+# ===========================
+
+class VehicleUpdate(BaseModel):
+    vin: Optional[str] = Field(None, min_length=17, max_length=17)
+    make: Optional[str] = None
+    model: Optional[str] = None
+    coverage_type: Optional[CoverageTypeLiteral] = None
+
+
+class Mortgagee(BaseModel):
+    name: str = Field(..., description="Mortgagee/lender name")
+    address: str = Field(..., description="Mortgagee address")
+    loan_number: str = Field(..., description="Loan account number")
+
+
+# Detail field each update type requires, with the error raised when it is missing
+_UPDATE_REQUIRES = {
+    UpdateType.ADD_VEHICLE: ('vehicle', 'Vehicle details required for vehicle updates'),
+    UpdateType.REMOVE_VEHICLE: ('vehicle', 'Vehicle details required for vehicle updates'),
+    UpdateType.ADD_DRIVER: ('driver', 'Driver details required for driver updates'),
+    UpdateType.REMOVE_DRIVER: ('driver', 'Driver details required for driver updates'),
+    UpdateType.UPDATE_MORTGAGEE: ('mortgagee', 'Mortgagee details required for mortgagee update'),
+}
+
+
+class PolicyUpdateRequest(BaseModel):
+    policy_number: str = Field(..., description="Policy number")
+    client_name: str = Field(..., description="Client name for verification")
+    update_type: UpdateTypeLiteral = Field(..., description="Type of update requested")
+    
+    # For vehicle changes
+    vehicle: Optional[VehicleUpdate] = Field(None, description="Vehicle details for add/remove")
+    
+    # For driver changes
+    driver: Optional[Driver] = Field(None, description="Driver details for add/remove")
+    
+    # For mortgagee updates
+    mortgagee: Optional[Mortgagee] = Field(None, description="Mortgagee details for update")
+
+    @model_validator(mode='after')
+    def validate_update_details(self):
+        field, error = _UPDATE_REQUIRES[self.update_type]
+        if getattr(self, field) is None:
+            raise ValueError(error)
+        return self
+
+
+class DocumentRequest(BaseModel):
+    policy_number: str = Field(..., description="Policy number")
+    client_name: str = Field(..., description="Client name for verification")
+    document_type: DocumentTypeLiteral = Field(..., description="Type of document requested")
+    delivery_email: Optional[Email] = Field(None, description="Email to send document to")
+
+    model_config = ConfigDict(json_schema_extra=schema_example)
@@ -0,0 +1,140 @@
+import msgspec
+from typing import Any, Dict, List, Literal, Optional, Union
+
+
+# ===========================
+# CHATBOT TOOL ARGUMENTS
+# ===========================
+# Typed arguments for every chatbot tool that takes parameters. Fields mirror
+# the tool schemas in app.py; the LLM's raw JSON arguments are decoded straight
+# into these structs (strict=False lets "true"/"5" coerce to bool/int). The
+# decoders are built once at import, so validation is a single C-level pass.
+
+class SetUserActionArgs(msgspec.Struct, kw_only=True):
+    action_type: Literal["add", "update"]
+    insurance_type: Literal["home", "auto", "flood", "life", "commercial"]
+
+
+class HomeInsuranceArgs(msgspec.Struct, kw_only=True):
+    full_name: str
+    date_of_birth: str
+    property_address: str
+    phone: str
+    email: str
+    spouse_name: Optional[str] = None
+    spouse_dob: Optional[str] = None
+    has_solar_panels: bool = False
+    has_pool: bool = False
+    roof_age: int = 0
+    has_pets: bool = False
+    current_provider: Optional[str] = None
+    renewal_date: Optional[str] = None
+    renewal_premium: Optional[float] = None
+
+
+class AutoInsuranceArgs(msgspec.Struct, kw_only=True):
+    driver_name: str
+    driver_dob: str
+    license_number: str
+    qualification: str
+    profession: str
+    vin: str
+    vehicle_make: str
+    vehicle_model: str
+    phone: str
+    email: str
+    gpa: Optional[float] = None
+    coverage_type: str = "full"
+    current_provider: Optional[str] = None
+    renewal_date: Optional[str] = None
+    renewal_premium: Optional[float] = None
+
+
+class FloodInsuranceArgs(msgspec.Struct, kw_only=True):
+    full_name: str
+    home_address: str
+    email: str
+
+
+class LifeInsuranceArgs(msgspec.Struct, kw_only=True):
+    full_name: str
+    date_of_birth: str
+    appointment_requested: bool
+    phone: str
+    email: str
+    appointment_date: Optional[str] = None
+    policy_type: Optional[str] = None
+
+
+class CommercialInsuranceArgs(msgspec.Struct, kw_only=True):
+    business_name: str
+    business_type: str
+    business_address: str
+    phone: str
+    email: str
+    inventory_limit: Optional[float] = None
+    building_coverage: bool = False
+    building_coverage_limit: Optional[float] = None
+    current_provider: Optional[str] = None
+    renewal_date: Optional[str] = None
+    renewal_premium: Optional[float] = None
+
+
+class PolicyNumberArgs(msgspec.Struct, kw_only=True):
+    policy_number: str
+
+
+class CreateLeadArgs(msgspec.Struct, kw_only=True):
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    insurance_type: str
+    notes: str = ""
+    address: Optional[str] = None
+    date_of_birth: Optional[str] = None
+    current_provider: Optional[str] = None
+    vehicle_info: Optional[str] = None
+    property_info: Optional[str] = None
+    business_name: Optional[str] = None
+    appointment_requested: Optional[bool] = None
+
+
+class KnowledgeBaseSearchArgs(msgspec.Struct, kw_only=True):
+    query: str
+    collections: List[str] = msgspec.field(default_factory=lambda: ["inshora"])
+    top_k: int = 5
+
+
+TOOL_ARG_STRUCTS = {
+    "set_user_action": SetUserActionArgs,
+    "collect_home_insurance_data": HomeInsuranceArgs,
+    "collect_auto_insurance_data": AutoInsuranceArgs,
+    "collect_flood_insurance_data": FloodInsuranceArgs,
+    "collect_life_insurance_data": LifeInsuranceArgs,
+    "collect_commercial_insurance_data": CommercialInsuranceArgs,
+    "get_policy_by_number": PolicyNumberArgs,
+    "get_detailed_policy_info": PolicyNumberArgs,
+    "create_agencyzoom_lead": CreateLeadArgs,
+    "search_knowledge_base": KnowledgeBaseSearchArgs,
+}
+
+_json_decoder = msgspec.json.Decoder()
+_struct_decoders = {
+    name: msgspec.json.Decoder(struct, strict=False)
+    for name, struct in TOOL_ARG_STRUCTS.items()
+}
+
+
+def decode_tool_arguments(function_name: str, raw_arguments: str) -> Union[msgspec.Struct, Dict[str, Any]]:
+    """
+    Decode a tool call's JSON arguments.
+
+    Tools with a registered struct are decoded and validated into it; all other
+    tools get a plain dict. Raises msgspec.ValidationError / msgspec.DecodeError
+    on invalid arguments.
+    """
+    decoder = _struct_decoders.get(function_name)
+    if decoder is None:
+        return _json_decoder.decode(raw_arguments or "{}")
+    return decoder.decode(raw_arguments or "{}")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, Field
 from typing import Optional, List, Literal
 from datetime import date, datetime
 from enum import Enum
@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -8,16 +9,13 @@ sys.path.insert(0, str(project_root))
 
 # Import agent_service from local services directory  
 from outboundService.services.agent_service import run_agent
+from utils.logger import setup_queued_logging
 
-# Setup basic logging before running
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('entry_debug.log')
-    ]
-)
+# Setup queued logging before running; the debug log file is opt-in via DEBUG_LOG
+log_handlers = [logging.StreamHandler(sys.stdout)]
+if os.environ.get('DEBUG_LOG'):
+    log_handlers.append(logging.FileHandler('entry_debug.log'))
+setup_queued_logging(*log_handlers, level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
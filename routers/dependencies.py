@@ -0,0 +1,50 @@
+"""
+Shared dependencies and response helpers for the API routers
+"""
+
+from typing import Any, Callable, Dict
+
+import msgspec
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter
+
+
+def json_body_openapi(adapter: TypeAdapter) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that decode their raw body themselves (e.g. via parse_msgspec_body)."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": adapter.json_schema()}},
+        }
+    }
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """Return model serialized by pydantic-core's model_dump_json, with no intermediate dict."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def parse_msgspec_body(decoder: msgspec.json.Decoder) -> Callable:
+    """
+    Build a dependency that decodes and validates the raw request body with a msgspec decoder.
+
+    Bypasses Pydantic entirely for hot endpoints; decode/validation errors are
+    reported as RequestValidationError so clients still get a 422.
+    """
+    async def dependency(request: Request):
+        body = await request.body()
+        try:
+            return decoder.decode(body)
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise RequestValidationError(
+                [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}],
+                body=body
+            )
+
+    return dependency
+
+
+def struct_json_response(struct: msgspec.Struct) -> Response:
+    """Return a msgspec Struct encoded straight to JSON bytes."""
+    return Response(content=msgspec.json.encode(struct), media_type="application/json")
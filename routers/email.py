@@ -3,10 +3,11 @@ Email-related API endpoints using SMTP
 """
 
 import os
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from dotenv import load_dotenv
 from utils.logger import log_info, log_error, log_exception
-from models.model import EmailRequest, EmailResponse
+from routers.dependencies import json_body_openapi, parse_msgspec_body, struct_json_response
+from models.messaging import EMAIL_REQ_ADAPTER, EMAIL_REQ_DECODER, EmailRequestMsg, EmailResponse, EmailResponseMsg
 from services.email import EmailService
 
 load_dotenv()
@@ -25,13 +26,20 @@ except Exception as e:
     email_service = None
 
 
-@router.post("/send", response_model=EmailResponse)
-async def send_email(request: EmailRequest):
+@router.on_event("shutdown")
+def close_email_service():
+    """Close the shared SMTP connection on shutdown."""
+    if email_service:
+        email_service.close()
+
+
+@router.post("/send", response_model=EmailResponse, openapi_extra=json_body_openapi(EMAIL_REQ_ADAPTER))
+async def send_email(request: EmailRequestMsg = Depends(parse_msgspec_body(EMAIL_REQ_DECODER))):
     """
     Send an email using SMTP.
     
     Args:
-        request: EmailRequest containing:
+        request: EmailRequestMsg containing:
             - receiver_email: The recipient's email address
             - subject: Email subject line
             - body: Email body content (plain text or HTML)
@@ -76,11 +84,12 @@ async def send_email(request: EmailRequest):
         
         log_info(f"Successfully sent email to '{request.receiver_email}'")
         
-        return EmailResponse(
+        response = EmailResponseMsg(
             status="success",
             message=f"Email sent successfully to {request.receiver_email}",
             receiver_email=request.receiver_email
         )
+        return struct_json_response(response)
     
     except HTTPException:
         raise
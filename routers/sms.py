@@ -2,18 +2,28 @@
 Twilio SMS-related API endpoints
 """
 
+import asyncio
 import os
-from fastapi import APIRouter, HTTPException
-from twilio.rest import Client
+import re
+import httpx
+from functools import lru_cache
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
 from dotenv import load_dotenv
 from utils.logger import log_info, log_error, log_exception
-from models.model import SMSRequest, SMSResponse, MessageStatusResponse
+from routers.dependencies import json_body_openapi, model_json_response, parse_msgspec_body, struct_json_response
+from models.messaging import (
+    SMS_REQ_ADAPTER, SMS_REQ_DECODER, SMSRequestMsg, SMSResponse, SMSResponseMsg, MessageStatusResponse
+)
 
 load_dotenv()
 
 router = APIRouter(prefix="/sms", tags=["Twilio SMS"])
 
-# Initialize Twilio client
+# E.164 phone number: '+', country code, up to 15 digits total
+_E164_RE = re.compile(r'\+[1-9]\d{6,14}', re.ASCII)
+
+# Twilio credentials
 account_sid = os.environ.get("TWILIO_ACCOUNT_SID")
 auth_token = os.environ.get("TWILIO_AUTH_TOKEN")
 twilio_number = os.environ.get("TWILIO_NUMBER")
@@ -21,21 +31,104 @@ twilio_number = os.environ.get("TWILIO_NUMBER")
 if not all([account_sid, auth_token, twilio_number]):
     log_error("Twilio credentials not found in environment variables")
 
-try:
-    client = Client(account_sid, auth_token)
-    log_info("Twilio client initialized successfully")
-except Exception as e:
-    log_error(f"Failed to initialize Twilio client: {str(e)}")
-    client = None
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Create the Twilio SDK client on first use; only the status lookup needs it."""
+    from twilio.rest import Client
+    try:
+        client = Client(account_sid, auth_token)
+        log_info("Twilio client initialized successfully")
+        return client
+    except Exception as e:
+        log_error(f"Failed to initialize Twilio client: {str(e)}")
+        return None
+
+
+# Outbound sends go through a queue drained by one worker that starts each send as
+# its own task, at most SMS_BATCH_MAX in flight, over a shared keep-alive
+# connection pool (the Twilio SDK is sync)
+SMS_BATCH_MAX = int(os.getenv("SMS_BATCH_MAX", "20"))
+TWILIO_MESSAGES_URL = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
+
+twilio_http = httpx.AsyncClient(
+    auth=(account_sid or "", auth_token or ""),
+    limits=httpx.Limits(max_connections=SMS_BATCH_MAX, max_keepalive_connections=SMS_BATCH_MAX),
+    timeout=httpx.Timeout(30.0, connect=5.0)
+)
+sms_queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+_sms_worker: Optional[asyncio.Task] = None
+_sms_slots = asyncio.Semaphore(SMS_BATCH_MAX)
+_sms_sends: "set[asyncio.Task]" = set()  # strong references to in-flight sends
+
+
+async def _post_sms(to_number: str, body: str) -> dict:
+    """POST one message to Twilio's Messages resource and return the created message."""
+    response = await twilio_http.post(
+        TWILIO_MESSAGES_URL,
+        data={"To": to_number, "From": twilio_number, "Body": body}
+    )
+    payload = response.json()
+    if response.status_code >= 400:
+        raise RuntimeError(f"Twilio error {payload.get('code')}: {payload.get('message')}")
+    return payload
+
+
+async def _send_queued_sms(to_number: str, body: str, future: asyncio.Future):
+    """Post one queued SMS, resolve its caller's future and free its slot."""
+    try:
+        result = await _post_sms(to_number, body)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+    else:
+        if not future.done():
+            future.set_result(result)
+    finally:
+        _sms_slots.release()
 
 
-@router.post("/send", response_model=SMSResponse)
-async def send_sms(request: SMSRequest):
+async def _sms_send_worker():
+    """Drain the SMS queue, starting each send as soon as one of SMS_BATCH_MAX slots is free."""
+    while True:
+        to_number, body, future = await sms_queue.get()
+        await _sms_slots.acquire()
+        task = asyncio.create_task(_send_queued_sms(to_number, body, future))
+        _sms_sends.add(task)
+        task.add_done_callback(_sms_sends.discard)
+
+
+async def queue_sms(to_number: str, body: str) -> dict:
+    """Queue an SMS for the send worker and wait for Twilio's response."""
+    global _sms_worker
+    if _sms_worker is None or _sms_worker.done():
+        _sms_worker = asyncio.create_task(_sms_send_worker())
+
+    future = asyncio.get_running_loop().create_future()
+    await sms_queue.put((to_number, body, future))
+    return await future
+
+
+@router.on_event("shutdown")
+async def close_twilio_http():
+    """Stop the SMS worker and in-flight sends and close the Twilio connection pool on shutdown."""
+    if _sms_worker is not None:
+        _sms_worker.cancel()
+    for task in list(_sms_sends):
+        task.cancel()
+    await twilio_http.aclose()
+
+
+@router.post("/send", response_model=SMSResponse, openapi_extra=json_body_openapi(SMS_REQ_ADAPTER))
+async def send_sms(request: SMSRequestMsg = Depends(parse_msgspec_body(SMS_REQ_DECODER))):
     """
     Send an SMS message using Twilio.
     
     Args:
-        request: SMSRequest containing:
+        request: SMSRequestMsg containing:
             - body: The message content to send
             - number: The recipient's phone number (with country code, e.g., +1234567890)
         
@@ -45,36 +138,33 @@ async def send_sms(request: SMSRequest):
     try:
         log_info(f"SMS send request to: '{request.number}'")
         
-        if not client:
-            log_error("Twilio client not initialized")
+        if not all([account_sid, auth_token, twilio_number]):
+            log_error("Twilio credentials not configured")
             raise HTTPException(
                 status_code=500,
                 detail="Twilio service not available. Check your credentials."
             )
         
         # Validate phone number format
-        if not request.number.startswith('+'):
+        if not _E164_RE.fullmatch(request.number):
             log_error(f"Invalid phone number format: '{request.number}'")
             raise HTTPException(
                 status_code=400,
                 detail="Phone number must start with '+' followed by country code (e.g., +1234567890)"
             )
         
-        # Send the SMS message
-        message = client.messages.create(
-            body=request.body,
-            from_=twilio_number,
-            to=request.number
-        )
+        # Send the SMS message (batched with any other pending sends)
+        message = await queue_sms(request.number, request.body)
         
-        log_info(f"Successfully sent SMS to '{request.number}', SID: {message.sid}")
+        log_info(f"Successfully sent SMS to '{request.number}', SID: {message['sid']}")
         
-        return SMSResponse(
+        response = SMSResponseMsg(
             status="success",
             message=f"SMS sent successfully to {request.number}",
-            message_sid=message.sid,
+            message_sid=message["sid"],
             to_number=request.number
         )
+        return struct_json_response(response)
     
     except HTTPException:
         raise
@@ -83,6 +173,10 @@ async def send_sms(request: SMSRequest):
         raise HTTPException(status_code=500, detail=f"SMS sending error: {str(e)}")
 
 
+# Twilio message attributes returned as strings (None when unset)
+_STATUS_STR_FIELDS = ('date_sent', 'date_updated', 'error_code')
+
+
 @router.get("/status/{message_sid}", response_model=MessageStatusResponse)
 async def get_message_status(message_sid: str):
     """
@@ -105,6 +199,7 @@ async def get_message_status(message_sid: str):
     try:
         log_info(f"Fetching status for message SID: {message_sid}")
         
+        client = _get_client()
         if not client:
             log_error("Twilio client not initialized")
             raise HTTPException(
@@ -117,19 +212,19 @@ async def get_message_status(message_sid: str):
         
         log_info(f"Successfully retrieved status for SID: {message_sid}, Status: {message.status}")
         
-        return MessageStatusResponse(
+        # model_construct skips validation: the fields come straight from Twilio
+        response = MessageStatusResponse.model_construct(
+            **{field: str(value) if (value := getattr(message, field)) else None for field in _STATUS_STR_FIELDS},
             status=message.status,
             message_sid=message.sid,
             to_number=message.to,
             from_number=message.from_,
             body=message.body,
-            date_sent=str(message.date_sent) if message.date_sent else None,
-            date_updated=str(message.date_updated) if message.date_updated else None,
-            error_code=str(message.error_code) if message.error_code else None,
             error_message=message.error_message,
             price=message.price,
             direction=message.direction
         )
+        return model_json_response(response)
     
     except HTTPException:
         raise
@@ -1,6 +1,12 @@
 """Services package for business logic."""
 
-from .insurance_service import InsuranceService
-
 __all__ = ["InsuranceService"]
 
+
+def __getattr__(name):
+    # Loaded on first access so importing a single service (e.g. services.email)
+    # doesn't pull in the insurance models
+    if name == "InsuranceService":
+        from .insurance_service import InsuranceService
+        return InsuranceService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
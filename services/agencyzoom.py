@@ -1,11 +1,19 @@
 """AgencyZoom API service for lead and opportunity management."""
 
+import atexit
 import logging
 import os
+import functools
+import threading
+import orjson
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
+from types import MappingProxyType
 from dotenv import load_dotenv
+from utils.circuit_breaker import CircuitBreaker, CircuitBreakerAdapter, CircuitOpenError
 
 load_dotenv()
 logger = logging.getLogger("telephony-agent")
@@ -14,6 +22,49 @@ logger = logging.getLogger("telephony-agent")
 AGENCYZOOM_API_KEY = os.getenv("AGENCYZOOM_API_KEY")
 AGENCYZOOM_BASE_URL = os.getenv("AGENCYZOOM_BASE_URL", "https://api.agencyzoom.com/v1")
 AGENCYZOOM_AGENCY_ID = os.getenv("AGENCYZOOM_AGENCY_ID")
+AGENCYZOOM_USERNAME = os.getenv("AGENCYZOOM_USERNAME")
+AGENCYZOOM_PASSWORD = os.getenv("AGENCYZOOM_PASSWORD")
+AGENCYZOOM_BULK_WORKERS = int(os.getenv("AGENCYZOOM_BULK_WORKERS", "10"))
+
+# Retry transient failures with exponential backoff. Status-based retries are
+# limited to GET so lead/opportunity/note creation is never duplicated; POST and
+# PATCH are still retried when the connection itself fails (nothing was sent).
+AGENCYZOOM_RETRY = Retry(
+    total=5,
+    backoff_factor=0.6,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Transport failures and undecodable response bodies; requests' own r.json()
+# raised a RequestException subclass for the latter, orjson raises a ValueError
+_REQUEST_ERRORS = (requests.exceptions.RequestException, orjson.JSONDecodeError)
+
+# Fixed lead routing (pipeline, stage, source, assignee); pipelineId and stageId
+# may be overridden per lead
+_DEFAULT_LEAD_PAYLOAD = MappingProxyType({
+    "pipelineId": 3816,
+    "stageId": 11446,
+    "leadSourceId": 113762,
+    "assignTo": 148687,
+})
+
+# Optional lead fields copied into the create payload when present
+_OPTIONAL_LEAD_FIELDS = (
+    "secondaryEmail", "secondaryPhone", "notes",
+    "contactDate", "soldDate", "assignmentGroupId",
+    "xDate", "quoteDate", "csrId", "streetAddress",
+    "streetAddressLine2", "city", "state", "country", "zip",
+    "agencyNumber", "departmentCode", "groupCode"
+)
+
+# Every lead field AgencyZoom knows about; anything else would be a custom field
+_STANDARD_LEAD_FIELDS = frozenset({
+    "firstname", "lastname", "first_name", "last_name", "email", "phone",
+    "pipelineId", "stageId", "leadSourceId", "assignTo", *_OPTIONAL_LEAD_FIELDS
+})
 
 
 class AgencyZoomService:
@@ -24,8 +75,8 @@ class AgencyZoomService:
         # Set these FIRST before calling _get_authentication
         self.base_url = AGENCYZOOM_BASE_URL
         self.agency_id = AGENCYZOOM_AGENCY_ID
-        self.username = os.getenv("AGENCYZOOM_USERNAME")
-        self.password = os.getenv("AGENCYZOOM_PASSWORD")
+        self.username = AGENCYZOOM_USERNAME
+        self.password = AGENCYZOOM_PASSWORD
         
         logger.info(f"AgencyZoom config - Base URL: {self.base_url}")
         logger.info(f"AgencyZoom config - Username: {self.username if self.username else 'NOT SET'}")
@@ -38,7 +89,25 @@ class AgencyZoomService:
             else:
                 self.base_url += 'v1'
         
-        # NOW authenticate (after credentials are set)
+        # Keep-alive connection pool reused by every API call
+        self.http = requests.Session()
+        # Fail fast instead of waiting out the timeout while AgencyZoom is down
+        self.http.mount('https://', CircuitBreakerAdapter(
+            CircuitBreaker("AgencyZoom"), pool_connections=1, pool_maxsize=32, max_retries=AGENCYZOOM_RETRY
+        ))
+        
+        # NOW authenticate (after credentials are set). A failed login is retried
+        # on the next call, and an expired token is refreshed on a 401
+        self.api_key: Optional[str] = None
+        self._auth_lock = threading.Lock()
+        self._login()
+        
+        atexit.register(self.close)
+        
+        logger.info(f"AgencyZoomService initialized with base URL: {self.base_url}")
+    
+    def _login(self) -> Optional[str]:
+        """Log in and put the new JWT on the session; returns it, or None on failure."""
         self.api_key = self._get_authentication()
         
         if not self.api_key:
@@ -46,8 +115,29 @@ class AgencyZoomService:
             logger.error("Please set AGENCYZOOM_USERNAME and AGENCYZOOM_PASSWORD in your .env file")
         else:
             logger.info(f"✓ AgencyZoom authenticated successfully - JWT token received")
-        
-        logger.info(f"AgencyZoomService initialized with base URL: {self.base_url}")
+            # Bearer/JSON headers are set once on the session instead of per call
+            self.http.headers.update(self._get_headers())
+        return self.api_key
+    
+    def _ensure_authenticated(self, stale_key: Optional[str] = None) -> bool:
+        """Log in if there is no token yet (or it is stale_key); True when a token is available."""
+        if self.api_key and self.api_key != stale_key:
+            return True
+        with self._auth_lock:
+            # Another thread may have logged in while this one waited
+            if self.api_key and self.api_key != stale_key:
+                return True
+            return self._login() is not None
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send an authenticated request, logging in again and retrying once on a 401."""
+        api_key = self.api_key
+        r = self.http.request(method, url, **kwargs)
+        if r.status_code == 401:
+            logger.warning(f"AgencyZoom returned 401 for {method} {url}; re-authenticating")
+            if self._ensure_authenticated(stale_key=api_key):
+                r = self.http.request(method, url, **kwargs)
+        return r
     
     def _get_headers(self) -> Dict[str, str]:
         """Get standard headers for AgencyZoom API requests."""
@@ -57,6 +147,10 @@ class AgencyZoomService:
             'Accept': 'application/json'
         }
     
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self.http.close()
+    
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get headers for authentication (no Bearer token)."""
         return {
@@ -81,12 +175,14 @@ class AgencyZoomService:
         
         try:
             logger.info(f"Authenticating with AgencyZoom at {url} as {self.username}")
-            response = requests.post(url, json=payload, headers=headers, timeout=15)
+            response = self.http.post(url, data=orjson.dumps(payload), headers=headers, timeout=15)
             response.raise_for_status()
-            jwt_token = response.json().get("jwt")
+            jwt_token = orjson.loads(response.content).get("jwt")
             logger.info("AgencyZoom authentication successful")
             return jwt_token
-        except requests.exceptions.RequestException as e:
+        except CircuitOpenError:
+            return None
+        except _REQUEST_ERRORS as e:
             logger.exception(f"AgencyZoom authentication failed: {e}")
             return None
     
@@ -128,7 +224,7 @@ class AgencyZoomService:
         Returns:
             Dictionary with created lead data or None if failed
         """
-        if not self.api_key:
+        if not self._ensure_authenticated():
             logger.error("Cannot create lead: AgencyZoom API key not configured")
             return None
         
@@ -136,89 +232,100 @@ class AgencyZoomService:
         
         # Prepare payload matching AgencyZoom API schema
         payload = {
+            **_DEFAULT_LEAD_PAYLOAD,
             "firstname": lead_data.get("firstname") or lead_data.get("first_name", ""),
             "lastname": lead_data.get("lastname") or lead_data.get("last_name", ""),
             "email": lead_data.get("email", ""),
             "phone": lead_data.get("phone", ""),
-            "pipelineId": lead_data.get("pipelineId", 3816),
-            "stageId": lead_data.get("stageId", 11446),
-            "leadSourceId": 113762,
-            "assignTo": 148687,
         }
+        for field in ("pipelineId", "stageId"):
+            if field in lead_data:
+                payload[field] = lead_data[field]
         
         # Add optional fields if provided
-        optional_fields = [
-            "secondaryEmail", "secondaryPhone", "notes",
-            "contactDate", "soldDate", "assignmentGroupId",
-            "xDate", "quoteDate", "csrId", "streetAddress",
-            "streetAddressLine2", "city", "state", "country", "zip",
-            "agencyNumber", "departmentCode", "groupCode"
-        ]
-        
-        for field in optional_fields:
-            if field in lead_data and lead_data[field] is not None:
+        for field in _OPTIONAL_LEAD_FIELDS:
+            if lead_data.get(field) is not None:
                 payload[field] = lead_data[field]
         
         # # Handle custom fields - only add fields that are NOT standard AgencyZoom fields
-        # standard_fields = {
-        #     "firstname", "lastname", "first_name", "last_name", "email", "phone",
-        #     "pipelineId", "stageId", "leadSourceId", "assignTo", *optional_fields
-        # }
-        
-        # custom_fields = []
-        # for field, value in lead_data.items():
-        #     if field not in standard_fields and value is not None:
-        #         custom_fields.append({
-        #             "fieldName": field,
-        #             "fieldValue": [str(value)] if not isinstance(value, list) else value
-        #         })
+        # custom_fields = [
+        #     {
+        #         "fieldName": field,
+        #         "fieldValue": [str(value)] if not isinstance(value, list) else value
+        #     }
+        #     for field, value in lead_data.items()
+        #     if field not in _STANDARD_LEAD_FIELDS and value is not None
+        # ]
         
         # if custom_fields:
         #     payload["customFields"] = custom_fields
         
         try:
-            logger.info(f"AgencyZoom lead payload: {payload}")
-            r = requests.post(endpoint, json=payload, headers=self._get_headers(), timeout=15)
+            # Session headers already carry Content-Type: application/json
+            r = self._request('POST', endpoint, data=orjson.dumps(payload), timeout=15)
             r.raise_for_status()
-            result = r.json()
+            result = orjson.loads(r.content)
             
             logger.info(f"AgencyZoom lead created successfully: {lead_data.get('email')}")
-            logger.info(f"AgencyZoom lead created successfully: {result}")
-            logger.info(f"AgencyZoom lead created successfully: {payload}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("AgencyZoom lead payload=%s result=%s", payload, result)
             return result
             
-        except requests.exceptions.RequestException as e:
+        except CircuitOpenError:
+            return None
+        except _REQUEST_ERRORS as e:
             logger.exception(f"AgencyZoom create lead failed: {e}")
             return None
     
-    def search_contact_by_phone(self, phone: str) -> Optional[Dict]:
-        """Search for a contact by phone number.
+    def create_leads_bulk(self, leads: List[Dict[str, Any]], max_workers: int = AGENCYZOOM_BULK_WORKERS) -> List[Optional[Dict]]:
+        """Create several leads concurrently over the shared connection pool.
         
         Args:
-            phone: Phone number to search for
+            leads: List of lead_data dictionaries, as accepted by create_lead
+            max_workers: Maximum number of creates in flight at once (default AGENCYZOOM_BULK_WORKERS)
             
         Returns:
-            Dictionary with contact search results or None if failed
+            List of create_lead results in the same order as leads (None for failures)
         """
-        if not self.api_key:
+        if not leads:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(leads))) as executor:
+            return list(executor.map(self.create_lead, leads))
+    
+    def _search_contact(self, field: str, value: str) -> Optional[Dict]:
+        """Search contacts by a single field ('phone' or 'email'). Returns results or None."""
+        if not self._ensure_authenticated():
             logger.error("Cannot search contact: AgencyZoom API key not configured")
             return None
         
         endpoint = f"{self.base_url}/contacts/search"
-        params = {"phone": phone}
         
         try:
-            r = requests.get(endpoint, params=params, headers=self._get_headers(), timeout=15)
+            r = self._request('GET', endpoint, params={field: value}, timeout=15)
             r.raise_for_status()
-            result = r.json()
+            result = orjson.loads(r.content)
             
-            logger.info(f"AgencyZoom contact search by phone completed: {phone}")
+            logger.info(f"AgencyZoom contact search by {field} completed: {value}")
             return result
             
-        except requests.exceptions.RequestException as e:
-            logger.exception(f"AgencyZoom search contact by phone failed: {e}")
+        except CircuitOpenError:
+            return None
+        except _REQUEST_ERRORS as e:
+            logger.exception(f"AgencyZoom search contact by {field} failed: {e}")
             return None
     
+    def search_contact_by_phone(self, phone: str) -> Optional[Dict]:
+        """Search for a contact by phone number.
+        
+        Args:
+            phone: Phone number to search for
+            
+        Returns:
+            Dictionary with contact search results or None if failed
+        """
+        return self._search_contact("phone", phone)
+    
     def search_contact_by_email(self, email: str) -> Optional[Dict]:
         """Search for a contact by email address.
         
@@ -228,24 +335,22 @@ class AgencyZoomService:
         Returns:
             Dictionary with contact search results or None if failed
         """
-        if not self.api_key:
-            logger.error("Cannot search contact: AgencyZoom API key not configured")
-            return None
-        
-        endpoint = f"{self.base_url}/contacts/search"
-        params = {"email": email}
+        return self._search_contact("email", email)
+    
+    def search_contact_by_phone_and_email(self, phone: str, email: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Search for a contact by phone and by email at the same time.
         
-        try:
-            r = requests.get(endpoint, params=params, headers=self._get_headers(), timeout=15)
-            r.raise_for_status()
-            result = r.json()
-            
-            logger.info(f"AgencyZoom contact search by email completed: {email}")
-            return result
+        Args:
+            phone: Phone number to search for
+            email: Email address to search for
             
-        except requests.exceptions.RequestException as e:
-            logger.exception(f"AgencyZoom search contact by email failed: {e}")
-            return None
+        Returns:
+            Tuple of (phone search results, email search results); either may be None
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            by_phone = executor.submit(self._search_contact, "phone", phone)
+            by_email = executor.submit(self._search_contact, "email", email)
+            return by_phone.result(), by_email.result()
     
     def create_opportunity(self, opportunity_data: Dict[str, Any]) -> Optional[Dict]:
         """Create a new opportunity in AgencyZoom.
@@ -264,7 +369,7 @@ class AgencyZoomService:
         Returns:
             Dictionary with created opportunity data or None if failed
         """
-        if not self.api_key:
+        if not self._ensure_authenticated():
             logger.error("Cannot create opportunity: AgencyZoom API key not configured")
             return None
         
@@ -283,14 +388,16 @@ class AgencyZoomService:
         }
         
         try:
-            r = requests.post(endpoint, json=payload, headers=self._get_headers(), timeout=15)
+            r = self._request('POST', endpoint, data=orjson.dumps(payload), timeout=15)
             r.raise_for_status()
-            result = r.json()
+            result = orjson.loads(r.content)
             
             logger.info(f"AgencyZoom opportunity created successfully for contact: {opportunity_data.get('contact_id')}")
             return result
             
-        except requests.exceptions.RequestException as e:
+        except CircuitOpenError:
+            return None
+        except _REQUEST_ERRORS as e:
             logger.exception(f"AgencyZoom create opportunity failed: {e}")
             return None
     
@@ -304,21 +411,23 @@ class AgencyZoomService:
         Returns:
             Dictionary with updated contact data or None if failed
         """
-        if not self.api_key:
+        if not self._ensure_authenticated():
             logger.error("Cannot update contact: AgencyZoom API key not configured")
             return None
         
         endpoint = f"{self.base_url}/contacts/{contact_id}"
         
         try:
-            r = requests.patch(endpoint, json=update_data, headers=self._get_headers(), timeout=15)
+            r = self._request('PATCH', endpoint, data=orjson.dumps(update_data), timeout=15)
             r.raise_for_status()
-            result = r.json()
+            result = orjson.loads(r.content)
             
             logger.info(f"AgencyZoom contact updated successfully: {contact_id}")
             return result
             
-        except requests.exceptions.RequestException as e:
+        except CircuitOpenError:
+            return None
+        except _REQUEST_ERRORS as e:
             logger.exception(f"AgencyZoom update contact failed: {e}")
             return None
     
@@ -332,7 +441,7 @@ class AgencyZoomService:
         Returns:
             Dictionary with result or None if failed
         """
-        if not self.api_key:
+        if not self._ensure_authenticated():
             logger.error("Cannot add note: AgencyZoom API key not configured")
             return None
         
@@ -344,14 +453,26 @@ class AgencyZoomService:
         }
         
         try:
-            r = requests.post(endpoint, json=payload, headers=self._get_headers(), timeout=15)
+            r = self._request('POST', endpoint, data=orjson.dumps(payload), timeout=15)
             r.raise_for_status()
-            result = r.json()
+            result = orjson.loads(r.content)
             
             logger.info(f"AgencyZoom note added to contact: {contact_id}")
             return result
             
-        except requests.exceptions.RequestException as e:
+        except CircuitOpenError:
+            return None
+        except _REQUEST_ERRORS as e:
             logger.exception(f"AgencyZoom add note failed: {e}")
             return None
 
+
+@functools.cache
+def get_agencyzoom_service() -> AgencyZoomService:
+    """Return the process-wide AgencyZoomService, authenticating on first use.
+    
+    Built lazily (not at import) so forked workers each log in after the fork
+    and only when AgencyZoom is actually needed. The instance recovers from a
+    failed first login and from token expiry on its own, so caching it is safe.
+    """
+    return AgencyZoomService()
@@ -2,13 +2,26 @@
 
 import logging
 import os
+import threading
 import time
-import requests
+import functools
+import urllib3
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
 import xmltodict
-from functools import wraps
-from typing import Optional, Dict
+from lxml import etree
+from xml.sax.saxutils import escape as _xml_escape
+from typing import Optional, Dict, List
 from dotenv import load_dotenv
+from utils.circuit_breaker import BREAKER_FAILURE_STATUSES, CircuitBreaker, CircuitOpenError
 import json
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
 load_dotenv()
 logger = logging.getLogger("telephony-agent")
 
@@ -18,81 +31,334 @@ AMS360_AGENCY_NO = os.getenv("AMS360_AGENCY_NO")
 AMS360_LOGIN_ID = os.getenv("AMS360_LOGIN_ID")
 AMS360_PASSWORD = os.getenv("AMS360_PASSWORD")
 
+# Optional Redis for sharing the login ticket across workers and restarts
+REDIS_URL = os.getenv("REDIS_URL")
+AMS360_TICKET_TTL = 15 * 60
+AMS360_TICKET_KEY = f"ams360:ticket:{AMS360_AGENCY_NO}:{AMS360_LOGIN_ID}"
+AMS360_LOGIN_LOCK_KEY = f"{AMS360_TICKET_KEY}:lock"
+AMS360_LOGIN_LOCK_TTL = 30
+AMS360_LOGIN_WAIT = 5.0
+
+# AMS360 reads (policy-number lookups, customer, customer policies, policy) are
+# cached briefly, since a call flow tends to repeat them within minutes
+AMS360_READ_CACHE_TTL = int(os.getenv("AMS360_READ_CACHE_TTL", "300"))
+
+# Compiled XPath for the first policy in a PolicyGetListByPolicyNumber response.
+# Matching on the namespace URI makes it independent of the prefixes the server uses.
+AMS360_NS = {"a": "http://www.WSAPI.AMS360.com/v3.0/DataContract"}
+_FIRST_POLICY_INFO_XPATH = etree.XPath("(//a:PolicyInfoList/a:PolicyInfo)[1]", namespaces=AMS360_NS)
+
+# Login ticket: the WSAPISession header, falling back to LoginResult in the body.
+# The union yields document order, so the header value comes first when both exist.
+_TICKET_XPATH = etree.XPath(
+    "/s:Envelope/s:Header/ws:WSAPISession/ws:Ticket/text()"
+    " | //ws:LoginResponse/ws:LoginResult/*[local-name()='Ticket']/text()",
+    namespaces={"s": "http://schemas.xmlsoap.org/soap/envelope/", "ws": "http://www.WSAPI.AMS360.com/v3.0"}
+)
+
+# PolicyInfo elements streamed out of PolicyGetListByCustomerId, and the fields kept from each
+_POLICY_INFO_TAG = f"{{{AMS360_NS['a']}}}PolicyInfo"
+POLICY_INFO_FIELDS = (
+    "CompanyType", "CustomerId", "IsMultiEntity", "PolicyEffectiveDate", "PolicyExpirationDate",
+    "PolicyId", "PolicyNumber", "PolicySubType", "PolicyTypeOfBusiness", "PolicyStatus", "WritingCompanyCode"
+)
+
+# SOAP envelopes, pre-encoded once; per call only the %b fields are filled in
+_LOGIN_TMPL = b'''<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+  <s:Body>
+    <Login xmlns="http://www.WSAPI.AMS360.com/v3.0">
+      <Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+        <a:AgencyNo>%b</a:AgencyNo>
+        <a:LoginId>%b</a:LoginId>
+        <a:Password>%b</a:Password>
+        <a:EmployeeCode/>
+      </Request>
+    </Login>
+  </s:Body>
+</s:Envelope>'''
+
+_CUSTOMER_BY_NAME_PREFIX_TMPL = b'''<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+<s:Body>
+<CustomerGetListByNamePrefix xmlns="http://www.WSAPI.AMS360.com/v3.0">
+<Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+<a:Ticket>%b</a:Ticket>
+<a:NamePrefix>%b</a:NamePrefix>
+<a:MaxRows>%b</a:MaxRows>
+</Request>
+</CustomerGetListByNamePrefix>
+</s:Body>
+</s:Envelope>'''
+
+_CUSTOMER_GET_BY_ID_TMPL = b'''<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+  <s:Header>
+    <WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
+      <Ticket>%b</Ticket>
+    </WSAPISession>
+  </s:Header>
+  <s:Body>
+    <CustomerGetById xmlns="http://www.WSAPI.AMS360.com/v3.0">
+      <Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+        <a:CustomerId>%b</a:CustomerId>
+      </Request>
+    </CustomerGetById>
+  </s:Body>
+</s:Envelope>'''
+
+_POLICY_LIST_BY_CUSTOMER_TMPL = b'''<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+  <s:Header>
+    <WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
+      <Ticket>%b</Ticket>
+    </WSAPISession>
+  </s:Header>
+  <s:Body>
+    <PolicyGetListByCustomerId xmlns="http://www.WSAPI.AMS360.com/v3.0">
+      <Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+        <a:CustomerId>%b</a:CustomerId>
+      </Request>
+    </PolicyGetListByCustomerId>
+  </s:Body>
+</s:Envelope>'''
+
+_POLICY_LIST_BY_NUMBER_TMPL = b'''<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+<s:Header>
+<WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
+<Ticket>%b</Ticket>
+</WSAPISession>
+</s:Header>
+<s:Body>
+<PolicyGetListByPolicyNumber xmlns="http://www.WSAPI.AMS360.com/v3.0">
+<Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+<a:PolicyNumber>%b</a:PolicyNumber>
+</Request>
+</PolicyGetListByPolicyNumber>
+</s:Body>
+</s:Envelope>'''
+
+_POLICY_GET_TMPL = b'''<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+<s:Header>
+<WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
+<Ticket>%b</Ticket>
+</WSAPISession>
+</s:Header>
+<s:Body>
+<PolicyGet xmlns="http://www.WSAPI.AMS360.com/v3.0">
+<Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+<a:PolicyId>%b</a:PolicyId>
+</Request>
+</PolicyGet>
+</s:Body>
+</s:Envelope>'''
+
+
+# Every call is a SOAP envelope; only SOAPAction varies per request
+_SOAP_HEADERS = {'Content-Type': 'text/xml; charset=utf-8'}
+
+
+def _b(value) -> bytes:
+    """XML-escape and encode a value for a %b slot in an envelope template."""
+    return _xml_escape(str(value)).encode('utf-8')
+
+
+# Retry transient failures with exponential backoff. Every SOAP call made here is
+# a query (or Login), so POST is safe to retry. SOAP faults arrive as HTTP 500 and
+# would fail the same way again, so 500 is not retried; a read timeout is retried
+# only once, since each attempt can take the full 20s.
+AMS360_RETRY = Retry(
+    total=5,
+    read=1,
+    backoff_factor=0.6,
+    status_forcelist=[429, 502, 503, 504],
+    allowed_methods=frozenset(['POST']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
 
 class AMS360Service:
     """Service for interacting with AMS360 SOAP API."""
     
     def __init__(self):
         """Initialize AMS360 service with session management."""
-        # Simple in-memory cache for AMS360 session token (Ticket) with expiry
+        # Simple in-memory cache for AMS360 session token (Ticket) with expiry.
+        # The service is shared process-wide, so nothing per-lookup is kept here.
         self.session = {
             'ticket': None,
-            'expires_at': 0,
-            'customer_id': None,
-            'policy_id': None
+            'expires_at': 0
         }
+        # Keep-alive connection pool reused by every SOAP call. urllib3 directly,
+        # since requests' session/adapter layers add nothing for a fixed POST
+        self.http = urllib3.PoolManager(num_pools=1, maxsize=32, retries=AMS360_RETRY)
+        # Fail fast instead of waiting out the timeout while AMS360 is down
+        self._breaker = CircuitBreaker("AMS360")
+        # Serializes logins so concurrent callers share one Login round-trip
+        self._login_lock = threading.Lock()
+        # Successful by-id lookups; guarded by a lock since lookups fan out to threads
+        self._read_cache: TTLCache = TTLCache(maxsize=1024, ttl=AMS360_READ_CACHE_TTL)
+        self._read_cache_lock = threading.Lock()
+        # Shared ticket cache; without it each process logs in on its own
+        self._redis = None
+        if REDIS_URL:
+            if redis is None:
+                raise RuntimeError("REDIS_URL is set but the 'redis' package is not installed")
+            self._redis = redis.from_url(REDIS_URL)
         logger.info("AMS360Service initialized")
     
+    def _post(self, headers: Dict[str, str], envelope: bytes, preload_content: bool = True) -> urllib3.BaseHTTPResponse:
+        """POST a SOAP envelope through the circuit breaker, raising on an HTTP error status.
+        
+        With preload_content=False the body is left unread for streaming; the
+        caller must release the connection.
+        """
+        self._breaker.before_call()
+        try:
+            r = self.http.request(
+                'POST', AMS360_BASE_URL, body=envelope, headers={**_SOAP_HEADERS, **headers},
+                timeout=20.0, preload_content=preload_content
+            )
+        except urllib3.exceptions.HTTPError:
+            self._breaker.record_failure()
+            raise
+        
+        # SOAP faults come back as plain 500s; only gateway errors mean AMS360 is down
+        if r.status in BREAKER_FAILURE_STATUSES:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        if r.status >= 400:
+            r.drain_conn()
+            raise urllib3.exceptions.HTTPError(f"AMS360 returned HTTP {r.status}")
+        return r
+    
+    def _has_valid_ticket(self) -> bool:
+        return bool(self.session['ticket']) and self.session['expires_at'] > time.time()
+    
     def _ensure_session(self):
-        """Ensure valid AMS360 session exists, logging in if necessary."""
-        now = time.time()
-        if not self.session['ticket'] or self.session['expires_at'] <= now:
+        """Ensure valid AMS360 session exists, logging in if necessary.
+        
+        Only one thread logs in; the others wait on the lock and then find the
+        fresh ticket on the second check.
+        """
+        if self._has_valid_ticket():
+            return
+        with self._login_lock:
+            if self._has_valid_ticket():
+                return
+            if self._load_shared_ticket():
+                return
             logger.info('AMS360 session missing or expired. Logging in...')
-            ok = self._login()
+            ok = self._login_once()
             if not ok:
                 raise RuntimeError('AMS360 login failed')
     
+    def _load_shared_ticket(self) -> bool:
+        """Adopt a still-valid ticket another worker stored in Redis. Returns True if one was found."""
+        if self._redis is None:
+            return False
+        try:
+            raw = self._redis.get(AMS360_TICKET_KEY)
+        except redis.RedisError as e:
+            logger.warning(f"AMS360 shared ticket lookup failed: {e}")
+            return False
+        if raw is None:
+            return False
+        
+        cached = json.loads(raw)
+        if cached['expires_at'] <= time.time():
+            return False
+        self.session['ticket'] = cached['ticket']
+        self.session['expires_at'] = cached['expires_at']
+        logger.info('AMS360 using shared session ticket')
+        return True
+    
+    def _login_once(self) -> bool:
+        """Log in, letting only one worker at a time do so when the ticket is shared.
+        
+        Workers that lose the race for the lock wait briefly for the winner's
+        ticket and fall back to logging in themselves if it does not appear.
+        """
+        if self._redis is None:
+            return self._login()
+        
+        try:
+            locked = self._redis.set(AMS360_LOGIN_LOCK_KEY, b"1", nx=True, ex=AMS360_LOGIN_LOCK_TTL)
+        except redis.RedisError as e:
+            logger.warning(f"AMS360 login lock unavailable: {e}")
+            return self._login()
+        
+        if not locked:
+            deadline = time.time() + AMS360_LOGIN_WAIT
+            while time.time() < deadline:
+                time.sleep(0.2)
+                if self._load_shared_ticket():
+                    return True
+            return self._login()
+        
+        try:
+            ok = self._login()
+            if ok:
+                self._store_shared_ticket()
+            return ok
+        finally:
+            try:
+                self._redis.delete(AMS360_LOGIN_LOCK_KEY)
+            except redis.RedisError:
+                pass
+    
+    def _store_shared_ticket(self):
+        """Publish the current ticket to Redis until it expires."""
+        try:
+            self._redis.set(
+                AMS360_TICKET_KEY,
+                json.dumps({'ticket': self.session['ticket'], 'expires_at': self.session['expires_at']}),
+                ex=AMS360_TICKET_TTL
+            )
+        except redis.RedisError as e:
+            logger.warning(f"AMS360 could not share session ticket: {e}")
+    
     def _login(self) -> bool:
         """Login to AMS360 and cache session ticket. Returns True on success."""
-        envelope = f'''<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-  <s:Body>
-    <Login xmlns="http://www.WSAPI.AMS360.com/v3.0">
-      <Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
-        <a:AgencyNo>{AMS360_AGENCY_NO}</a:AgencyNo>
-        <a:LoginId>{AMS360_LOGIN_ID}</a:LoginId>
-        <a:Password>{AMS360_PASSWORD}</a:Password>
-        <a:EmployeeCode/>
-      </Request>
-    </Login>
-  </s:Body>
-</s:Envelope>'''
+        envelope = _LOGIN_TMPL % (_b(AMS360_AGENCY_NO), _b(AMS360_LOGIN_ID), _b(AMS360_PASSWORD))
         
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
             'SOAPAction': '"http://www.WSAPI.AMS360.com/v3.0/WSAPIServiceContract/Login"'
         }
         
         try:
-            r = requests.post(AMS360_BASE_URL, data=envelope.encode('utf-8'), headers=headers, timeout=20)
-            r.raise_for_status()
-            parsed = xmltodict.parse(r.text)
-            
-            # Safe navigation to find Ticket value — adjust if response differs
-            ticket = None
-            try:
-                ticket = parsed['s:Envelope']['s:Header']['WSAPISession']['Ticket']
-            except Exception:
-                # Try alternative paths
-                try:
-                    ticket = parsed['Envelope']['Body']['LoginResponse']['LoginResult']['Ticket']
-                except Exception:
-                    ticket = None
+            r = self._post(headers, envelope)
+            tickets = _TICKET_XPATH(etree.fromstring(r.data))
+            ticket = str(tickets[0]) if tickets else None
             
             if not ticket:
                 logger.error('AMS360 login: ticket not found in response')
-                logger.debug('Raw response: %s', r.text)
+                logger.debug('Raw response: %s', r.data)
                 return False
             
             # Ticket validity unknown — set short expiry (15 minutes)
             self.session['ticket'] = ticket
-            self.session['expires_at'] = time.time() + (15 * 60)
+            self.session['expires_at'] = time.time() + AMS360_TICKET_TTL
             logger.info('AMS360 login successful, ticket cached')
             return True
             
+        except CircuitOpenError:
+            return False
         except Exception as e:
             logger.exception('AMS360 login failed: %s', e)
             return False
     
+    def _get_cached(self, key: tuple):
+        """Return a cached lookup result, or None on a miss."""
+        with self._read_cache_lock:
+            return self._read_cache.get(key)
+    
+    def _set_cached(self, key: tuple, value):
+        """Cache a lookup result; failed lookups (None) are not cached."""
+        if value is not None:
+            with self._read_cache_lock:
+                self._read_cache[key] = value
+    
     def search_customer_by_phone(self, phone: str, max_rows: int = 5) -> Optional[Dict]:
         """Search customer by phone number. Returns parsed result or None.
         
@@ -108,32 +374,21 @@ class AMS360Service:
         # Note: AMS360 may not have a direct "get by phone" method.
         # This example demonstrates CustomerGetListByNamePrefix.
         # Adapt this to your specific AMS360 SOAP method for phone search.
-        envelope = f'''<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-<s:Body>
-<CustomerGetListByNamePrefix xmlns="http://www.WSAPI.AMS360.com/v3.0">
-<Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
-<a:Ticket>{self.session['ticket']}</a:Ticket>
-<a:NamePrefix>{phone}</a:NamePrefix>
-<a:MaxRows>{max_rows}</a:MaxRows>
-</Request>
-</CustomerGetListByNamePrefix>
-</s:Body>
-</s:Envelope>'''
+        envelope = _CUSTOMER_BY_NAME_PREFIX_TMPL % (_b(self.session['ticket']), _b(phone), _b(max_rows))
         
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
             'SOAPAction': '"http://www.WSAPI.AMS360.com/v3.0/WSAPIServiceContract/CustomerGetListByNamePrefix"'
         }
         
         try:
-            r = requests.post(AMS360_BASE_URL, data=envelope.encode('utf-8'), headers=headers, timeout=20)
-            r.raise_for_status()
-            parsed = xmltodict.parse(r.text)
+            r = self._post(headers, envelope)
+            parsed = xmltodict.parse(r.data)
             
             logger.info(f"AMS360 customer search by phone completed: {phone}")
             return parsed
             
+        except CircuitOpenError:
+            return None
         except Exception as e:
             logger.exception(f'AMS360 customer search failed: {e}')
             return None
@@ -150,32 +405,21 @@ class AMS360Service:
         """
         self._ensure_session()
         
-        envelope = f'''<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-<s:Body>
-<CustomerGetListByNamePrefix xmlns="http://www.WSAPI.AMS360.com/v3.0">
-<Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
-<a:Ticket>{self.session['ticket']}</a:Ticket>
-<a:NamePrefix>{name_prefix}</a:NamePrefix>
-<a:MaxRows>{max_rows}</a:MaxRows>
-</Request>
-</CustomerGetListByNamePrefix>
-</s:Body>
-</s:Envelope>'''
+        envelope = _CUSTOMER_BY_NAME_PREFIX_TMPL % (_b(self.session['ticket']), _b(name_prefix), _b(max_rows))
         
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
             'SOAPAction': '"http://www.WSAPI.AMS360.com/v3.0/WSAPIServiceContract/CustomerGetListByNamePrefix"'
         }
         
         try:
-            r = requests.post(AMS360_BASE_URL, data=envelope.encode('utf-8'), headers=headers, timeout=20)
-            r.raise_for_status()
-            parsed = xmltodict.parse(r.text)
+            r = self._post(headers, envelope)
+            parsed = xmltodict.parse(r.data)
             
             logger.info(f"AMS360 customer search by name completed: {name_prefix}")
             return parsed
             
+        except CircuitOpenError:
+            return None
         except Exception as e:
             logger.exception(f'AMS360 customer search by name failed: {e}')
             return None
@@ -190,214 +434,194 @@ class AMS360Service:
         Returns:
             Dictionary with customer policies or None if failed
         """
+        cache_key = ('get_customer_details', customer_id)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         self._ensure_session()
         
-        envelope = f'''<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-  <s:Header>
-    <WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
-      <Ticket>{self.session['ticket']}</Ticket>
-    </WSAPISession>
-  </s:Header>
-  <s:Body>
-    <CustomerGetById xmlns="http://www.WSAPI.AMS360.com/v3.0">
-      <Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
-        <a:CustomerId>{customer_id}</a:CustomerId>
-      </Request>
-    </CustomerGetById>
-  </s:Body>
-</s:Envelope>'''
+        envelope = _CUSTOMER_GET_BY_ID_TMPL % (_b(self.session['ticket']), _b(customer_id))
         
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
             'SOAPAction': 'http://www.WSAPI.AMS360.com/v3.0/WSAPIServiceContract/CustomerGetById'
         }
         
         try:
-            r = requests.post(AMS360_BASE_URL, data=envelope.encode('utf-8'), headers=headers, timeout=20)
-            r.raise_for_status()
-            parsed = xmltodict.parse(r.text)
+            r = self._post(headers, envelope)
+            parsed = xmltodict.parse(r.data)
             
             logger.info(f"AMS360 customer details retrieved for customer: {customer_id}")
+            self._set_cached(cache_key, parsed)
             return parsed
             
+        except CircuitOpenError:
+            return None
         except Exception as e:
             logger.exception(f'AMS360 get customer policies failed: {e}')
             return None
     
-    def get_customer_policies(self, customer_id: str) -> Optional[Dict]:
-        """Get policies for a specific customer. Returns parsed result or None.
+    def get_customer_policy_list(self, customer_id: str) -> Optional[List[Dict]]:
+        """Get a customer's policies as flat summaries. Returns a list or None.
+        
+        The response is streamed through iterparse and each PolicyInfo is
+        discarded once read, so memory stays flat however many policies the
+        customer has.
         
         Args:
             customer_id: The customer ID to retrieve policies for
             
         Returns:
-            Dictionary with customer policies or None if failed
+            List of dictionaries keyed by POLICY_INFO_FIELDS, or None if failed
         """
+        cache_key = ('get_customer_policy_list', customer_id)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         self._ensure_session()
         
-        envelope = f'''<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-  <s:Header>
-    <WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
-      <Ticket>{self.session['ticket']}</Ticket>
-    </WSAPISession>
-  </s:Header>
-  <s:Body>
-    <PolicyGetListByCustomerId xmlns="http://www.WSAPI.AMS360.com/v3.0">
-      <Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
-        <a:CustomerId>{customer_id}</a:CustomerId>
-      </Request>
-    </PolicyGetListByCustomerId>
-  </s:Body>
-</s:Envelope>'''
+        envelope = _POLICY_LIST_BY_CUSTOMER_TMPL % (_b(self.session['ticket']), _b(customer_id))
         
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
             'SOAPAction': 'http://www.WSAPI.AMS360.com/v3.0/WSAPIServiceContract/PolicyGetListByCustomerId'
         }
         
         try:
-            r = requests.post(AMS360_BASE_URL, data=envelope.encode('utf-8'), headers=headers, timeout=20)
-            r.raise_for_status()
-            parsed = xmltodict.parse(r.text)
+            r = self._post(headers, envelope, preload_content=False)
+            try:
+                policies = []
+                for _, elem in etree.iterparse(r, tag=_POLICY_INFO_TAG):
+                    values = {etree.QName(child).localname: child.text for child in elem}
+                    policies.append({field: values.get(field) for field in POLICY_INFO_FIELDS})
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            finally:
+                r.release_conn()
             
-            logger.info(f"AMS360 policies retrieved for customer: {customer_id}")
-            return parsed
+            logger.info(f"AMS360 {len(policies)} policies streamed for customer: {customer_id}")
+            self._set_cached(cache_key, policies)
+            return policies
             
+        except CircuitOpenError:
+            return None
         except Exception as e:
-            logger.exception(f'AMS360 get customer policies failed: {e}')
+            logger.exception(f'AMS360 get customer policy list failed: {e}')
             return None
     
-    def get_policy_by_number(self, policy_number: str) -> Optional[Dict]:
-        """Get policy information by policy number and store customer_id and policy_id in session.
+    def get_policy_by_number(self, policy_number: str) -> Optional[tuple]:
+        """Get policy information by policy number, with its policy details, customer policies and customer details.
         
         Args:
             policy_number: The policy number to search for
             
         Returns:
-            Dictionary with policy list results or None if failed
+            (policy details, customer policies, customer details) tuple or None if failed
         """
-        self._ensure_session()
+        # Only the ids are cached here; the follow-up lookups have their own entries
+        # and log in only on a miss
+        cache_key = ('get_policy_by_number', policy_number)
+        ids = self._get_cached(cache_key)
+        if ids is None:
+            self._ensure_session()
+            ids = self._lookup_policy_ids(policy_number)
+            if ids is None:
+                return None
+            self._set_cached(cache_key, ids)
         
-        envelope = f'''<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-<s:Header>
-<WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
-<Ticket>{self.session['ticket']}</Ticket>
-</WSAPISession>
-</s:Header>
-<s:Body>
-<PolicyGetListByPolicyNumber xmlns="http://www.WSAPI.AMS360.com/v3.0">
-<Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
-<a:PolicyNumber>{policy_number}</a:PolicyNumber>
-</Request>
-</PolicyGetListByPolicyNumber>
-</s:Body>
-</s:Envelope>'''
+        customer_id, policy_id = ids
+        # The three follow-up lookups are independent; run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            f1 = executor.submit(self.get_policy_details, policy_id)
+            f2 = executor.submit(self.get_customer_policy_list, customer_id)
+            f3 = executor.submit(self.get_customer_details, customer_id)
+            parsed1, parsed2, parsed3 = f1.result(), f2.result(), f3.result()
+        logger.info(f"AMS360 policy lookup by number completed: {policy_number}")
+        return parsed1, parsed2, parsed3
+    
+    def _lookup_policy_ids(self, policy_number: str) -> Optional[tuple]:
+        """Resolve a policy number to the (customer_id, policy_id) of its first match, or None."""
+        envelope = _POLICY_LIST_BY_NUMBER_TMPL % (_b(self.session['ticket']), _b(policy_number))
         
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
             'SOAPAction': '"http://www.WSAPI.AMS360.com/v3.0/WSAPIServiceContract/PolicyGetListByPolicyNumber"'
         }
         
         try:
-            r = requests.post(AMS360_BASE_URL, data=envelope.encode('utf-8'), headers=headers, timeout=20)
-            r.raise_for_status()
-            parsed = xmltodict.parse(r.text)
-            
-            # Extract and store customer_id and policy_id in session
-            try:
-                # Navigate through the XML structure to find IDs
-                policy_result = parsed.get('s:Envelope', {}).get('s:Body', {}).get('PolicyGetListByPolicyNumberResponse', {})
-                if not policy_result:
-                    # Try alternative path
-                    policy_result = parsed.get('Envelope', {}).get('Body', {}).get('PolicyGetListByPolicyNumberResponse', {})
-                
-                result_data = policy_result.get('PolicyGetListByPolicyNumberResult', {})
-                policy_list = result_data.get('a:PolicyInfoList', {}).get('a:PolicyInfo', {})
-                
-                # Handle if policy_list is a list (multiple results) or dict (single result)
-                if isinstance(policy_list, list):
-                    policy_data = policy_list[0] if policy_list else {}
-                else:
-                    policy_data = policy_list
-                
-                customer_id = policy_data.get('a:CustomerId')
-                policy_id = policy_data.get('a:PolicyId')
-                
-                if customer_id and policy_id:
-                    self.session['customer_id'] = customer_id
-                    self.session['policy_id'] = policy_id
-                    logger.info(f"AMS360 stored customer_id: {customer_id}, policy_id: {policy_id}")
-                    parsed1 = self.get_policy_details(policy_id)
-                    parsed2=self.get_customer_policies(customer_id)
-                    parsed3=self.get_customer_details(customer_id)
-                    json.dumps(parsed1,indent=4)
-                    json.dumps(parsed2,indent=4)
-                    json.dumps(parsed3,indent=4)
-                    return parsed1,parsed2,parsed3
-                else:
-                    logger.warning("AMS360 could not extract policy_id from response")
-                    return None
-            except Exception as e:
-                logger.warning(f"AMS360 failed to extract policy_id from policy response: {e}")
-                return None
-            
-            logger.info(f"AMS360 policy lookup by number completed: {policy_number}")
+            r = self._post(headers, envelope)
+        except CircuitOpenError:
             return None
-            
         except Exception as e:
             logger.exception(f'AMS360 get policy by number failed: {e}')
             return None
+        
+        try:
+            # Pull the IDs of the first matching policy straight from the SOAP body
+            matches = _FIRST_POLICY_INFO_XPATH(etree.fromstring(r.data))
+            policy_data = matches[0] if matches else None
+            
+            customer_id = policy_data.findtext('a:CustomerId', namespaces=AMS360_NS) if policy_data is not None else None
+            policy_id = policy_data.findtext('a:PolicyId', namespaces=AMS360_NS) if policy_data is not None else None
+        except Exception as e:
+            logger.warning(f"AMS360 failed to extract policy_id from policy response: {e}")
+            return None
+        
+        if not (customer_id and policy_id):
+            logger.warning("AMS360 could not extract policy_id from response")
+            return None
+        
+        logger.info(f"AMS360 found customer_id: {customer_id}, policy_id: {policy_id}")
+        return customer_id, policy_id
     
-    def get_policy_details(self, policy_id: str = None) -> Optional[Dict]:
-        """Get detailed policy information using customer_id and policy_id.
+    def get_policy_details(self, policy_id: str) -> Optional[Dict]:
+        """Get detailed policy information by policy ID.
         
         Args:
-            policy_id: The policy ID (uses session value if not provided)
+            policy_id: The policy ID
             
         Returns:
             Dictionary with detailed policy information or None if failed
         """
-        self._ensure_session()
-        
-        # Use provided IDs or fall back to session values
-        pol_id = policy_id or self.session.get('policy_id')
-        
-        if not pol_id:
+        if not policy_id:
             logger.error("AMS360 get_policy_details: policy_id is required")
             return None
         
-        envelope = f'''<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-<s:Header>
-<WSAPISession xmlns="http://www.WSAPI.AMS360.com/v3.0">
-<Ticket>{self.session['ticket']}</Ticket>
-</WSAPISession>
-</s:Header>
-<s:Body>
-<PolicyGet xmlns="http://www.WSAPI.AMS360.com/v3.0">
-<Request xmlns:a="http://www.WSAPI.AMS360.com/v3.0/DataContract" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
-<a:PolicyId>{pol_id}</a:PolicyId>
-</Request>
-</PolicyGet>
-</s:Body>
-</s:Envelope>'''
+        cache_key = ('get_policy_details', policy_id)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        self._ensure_session()
+        
+        envelope = _POLICY_GET_TMPL % (_b(self.session['ticket']), _b(policy_id))
         
         headers = {
-            'Content-Type': 'text/xml; charset=utf-8',
             'SOAPAction': '"http://www.WSAPI.AMS360.com/v3.0/WSAPIServiceContract/PolicyGet"'
         }
         
         try:
-            r = requests.post(AMS360_BASE_URL, data=envelope.encode('utf-8'), headers=headers, timeout=20)
-            r.raise_for_status()
-            parsed = xmltodict.parse(r.text)
+            r = self._post(headers, envelope)
+            parsed = xmltodict.parse(r.data)
             
-            logger.info(f"AMS360 detailed policy info retrieved for customer: policy: {pol_id}")
-            logger.info(json.dumps(parsed,indent=4))
+            logger.info(f"AMS360 detailed policy info retrieved for customer: policy: {policy_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("AMS360 policy details: %s", json.dumps(parsed, indent=4))
+            self._set_cached(cache_key, parsed)
             return parsed
             
+        except CircuitOpenError:
+            return None
         except Exception as e:
             logger.exception(f'AMS360 get policy details failed: {e}')
             return None
 
+
+@functools.cache
+def get_ams360_service() -> AMS360Service:
+    """Return the process-wide AMS360Service.
+    
+    The session ticket and connection pool are shared, so only the first call
+    pays for the login and TLS handshake.
+    """
+    return AMS360Service()
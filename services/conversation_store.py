@@ -0,0 +1,152 @@
+"""Bounded conversation history store for the chatbot (Redis with in-memory fallback)."""
+
+import logging
+import os
+from typing import Dict, List, Optional
+
+import orjson
+from cachetools import TTLCache
+from dotenv import load_dotenv
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+load_dotenv()
+logger = logging.getLogger("unified-api")
+
+# Conversation store configuration from environment variables
+REDIS_URL = os.getenv("REDIS_URL")
+CONVERSATION_MAX_MESSAGES = int(os.getenv("CONVERSATION_MAX_MESSAGES", "64"))
+CONVERSATION_TTL_SECONDS = int(os.getenv("CONVERSATION_TTL_SECONDS", "3600"))
+CONVERSATION_MAX_LOCAL_THREADS = int(os.getenv("CONVERSATION_MAX_LOCAL_THREADS", "1024"))
+
+
+def trim_messages(messages: List[Dict], max_messages: int) -> List[Dict]:
+    """
+    Cap a conversation at max_messages while keeping it valid for the OpenAI API.
+
+    The leading system messages are always kept. The remaining window starts at a
+    user message so an assistant tool call is never separated from its tool results.
+
+    Args:
+        messages: Full conversation history
+        max_messages: Maximum number of non-system messages to keep
+
+    Returns:
+        Trimmed conversation history
+    """
+    prefix_len = 0
+    while prefix_len < len(messages) and messages[prefix_len]["role"] == "system":
+        prefix_len += 1
+
+    history = messages[prefix_len:]
+    if len(history) <= max_messages:
+        return messages
+
+    window = history[-max_messages:]
+    start = next((i for i, message in enumerate(window) if message["role"] == "user"), len(window))
+    return messages[:prefix_len] + window[start:]
+
+
+class ConversationStore:
+    """
+    Stores conversation threads and their escalation state in Redis, or in bounded
+    local caches when REDIS_URL is not set.
+
+    With Redis every API worker sees the same history and handover status, so
+    the app can run with several uvicorn workers.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = REDIS_URL,
+        max_messages: int = CONVERSATION_MAX_MESSAGES,
+        ttl_seconds: int = CONVERSATION_TTL_SECONDS,
+        max_local_threads: int = CONVERSATION_MAX_LOCAL_THREADS
+    ):
+        """Initialize the conversation store."""
+        self.max_messages = max_messages
+        self.ttl_seconds = ttl_seconds
+        self._redis = None
+        self._local: TTLCache = TTLCache(maxsize=max_local_threads, ttl=ttl_seconds)
+        self._local_escalations: TTLCache = TTLCache(maxsize=max_local_threads, ttl=ttl_seconds)
+
+        if redis_url:
+            if redis is None:
+                raise RuntimeError("REDIS_URL is set but the 'redis' package is not installed")
+            self._redis = redis.from_url(redis_url)
+            logger.info("Conversation store using Redis")
+        else:
+            logger.info(f"Conversation store using local cache (max {max_local_threads} threads)")
+
+    @property
+    def backend(self) -> str:
+        """Name of the active storage backend."""
+        return "redis" if self._redis is not None else "memory"
+
+    @staticmethod
+    def _key(thread_id: str) -> str:
+        return f"chat:thread:{thread_id}"
+
+    @staticmethod
+    def _escalation_key(thread_id: str) -> str:
+        return f"chat:escalation:{thread_id}"
+
+    async def get(self, thread_id: str) -> Optional[List[Dict]]:
+        """Return the messages of a thread, or None if the thread does not exist."""
+        if self._redis is None:
+            messages = self._local.get(thread_id)
+            return list(messages) if messages is not None else None
+
+        data = await self._redis.get(self._key(thread_id))
+        return orjson.loads(data) if data is not None else None
+
+    async def save(self, thread_id: str, messages: List[Dict]) -> List[Dict]:
+        """Trim and persist the messages of a thread, refreshing its TTL."""
+        trimmed = trim_messages(messages, self.max_messages)
+        if len(trimmed) < len(messages):
+            logger.info(f"History trimmed for thread {thread_id}: {len(messages)} -> {len(trimmed)} messages")
+        messages = trimmed
+        if self._redis is None:
+            self._local[thread_id] = messages
+        else:
+            await self._redis.set(self._key(thread_id), orjson.dumps(messages), ex=self.ttl_seconds)
+        return messages
+
+    async def delete(self, thread_id: str) -> bool:
+        """Delete a thread. Returns True if it existed."""
+        if self._redis is None:
+            return self._local.pop(thread_id, None) is not None
+        return bool(await self._redis.delete(self._key(thread_id)))
+
+    async def get_escalation(self, thread_id: str) -> Optional[Dict]:
+        """Return the escalation state of a thread, or None if it is not escalated."""
+        if self._redis is None:
+            return self._local_escalations.get(thread_id)
+
+        data = await self._redis.get(self._escalation_key(thread_id))
+        return orjson.loads(data) if data is not None else None
+
+    async def set_escalation(self, thread_id: str, state: Dict):
+        """Record the escalation state of a thread (expires with the thread's TTL)."""
+        if self._redis is None:
+            self._local_escalations[thread_id] = state
+        else:
+            await self._redis.set(self._escalation_key(thread_id), orjson.dumps(state), ex=self.ttl_seconds)
+
+    async def clear_escalation(self, thread_id: str) -> bool:
+        """Clear the escalation state of a thread. Returns True if it was escalated."""
+        if self._redis is None:
+            return self._local_escalations.pop(thread_id, None) is not None
+        return bool(await self._redis.delete(self._escalation_key(thread_id)))
+
+    def local_thread_count(self) -> Optional[int]:
+        """Number of threads held in this process, or None when Redis is the backend."""
+        return len(self._local) if self._redis is None else None
+
+    async def close(self):
+        """Close the Redis connection, if any."""
+        if self._redis is not None:
+            await self._redis.aclose()
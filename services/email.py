@@ -3,6 +3,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
 import logging
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,7 +12,7 @@ logger = logging.getLogger("telephony-agent")
 
 
 class EmailService:
-    """Service class for sending emails via SMTP."""
+    """Service class for sending emails via SMTP over one persistent, authenticated connection."""
     
     def __init__(self, sender_email=None, app_password=None, smtp_server="smtp.gmail.com", smtp_port=465):
         """
@@ -30,6 +31,44 @@ class EmailService:
         
         if not self.sender_email or not self.app_password:
             raise ValueError("Email credentials not provided. Set EMAIL_ADDRESS and EMAIL_PASSWORD environment variables.")
+        
+        # Opened on first send and reused; the lock serializes use of the connection
+        self._smtp = None
+        self._lock = threading.Lock()
+    
+    def _connect(self):
+        """Open and authenticate a new SMTP connection."""
+        server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        server.login(self.sender_email, self.app_password)
+        return server
+    
+    def _send(self, msg):
+        """Send msg on the shared connection, reconnecting once if the server dropped it."""
+        with self._lock:
+            if self._smtp is None:
+                self._smtp = self._connect()
+            try:
+                self._smtp.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+                # An idle session timed out by the server is answered with 421
+                # (raised as e.g. SMTPSenderRefused) and then closed
+                if isinstance(e, smtplib.SMTPResponseException) and e.smtp_code != 421:
+                    raise
+                logger.info(f"SMTP connection closed by server ({e}), reconnecting")
+                self._smtp.close()
+                self._smtp = None
+                self._smtp = self._connect()
+                self._smtp.send_message(msg)
+    
+    def close(self):
+        """Close the shared SMTP connection, if open."""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except smtplib.SMTPException:
+                    pass
+                self._smtp = None
     
     def send_email(self, receiver_email, subject, body, is_html=False):
         """
@@ -55,10 +94,8 @@ class EmailService:
             content_type = "html" if is_html else "plain"
             msg.attach(MIMEText(body, content_type))
             
-            # Connect and send
-            with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as server:
-                server.login(self.sender_email, self.app_password)
-                server.send_message(msg)
+            # Send on the persistent connection
+            self._send(msg)
             
             logger.info(f"Email sent successfully to {receiver_email}")
             return True
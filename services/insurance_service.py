@@ -1,16 +1,22 @@
 """Insurance service for handling insurance data collection and submission."""
 
+import atexit
+import itertools
 import logging
-import json
+import orjson
 import os
+import queue
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional, Dict, TYPE_CHECKING
-from datetime import datetime
+from typing import Optional, Dict, Tuple, TYPE_CHECKING
+from datetime import date, datetime
 
-from models.model import (
+from models.insurance import (
     HomeInsurance, AutoInsurance, FloodInsurance, LifeInsurance, CommercialInsurance,
     Person, ContactInfo, PolicyInfo, PropertyDetails, Driver, Vehicle,
-    BusinessDetails, CoverageDetails, QuoteRequest, CoverageType, PolicyType, Address
+    BusinessDetails, CoverageDetails, QUOTE_ADAPTER, Address
 )
 
 if TYPE_CHECKING:
@@ -22,10 +28,270 @@ logger = logging.getLogger("telephony-agent")
 INSURANCE_DATA_DIR = Path("insurance_requests")
 INSURANCE_DATA_DIR.mkdir(exist_ok=True)
 
+# Accepted set_user_action values
+_ACTIONS = frozenset(("add", "update"))
+_INSURANCE_TYPES = frozenset(("home", "auto", "flood", "life", "commercial"))
+
+# Session ids count up from the process start time, so they stay unique even for
+# sessions started within the same second
+_SESSION_COUNTER = itertools.count(int(time.time()))
+
+_orjson_dumps = orjson.dumps
+
+
+def _dumps_str(obj) -> str:
+    """Compact JSON text for log lines; non-JSON values fall back to str()."""
+    return _orjson_dumps(obj, default=str).decode()
+
+
+# Whether collect_* also writes a snapshot file; the SUBMITTED_ file is always written
+INSURANCE_SAVE_INTERMEDIATE = os.getenv("INSURANCE_SAVE_INTERMEDIATE", "0") == "1"
+
+# Request files are written by one background thread so the callers (async
+# agent and API handlers) never block on disk I/O; payloads arrive pre-serialized
+_write_queue: "queue.Queue[Tuple[Path, bytes]]" = queue.Queue()
+
+
+def _file_writer():
+    """Write queued (filepath, payload) pairs to disk, one at a time."""
+    while True:
+        filepath, payload = _write_queue.get()
+        try:
+            # One write to a temp file, then an atomic rename; no fsync, these
+            # files are not durability-critical
+            tmp_path = filepath.with_name(filepath.name + ".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, filepath)
+            logger.info(f"Successfully saved data to: {filepath.absolute()} ({len(payload)} bytes)")
+        except Exception as e:
+            logger.error(f"Failed to save data to {filepath.name}: {str(e)}", exc_info=True)
+        finally:
+            _write_queue.task_done()
+
+
+threading.Thread(target=_file_writer, name="insurance-file-writer", daemon=True).start()
+# Flush pending writes before the interpreter exits
+atexit.register(_write_queue.join)
+
+
+# Separators, dots and shell/Windows-special characters become '_', so caller-supplied
+# names cannot leave INSURANCE_DATA_DIR
+_SAFE_FILENAME = str.maketrans({c: "_" for c in ' /\\:.*?"<>|\t\n\r'})
+
+
+def _safe_name(name: str) -> str:
+    """Make a caller-supplied name safe to embed in a file name (max 64 chars)."""
+    return name.translate(_SAFE_FILENAME)[:64]
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse a YYYY-MM-DD date with the C fromisoformat fast path; None for empty input."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a 'YYYY-MM-DD HH:MM' datetime with the C fromisoformat fast path; None for empty input."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M")
+
+
+# Stands in for a missing email where one is required (life/commercial contacts, CRM leads)
+NO_EMAIL_PLACEHOLDER = "noemail@pending.com"
+
+
+def _address(street_address: str, city: str, state: str, country: str, zip_code: str) -> Address:
+    return Address(streetAddress=street_address, city=city, state=state, country=country, zip_code=zip_code)
+
+
+def _contact(phone: str, email: str) -> ContactInfo:
+    # TypedDict: a plain dict, validated once by the enclosing insurance model
+    return ContactInfo(phone=phone, email=email)
+
+
+def _policy_info(current_provider, renewal_date, renewal_premium) -> PolicyInfo:
+    return PolicyInfo(
+        current_provider=current_provider,
+        renewal_date=_parse_date(renewal_date),
+        renewal_premium=renewal_premium
+    )
+
+
+def _build_home(*, full_name, date_of_birth, phone, street_address, city, state, country, zip_code, email,
+                current_provider, spouse_name, spouse_dob, has_solar_panels, has_pool, roof_age, has_pets,
+                renewal_date, renewal_premium) -> HomeInsurance:
+    spouse = None
+    if spouse_name and spouse_dob:
+        spouse = Person(full_name=spouse_name, date_of_birth=_parse_date(spouse_dob))
+    
+    return HomeInsurance(
+        primary_insured=Person(full_name=full_name, date_of_birth=_parse_date(date_of_birth)),
+        spouse=spouse,
+        property=PropertyDetails(
+            address=_address(street_address, city, state, country, zip_code),
+            has_solar_panels=has_solar_panels,
+            has_pool=has_pool,
+            roof_age=roof_age
+        ),
+        has_pets=has_pets,
+        current_policy=_policy_info(current_provider, renewal_date, renewal_premium),
+        contact=_contact(phone, email)
+    )
+
+
+def _build_auto(*, driver_name, driver_dob, phone, license_number, vin, vehicle_make, vehicle_model,
+                coverage_type, email, qualification, profession, gpa, current_provider, renewal_date,
+                renewal_premium) -> AutoInsurance:
+    driver = Driver(
+        full_name=driver_name,
+        date_of_birth=_parse_date(driver_dob),
+        license_number=license_number,
+        qualification=qualification,
+        profession=profession,
+        gpa=gpa
+    )
+    vehicle = Vehicle(vin=vin, make=vehicle_make, model=vehicle_model, coverage_type=coverage_type)
+    
+    return AutoInsurance(
+        drivers=[driver],
+        vehicles=[vehicle],
+        current_policy=_policy_info(current_provider, renewal_date, renewal_premium),
+        contact=_contact(phone, email)
+    )
+
+
+def _build_flood(*, full_name, email, phone, street_address, city, state, country, zip_code) -> FloodInsurance:
+    return FloodInsurance(
+        home_address=_address(street_address, city, state, country, zip_code),
+        full_name=full_name,
+        phone=phone,
+        email=email
+    )
+
+
+def _build_life(*, full_name, date_of_birth, phone, street_address, city, state, country, zip_code, email,
+                appointment_requested, appointment_date, policy_type) -> LifeInsurance:
+    return LifeInsurance(
+        insured=Person(full_name=full_name, date_of_birth=_parse_date(date_of_birth)),
+        address=_address(street_address, city, state, country, zip_code),
+        appointment_requested=appointment_requested,
+        appointment_date=_parse_datetime(appointment_date),
+        contact=_contact(phone, email or NO_EMAIL_PLACEHOLDER),
+        policy_type=policy_type or None
+    )
+
+
+def _build_commercial(*, business_name, phone, street_address, city, state, country, zip_code, business_type,
+                      inventory_limit, building_coverage, building_coverage_limit, current_provider,
+                      renewal_date, renewal_premium, email) -> CommercialInsurance:
+    return CommercialInsurance(
+        business=BusinessDetails(
+            name=business_name,
+            type=business_type,
+            address=_address(street_address, city, state, country, zip_code)
+        ),
+        coverage=CoverageDetails(
+            inventory_limit=inventory_limit,
+            building_coverage=building_coverage,
+            building_coverage_limit=building_coverage_limit
+        ),
+        current_policy=_policy_info(current_provider, renewal_date, renewal_premium),
+        contact=_contact(phone, email or NO_EMAIL_PLACEHOLDER)
+    )
+
+
+# Insurance type -> (model builder, field naming the file, confirmation opener)
+_COLLECTORS = {
+    "home": (_build_home, "full_name", "Perfect!"),
+    "auto": (_build_auto, "driver_name", "Excellent!"),
+    "flood": (_build_flood, "full_name", "Perfect!"),
+    "life": (_build_life, "full_name", "Great!"),
+    "commercial": (_build_commercial, "business_name", "Excellent!"),
+}
+
+
+def _split_name(full_name: str) -> Tuple[str, str]:
+    first_name, _, last_name = full_name.partition(" ")
+    return first_name, last_name
+
+
+def _no_name(insurance_data: Dict) -> Tuple[str, str]:
+    return "", ""
+
+
+_ADDRESS_FORMAT = "{streetAddress}, {city}, {state} {zip_code}".format_map
+
+
+def _format_address(address: Dict) -> str:
+    # Missing keys render as "" through the defaultdict, in one C-level format call
+    return _ADDRESS_FORMAT(defaultdict(str, address or {}))
+
+
+# Insurance type -> (first_name, last_name) of the lead; commercial leads use the business name
+_LEAD_NAME = {
+    "home": lambda d: _split_name(d.get("primary_insured", {}).get("full_name", "")),
+    "auto": lambda d: _split_name((d.get("drivers") or [{}])[0].get("full_name", "")),
+    "flood": lambda d: _split_name(d.get("full_name", "")),
+    "life": lambda d: _split_name(d.get("insured", {}).get("full_name", "")),
+    "commercial": lambda d: (d.get("business", {}).get("name", ""), ""),
+}
+
+
+def _home_lead_fields(insurance_data: Dict, lead_data: Dict):
+    lead_data["property_address"] = _format_address(insurance_data.get("property", {}).get("address", {}))
+    lead_data["current_provider"] = insurance_data.get("current_policy", {}).get("current_provider", "")
+
+
+def _auto_lead_fields(insurance_data: Dict, lead_data: Dict):
+    vehicles = insurance_data.get("vehicles", [])
+    if vehicles:
+        lead_data["vehicle_info"] = f"{vehicles[0].get('make', '')} {vehicles[0].get('model', '')}"
+    lead_data["current_provider"] = insurance_data.get("current_policy", {}).get("current_provider", "")
+
+
+def _flood_lead_fields(insurance_data: Dict, lead_data: Dict):
+    lead_data["home_address"] = _format_address(insurance_data.get("home_address", {}))
+
+
+def _life_lead_fields(insurance_data: Dict, lead_data: Dict):
+    lead_data["address"] = _format_address(insurance_data.get("address", {}))
+    lead_data["appointment_requested"] = insurance_data.get("appointment_requested", False)
+
+
+def _commercial_lead_fields(insurance_data: Dict, lead_data: Dict):
+    business = insurance_data.get("business", {})
+    lead_data["business_name"] = business.get("name", "")
+    lead_data["business_address"] = _format_address(business.get("address", {}))
+
+
+# Insurance type -> function adding its type-specific fields to an AgencyZoom lead
+_LEAD_EXTRA_FIELDS = {
+    "home": _home_lead_fields,
+    "auto": _auto_lead_fields,
+    "flood": _flood_lead_fields,
+    "life": _life_lead_fields,
+    "commercial": _commercial_lead_fields,
+}
+
 
 class InsuranceService:
     """Service for managing insurance quote collection and submission."""
     
+    # One instance per call/chat session; slots drop the per-instance __dict__
+    __slots__ = (
+        "user_action", "insurance_type", "collected_data", "quote_submitted",
+        "session_id_int", "session_id", "agencyzoom_service", "_last_saved",
+        "_payload_bytes"
+    )
+    
     def __init__(self, agencyzoom_service: Optional['AgencyZoomService'] = None):
         """Initialize the insurance service.
         
@@ -36,29 +302,49 @@ class InsuranceService:
         self.insurance_type: Optional[str] = None  # "home", "auto", "flood", "life", "commercial"
         self.collected_data: Dict = {}  # Store collected information
         self.quote_submitted: bool = False
-        self.session_id: str = datetime.now().strftime("%Y%m%d_%H%M%S")  # Unique session ID
+        self.session_id_int: int = next(_SESSION_COUNTER)
+        self.session_id: str = f"{self.session_id_int:x}"  # Unique session ID
         self.agencyzoom_service = agencyzoom_service
+        self._last_saved: Dict[str, bytes] = {}  # filename -> bytes last queued for it
+        self._payload_bytes: Dict[str, bytes] = {}  # collected_data key -> compact JSON of that section
         logger.info(f"InsuranceService initialized with session_id: {self.session_id}")
     
     def _save_to_json(self, data: Dict, filename: str) -> bool:
-        """Save data to a JSON file.
+        """Serialize data and queue it to be written to a JSON file in the background.
         
         Args:
             data: Dictionary data to save
             filename: Name of the file (without path)
             
         Returns:
-            True if successful, False otherwise
+            True if the data was serialized and queued, False otherwise
         """
         try:
-            filepath = INSURANCE_DATA_DIR / filename
-            logger.info(f"Attempting to save data to: {filepath.absolute()}")
+            payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            return self._save_bytes(payload, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"Failed to save data to {filename}: {str(e)}", exc_info=True)
+            return False
+    
+    def _save_bytes(self, payload: bytes, filename: str) -> bool:
+        """Queue already-serialized JSON to be written in the background.
+        
+        Args:
+            payload: JSON document bytes
+            filename: Name of the file (without path)
             
-            logger.info(f"Successfully saved data to: {filepath.absolute()}")
-            logger.info(f"File size: {filepath.stat().st_size} bytes")
+        Returns:
+            True if the payload was queued (or is unchanged), False otherwise
+        """
+        try:
+            filepath = INSURANCE_DATA_DIR / filename
+            if self._last_saved.get(filename) == payload:
+                logger.info(f"Data unchanged, skipping write to: {filepath.absolute()}")
+                return True
+            _write_queue.put((filepath, payload))
+            self._last_saved[filename] = payload
+            logger.info(f"Queued data for: {filepath.absolute()}")
             return True
             
         except Exception as e:
@@ -83,66 +369,16 @@ class InsuranceService:
         insurance_data = quote_data.get(insurance_key, {})
         
         # Extract contact information based on insurance type
-        first_name = ""
-        last_name = ""
-        email = ""
-        phone = ""
-        
-        if insurance_type == "home":
-            full_name = insurance_data.get("primary_insured", {}).get("full_name", "")
-            if full_name:
-                name_parts = full_name.split(" ", 1)
-                first_name = name_parts[0]
-                last_name = name_parts[1] if len(name_parts) > 1 else ""
-            contact_info = insurance_data.get("contact", {})
-            email = contact_info.get("email", "")
-            phone = contact_info.get("phone", "")
-            
-        elif insurance_type == "auto":
-            drivers = insurance_data.get("drivers", [])
-            if drivers:
-                full_name = drivers[0].get("full_name", "")
-                if full_name:
-                    name_parts = full_name.split(" ", 1)
-                    first_name = name_parts[0]
-                    last_name = name_parts[1] if len(name_parts) > 1 else ""
-            contact_info = insurance_data.get("contact", {})
-            email = contact_info.get("email", "")
-            phone = contact_info.get("phone", "")
-            
-        elif insurance_type == "flood":
-            full_name = insurance_data.get("full_name", "")
-            if full_name:
-                name_parts = full_name.split(" ", 1)
-                first_name = name_parts[0]
-                last_name = name_parts[1] if len(name_parts) > 1 else ""
-            email = insurance_data.get("email", "")
-            phone = insurance_data.get("phone", "")
-            
-        elif insurance_type == "life":
-            full_name = insurance_data.get("insured", {}).get("full_name", "")
-            if full_name:
-                name_parts = full_name.split(" ", 1)
-                first_name = name_parts[0]
-                last_name = name_parts[1] if len(name_parts) > 1 else ""
-            contact_info = insurance_data.get("contact", {})
-            email = contact_info.get("email", "")
-            phone = contact_info.get("phone", "")
-            
-        elif insurance_type == "commercial":
-            business_name = insurance_data.get("business", {}).get("name", "")
-            first_name = business_name
-            last_name = ""
-            contact_info = insurance_data.get("contact", {})
-            email = contact_info.get("email", "")
-            phone = contact_info.get("phone", "")
+        first_name, last_name = _LEAD_NAME.get(insurance_type, _no_name)(insurance_data)
+        # Flood keeps email/phone at the top level; the other types nest them under "contact"
+        contact_info = insurance_data if insurance_type == "flood" else insurance_data.get("contact", {})
         
         # Prepare lead data for AgencyZoom
         lead_data = {
             "first_name": first_name or "Unknown",
             "last_name": last_name,
-            "email": email or "noemail@pending.com",
-            "phone": phone,
+            "email": contact_info.get("email", "") or NO_EMAIL_PLACEHOLDER,
+            "phone": contact_info.get("phone", ""),
             "insurance_type": insurance_type,
             "source": "AI Voice Agent",
             "notes": f"Quote submitted via AI agent. Session: {self.session_id}",
@@ -150,26 +386,8 @@ class InsuranceService:
         }
         
         # Add type-specific fields
-        if insurance_type == "home":
-            property_addr = insurance_data.get("property", {}).get("address", {})
-            lead_data["property_address"] = f"{property_addr.get('streetAddress', '')}, {property_addr.get('city', '')}, {property_addr.get('state', '')} {property_addr.get('zip_code', '')}"
-            lead_data["current_provider"] = insurance_data.get("current_policy", {}).get("current_provider", "")
-        elif insurance_type == "auto":
-            vehicles = insurance_data.get("vehicles", [])
-            if vehicles:
-                lead_data["vehicle_info"] = f"{vehicles[0].get('make', '')} {vehicles[0].get('model', '')}"
-            lead_data["current_provider"] = insurance_data.get("current_policy", {}).get("current_provider", "")
-        elif insurance_type == "flood":
-            home_addr = insurance_data.get("home_address", {})
-            lead_data["home_address"] = f"{home_addr.get('streetAddress', '')}, {home_addr.get('city', '')}, {home_addr.get('state', '')} {home_addr.get('zip_code', '')}"
-        elif insurance_type == "life":
-            life_addr = insurance_data.get("address", {})
-            lead_data["address"] = f"{life_addr.get('streetAddress', '')}, {life_addr.get('city', '')}, {life_addr.get('state', '')} {life_addr.get('zip_code', '')}"
-            lead_data["appointment_requested"] = insurance_data.get("appointment_requested", False)
-        elif insurance_type == "commercial":
-            lead_data["business_name"] = insurance_data.get("business", {}).get("name", "")
-            business_addr = insurance_data.get("business", {}).get("address", {})
-            lead_data["business_address"] = f"{business_addr.get('streetAddress', '')}, {business_addr.get('city', '')}, {business_addr.get('state', '')} {business_addr.get('zip_code', '')}"
+        if insurance_type in _INSURANCE_TYPES:
+            _LEAD_EXTRA_FIELDS[insurance_type](insurance_data, lead_data)
         
         # Submit to AgencyZoom
         return self.agencyzoom_service.create_lead(lead_data)
@@ -184,20 +402,58 @@ class InsuranceService:
         Returns:
             Confirmation message
         """
-        if action_type not in ["add", "update"]:
+        if action_type not in _ACTIONS:
             return "Invalid action type. Please specify 'add' or 'update'."
         
-        if insurance_type not in ["home", "auto", "flood", "life", "commercial"]:
+        if insurance_type not in _INSURANCE_TYPES:
             return "Invalid insurance type. Please choose from: home, auto, flood, life, or commercial."
         
         self.user_action = action_type
         self.insurance_type = insurance_type
         self.collected_data = {"action": action_type, "insurance_type": insurance_type}
+        self._payload_bytes = {}
         
         logger.info(f"User action set: {action_type}, Insurance type: {insurance_type}")
         
         return f"Great! I'll help you {action_type} {insurance_type} insurance. Let me collect the necessary information from you."
     
+    def collect(self, kind: str, **fields) -> str:
+        """Validate, store and save the collected data for one insurance type.
+        
+        Args:
+            kind: Insurance type key of _COLLECTORS ("home", "auto", "flood", "life", "commercial")
+            **fields: Keyword arguments of the matching collect_*_insurance method
+            
+        Returns:
+            Confirmation message or error
+        """
+        build, name_field, opener = _COLLECTORS[kind]
+        key = f"{kind}_insurance"
+        name = fields[name_field]
+        try:
+            logger.info(f"Collecting {kind} insurance data for: {name}")
+            
+            dumped = build(**fields).model_dump(mode='json')
+            self.collected_data[key] = dumped
+            # Serialized once here and stitched into the submission file later
+            self._payload_bytes[key] = orjson.dumps(dumped)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s insurance data collected: %s", kind.capitalize(), self._payload_bytes[key].decode())
+            
+            # Save a snapshot to JSON file; otherwise the data is only written on submission
+            if INSURANCE_SAVE_INTERMEDIATE:
+                filename = f"{key}_{self.session_id}_{_safe_name(name)}.json"
+                if not self._save_to_json(self.collected_data, filename):
+                    logger.warning(f"{kind.capitalize()} insurance data collected but failed to save to file")
+                    return f"I've collected your {kind} insurance information, but there was an issue saving it. The data is still stored and can be submitted."
+                logger.info(f"{kind.capitalize()} insurance data saved successfully to {filename}")
+            
+            return f"{opener} I've collected all your {kind} insurance information. Your quote request is ready to be submitted."
+            
+        except Exception as e:
+            logger.error(f"Error collecting {kind} insurance data: {str(e)}", exc_info=True)
+            return f"I encountered an error: {str(e)}. Please verify the information and try again."
+    
     def collect_home_insurance(
         self,
         full_name: str,
@@ -224,70 +480,13 @@ class InsuranceService:
         Returns:
             Confirmation message or error
         """
-        try:
-            logger.info(f"Collecting home insurance data for: {full_name}")
-            
-            primary_insured = Person(
-                full_name=full_name,
-                date_of_birth=datetime.strptime(date_of_birth, "%Y-%m-%d").date()
-            )
-            
-            spouse = None
-            if spouse_name and spouse_dob:
-                spouse = Person(
-                    full_name=spouse_name,
-                    date_of_birth=datetime.strptime(spouse_dob, "%Y-%m-%d").date()
-                )
-            
-            address = Address(
-                streetAddress=street_address,
-                city=city,
-                state=state,
-                country=country,
-                zip_code=zip_code
-            )
-            
-            property_details = PropertyDetails(
-                address=address,
-                has_solar_panels=has_solar_panels,
-                has_pool=has_pool,
-                roof_age=roof_age
-            )
-            
-            policy_info = PolicyInfo(
-                current_provider=current_provider,
-                renewal_date=datetime.strptime(renewal_date, "%Y-%m-%d").date() if renewal_date else None,
-                renewal_premium=renewal_premium
-            )
-            
-            contact = ContactInfo(phone=phone, email=email)
-            
-            home_insurance = HomeInsurance(
-                primary_insured=primary_insured,
-                spouse=spouse,
-                property=property_details,
-                has_pets=has_pets,
-                current_policy=policy_info,
-                contact=contact
-            )
-            
-            self.collected_data["home_insurance"] = home_insurance.model_dump()
-            logger.info(f"Home insurance data collected: {json.dumps(self.collected_data['home_insurance'], default=str)}")
-            
-            # Save to JSON file
-            filename = f"home_insurance_{self.session_id}_{full_name.replace(' ', '_')}.json"
-            save_success = self._save_to_json(self.collected_data, filename)
-            
-            if save_success:
-                logger.info(f"Home insurance data saved successfully to {filename}")
-                return "Perfect! I've collected all your home insurance information. Your quote request is ready to be submitted."
-            else:
-                logger.warning(f"Home insurance data collected but failed to save to file")
-                return "I've collected your home insurance information, but there was an issue saving it. The data is still stored and can be submitted."
-            
-        except Exception as e:
-            logger.error(f"Error collecting home insurance data: {str(e)}", exc_info=True)
-            return f"I encountered an error: {str(e)}. Please verify the information and try again."
+        return self.collect(
+            "home", full_name=full_name, date_of_birth=date_of_birth, phone=phone,
+            street_address=street_address, city=city, state=state, country=country, zip_code=zip_code,
+            email=email, current_provider=current_provider, spouse_name=spouse_name, spouse_dob=spouse_dob,
+            has_solar_panels=has_solar_panels, has_pool=has_pool, roof_age=roof_age, has_pets=has_pets,
+            renewal_date=renewal_date, renewal_premium=renewal_premium
+        )
     
     def collect_auto_insurance(
         self,
@@ -312,57 +511,12 @@ class InsuranceService:
         Returns:
             Confirmation message or error
         """
-        try:
-            logger.info(f"Collecting auto insurance data for: {driver_name}")
-            
-            driver = Driver(
-                full_name=driver_name,
-                date_of_birth=datetime.strptime(driver_dob, "%Y-%m-%d").date(),
-                license_number=license_number,
-                qualification=qualification,
-                profession=profession,
-                gpa=gpa
-            )
-            
-            vehicle = Vehicle(
-                vin=vin,
-                make=vehicle_make,
-                model=vehicle_model,
-                coverage_type=CoverageType(coverage_type)
-            )
-            
-            policy_info = PolicyInfo(
-                current_provider=current_provider,
-                renewal_date=datetime.strptime(renewal_date, "%Y-%m-%d").date() if renewal_date else None,
-                renewal_premium=renewal_premium
-            )
-            
-            contact = ContactInfo(phone=phone, email=email)
-            
-            auto_insurance = AutoInsurance(
-                drivers=[driver],
-                vehicles=[vehicle],
-                current_policy=policy_info,
-                contact=contact
-            )
-            
-            self.collected_data["auto_insurance"] = auto_insurance.model_dump()
-            logger.info(f"Auto insurance data collected: {json.dumps(self.collected_data['auto_insurance'], default=str)}")
-            
-            # Save to JSON file
-            filename = f"auto_insurance_{self.session_id}_{driver_name.replace(' ', '_')}.json"
-            save_success = self._save_to_json(self.collected_data, filename)
-            
-            if save_success:
-                logger.info(f"Auto insurance data saved successfully to {filename}")
-                return "Excellent! I've collected all your auto insurance information. Your quote request is ready to be submitted."
-            else:
-                logger.warning(f"Auto insurance data collected but failed to save to file")
-                return "I've collected your auto insurance information, but there was an issue saving it. The data is still stored and can be submitted."
-            
-        except Exception as e:
-            logger.error(f"Error collecting auto insurance data: {str(e)}", exc_info=True)
-            return f"I encountered an error: {str(e)}. Please verify the information and try again."
+        return self.collect(
+            "auto", driver_name=driver_name, driver_dob=driver_dob, phone=phone,
+            license_number=license_number, vin=vin, vehicle_make=vehicle_make, vehicle_model=vehicle_model,
+            coverage_type=coverage_type, email=email, qualification=qualification, profession=profession,
+            gpa=gpa, current_provider=current_provider, renewal_date=renewal_date, renewal_premium=renewal_premium
+        )
     
     def collect_flood_insurance(
         self,
@@ -380,41 +534,10 @@ class InsuranceService:
         Returns:
             Confirmation message or error
         """
-        try:
-            logger.info(f"Collecting flood insurance data for: {full_name}")
-            
-            address = Address(
-                streetAddress=street_address,
-                city=city,
-                state=state,
-                country=country,
-                zip_code=zip_code
-            )
-            
-            flood_insurance = FloodInsurance(
-                home_address=address,
-                full_name=full_name,
-                phone=phone,
-                email=email
-            )
-            
-            self.collected_data["flood_insurance"] = flood_insurance.model_dump()
-            logger.info(f"Flood insurance data collected: {json.dumps(self.collected_data['flood_insurance'])}")
-            
-            # Save to JSON file
-            filename = f"flood_insurance_{self.session_id}_{full_name.replace(' ', '_')}.json"
-            save_success = self._save_to_json(self.collected_data, filename)
-            
-            if save_success:
-                logger.info(f"Flood insurance data saved successfully to {filename}")
-                return "Perfect! I've collected all your flood insurance information. Your quote request is ready to be submitted."
-            else:
-                logger.warning(f"Flood insurance data collected but failed to save to file")
-                return "I've collected your flood insurance information, but there was an issue saving it. The data is still stored and can be submitted."
-            
-        except Exception as e:
-            logger.error(f"Error collecting flood insurance data: {str(e)}", exc_info=True)
-            return f"I encountered an error: {str(e)}. Please verify the information and try again."
+        return self.collect(
+            "flood", full_name=full_name, email=email, phone=phone,
+            street_address=street_address, city=city, state=state, country=country, zip_code=zip_code
+        )
     
     def collect_life_insurance(
         self,
@@ -436,54 +559,12 @@ class InsuranceService:
         Returns:
             Confirmation message or error
         """
-        try:
-            logger.info(f"Collecting life insurance data for: {full_name}")
-            
-            insured = Person(
-                full_name=full_name,
-                date_of_birth=datetime.strptime(date_of_birth, "%Y-%m-%d").date()
-            )
-            
-            address = Address(
-                streetAddress=street_address,
-                city=city,
-                state=state,
-                country=country,
-                zip_code=zip_code
-            )
-            
-            contact = ContactInfo(phone=phone, email=email or "noemail@pending.com")
-            
-            appt_datetime = None
-            if appointment_date:
-                appt_datetime = datetime.strptime(appointment_date, "%Y-%m-%d %H:%M")
-            
-            life_insurance = LifeInsurance(
-                insured=insured,
-                address=address,
-                appointment_requested=appointment_requested,
-                appointment_date=appt_datetime,
-                contact=contact,
-                policy_type=PolicyType(policy_type) if policy_type else None
-            )
-            
-            self.collected_data["life_insurance"] = life_insurance.model_dump()
-            logger.info(f"Life insurance data collected: {json.dumps(self.collected_data['life_insurance'], default=str)}")
-            
-            # Save to JSON file
-            filename = f"life_insurance_{self.session_id}_{full_name.replace(' ', '_')}.json"
-            save_success = self._save_to_json(self.collected_data, filename)
-            
-            if save_success:
-                logger.info(f"Life insurance data saved successfully to {filename}")
-                return "Great! I've collected all your life insurance information. Your quote request is ready to be submitted."
-            else:
-                logger.warning(f"Life insurance data collected but failed to save to file")
-                return "I've collected your life insurance information, but there was an issue saving it. The data is still stored and can be submitted."
-            
-        except Exception as e:
-            logger.error(f"Error collecting life insurance data: {str(e)}", exc_info=True)
-            return f"I encountered an error: {str(e)}. Please verify the information and try again."
+        return self.collect(
+            "life", full_name=full_name, date_of_birth=date_of_birth, phone=phone,
+            street_address=street_address, city=city, state=state, country=country, zip_code=zip_code,
+            email=email, appointment_requested=appointment_requested, appointment_date=appointment_date,
+            policy_type=policy_type
+        )
     
     def collect_commercial_insurance(
         self,
@@ -508,61 +589,13 @@ class InsuranceService:
         Returns:
             Confirmation message or error
         """
-        try:
-            logger.info(f"Collecting commercial insurance data for: {business_name}")
-            
-            address = Address(
-                streetAddress=street_address,
-                city=city,
-                state=state,
-                country=country,
-                zip_code=zip_code
-            )
-            
-            business = BusinessDetails(
-                name=business_name,
-                type=business_type,
-                address=address
-            )
-            
-            coverage = CoverageDetails(
-                inventory_limit=inventory_limit,
-                building_coverage=building_coverage,
-                building_coverage_limit=building_coverage_limit
-            )
-            
-            policy_info = PolicyInfo(
-                current_provider=current_provider,
-                renewal_date=datetime.strptime(renewal_date, "%Y-%m-%d").date() if renewal_date else None,
-                renewal_premium=renewal_premium
-            )
-            
-            contact = ContactInfo(phone=phone, email=email or "noemail@pending.com")
-            
-            commercial_insurance = CommercialInsurance(
-                business=business,
-                coverage=coverage,
-                current_policy=policy_info,
-                contact=contact
-            )
-            
-            self.collected_data["commercial_insurance"] = commercial_insurance.model_dump()
-            logger.info(f"Commercial insurance data collected: {json.dumps(self.collected_data['commercial_insurance'], default=str)}")
-            
-            # Save to JSON file
-            filename = f"commercial_insurance_{self.session_id}_{business_name.replace(' ', '_')}.json"
-            save_success = self._save_to_json(self.collected_data, filename)
-            
-            if save_success:
-                logger.info(f"Commercial insurance data saved successfully to {filename}")
-                return "Excellent! I've collected all your commercial insurance information. Your quote request is ready to be submitted."
-            else:
-                logger.warning(f"Commercial insurance data collected but failed to save to file")
-                return "I've collected your commercial insurance information, but there was an issue saving it. The data is still stored and can be submitted."
-            
-        except Exception as e:
-            logger.error(f"Error collecting commercial insurance data: {str(e)}", exc_info=True)
-            return f"I encountered an error: {str(e)}. Please verify the information and try again."
+        return self.collect(
+            "commercial", business_name=business_name, phone=phone,
+            street_address=street_address, city=city, state=state, country=country, zip_code=zip_code,
+            business_type=business_type, inventory_limit=inventory_limit, building_coverage=building_coverage,
+            building_coverage_limit=building_coverage_limit, current_provider=current_provider,
+            renewal_date=renewal_date, renewal_premium=renewal_premium, email=email
+        )
     
     def submit_quote_request(self) -> str:
         """Submit the collected insurance quote request to Agency Zoom.
@@ -592,21 +625,34 @@ class InsuranceService:
                 insurance_key: self.collected_data[insurance_key]
             }
             
-            quote_request = QuoteRequest(**quote_data)
-            logger.info(f"Quote request object created successfully")
+            # The section was validated and dumped in collect_*; check it against the
+            # quote schema once, but submit the dumped dict as-is
+            QUOTE_ADAPTER.validate_python(quote_data)
+            logger.info(f"Quote request validated successfully")
             
             # Save the final submitted quote to JSON file
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             submission_filename = f"SUBMITTED_{self.insurance_type}_quote_{timestamp}.json"
             
-            submission_data = {
-                "submission_timestamp": timestamp,
-                "session_id": self.session_id,
-                "status": "submitted",
-                "quote_request": quote_request.model_dump()
-            }
-            
-            save_success = self._save_to_json(submission_data, submission_filename)
+            section = self._payload_bytes.get(insurance_key)
+            if section is not None:
+                # Stitch the wrapper around the section bytes cached by collect_*
+                # instead of serializing the whole quote a second time
+                save_success = self._save_bytes(
+                    b'{"submission_timestamp":' + orjson.dumps(timestamp)
+                    + b',"session_id":' + orjson.dumps(self.session_id)
+                    + b',"status":"submitted","quote_request":{"insurance_type":' + orjson.dumps(self.insurance_type)
+                    + b',' + orjson.dumps(insurance_key) + b':' + section + b'}}',
+                    submission_filename
+                )
+            else:
+                submission_data = {
+                    "submission_timestamp": timestamp,
+                    "session_id": self.session_id,
+                    "status": "submitted",
+                    "quote_request": quote_data
+                }
+                save_success = self._save_to_json(submission_data, submission_filename)
             
             if save_success:
                 logger.info(f"✅ Quote request SUCCESSFULLY SAVED to: {submission_filename}")
@@ -614,7 +660,8 @@ class InsuranceService:
                 logger.error(f"❌ FAILED to save quote request to: {submission_filename}")
             
             # Log the quote submission
-            logger.info(f"Quote request data: {json.dumps(quote_request.model_dump(), default=str)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Quote request data: %s", _dumps_str(quote_data))
             
             # Submit to AgencyZoom if service is available
             # Note: AgencyZoom submission is now handled by submit_collected_data_to_agencyzoom()
@@ -623,7 +670,7 @@ class InsuranceService:
             # if self.agencyzoom_service:
             #     try:
             #         logger.info("Attempting to submit to AgencyZoom...")
-            #         agencyzoom_result = self._submit_to_agencyzoom(quote_request.model_dump())
+            #         agencyzoom_result = self._submit_to_agencyzoom(quote_data)
             #         if agencyzoom_result:
             #             agencyzoom_submitted = True
             #             logger.info("✅ Successfully submitted to AgencyZoom")
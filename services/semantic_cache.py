@@ -0,0 +1,88 @@
+"""Semantic response cache for the chatbot: reuses answers to paraphrased questions."""
+
+import logging
+import os
+from typing import Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger("unified-api")
+
+# Semantic cache configuration from environment variables
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "2048"))
+SEMANTIC_CACHE_MODEL = os.getenv("SEMANTIC_CACHE_MODEL", "text-embedding-3-small")
+
+
+class SemanticCache:
+    """
+    In-process cache of chatbot replies keyed by query embedding and conversation context.
+
+    Embeddings are stored unit-normalized in a fixed-size matrix, so a lookup is
+    one matrix-vector product. A reply is only reused when the context hash
+    (recent turns + custom instructions) matches exactly and the cosine
+    similarity of the queries reaches the threshold. When full, the oldest
+    entries are overwritten.
+    """
+
+    def __init__(
+        self,
+        openai_client,
+        enabled: bool = SEMANTIC_CACHE_ENABLED,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        model: str = SEMANTIC_CACHE_MODEL
+    ):
+        """Initialize the semantic cache."""
+        self.enabled = enabled
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model = model
+        self._client = openai_client
+        self._vectors: Optional[np.ndarray] = None  # allocated on first store, once the dimension is known
+        self._context_hashes = np.zeros(max_entries, dtype=np.int64)
+        self._responses = [None] * max_entries
+        self._count = 0
+        self._next = 0
+
+        if enabled:
+            logger.info(f"Semantic response cache enabled (threshold {threshold}, max {max_entries} entries)")
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Return the unit-normalized embedding of text."""
+        response = await self._client.embeddings.create(model=self.model, input=text)
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: np.ndarray, context_hash: int) -> Optional[str]:
+        """Return the cached reply for a similar query in the same context, or None."""
+        if self._count == 0:
+            return None
+
+        candidates = np.flatnonzero(self._context_hashes[:self._count] == context_hash)
+        if candidates.size == 0:
+            return None
+
+        similarities = self._vectors[candidates] @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        logger.info(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+        return self._responses[candidates[best]]
+
+    def store(self, embedding: np.ndarray, context_hash: int, response: str):
+        """Cache a reply, overwriting the oldest entry when the cache is full."""
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+
+        slot = self._next
+        self._vectors[slot] = embedding
+        self._context_hashes[slot] = context_hash
+        self._responses[slot] = response
+        self._next = (slot + 1) % self.max_entries
+        self._count = min(self._count + 1, self.max_entries)
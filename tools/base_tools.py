@@ -1,11 +1,16 @@
 """Base utility tools for the telephony agent."""
 
 import logging
+import time
 from datetime import datetime
 from livekit.agents import function_tool, RunContext
 
 logger = logging.getLogger("telephony-agent")
 
+# (minute since the epoch, formatted time) of the last get_current_time call;
+# the text only changes once a minute
+_current_time_cache = (-1, "")
+
 
 class BaseTools:
     """Base utility tools for common operations."""
@@ -18,5 +23,9 @@ class BaseTools:
         Returns:
             Current time in 12-hour format.
         """
-        return f"The current time is {datetime.now().strftime('%I:%M %p')}"
-
+        global _current_time_cache
+        now = time.time()
+        minute = int(now // 60)
+        if _current_time_cache[0] != minute:
+            _current_time_cache = (minute, datetime.fromtimestamp(now).strftime('%I:%M %p'))
+        return f"The current time is {_current_time_cache[1]}"
@@ -1,15 +1,35 @@
 """Insurance data collection tools for the telephony agent."""
 
 import logging
-import json
-from typing import Optional
-from datetime import datetime
+import re
+from typing import Any, Dict, Optional
 from livekit.agents import function_tool, RunContext
 
+from models.common import EMAIL_PATTERN
+from models.insurance import VIN_PATTERN
 from services.insurance_service import InsuranceService
 
 logger = logging.getLogger("telephony-agent")
 
+# The formats the models enforce, compiled once; malformed values are turned
+# back before the service builds and validates the whole model
+_VIN_RE = re.compile(VIN_PATTERN, re.ASCII)
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+
+def _validate(kwargs: Dict[str, Any]) -> Optional[str]:
+    """Return an error message for a malformed VIN or email argument, or None.
+    
+    Empty values are left to the service, which has its own defaults for them.
+    """
+    vin = kwargs.get("vin")
+    if vin and not _VIN_RE.fullmatch(vin.upper()):
+        return "I encountered an error: VIN must be 17 characters (letters except I, O, Q and digits). Please verify the information and try again."
+    email = kwargs.get("email")
+    if email and not _EMAIL_RE.fullmatch(email):
+        return "I encountered an error: the email address is not valid. Please verify the information and try again."
+    return None
+
 
 class InsuranceTools:
     """Tools for collecting insurance information from callers."""
@@ -22,6 +42,26 @@ class InsuranceTools:
         """
         self.service = insurance_service
     
+    def _call_service(self, tool: str, args: Dict[str, Any], *log_fields: str) -> str:
+        """Log a tool call, forward its arguments to the service method and log the result.
+        
+        The service method has the tool's name without the "_data" suffix.
+        
+        Args:
+            tool: Name of the calling tool
+            args: The tool's locals(), i.e. its arguments (self and context are dropped)
+            *log_fields: Arguments to show in the TOOL CALLED log line
+            
+        Returns:
+            The service method's result
+        """
+        kwargs = {name: value for name, value in args.items() if name not in ("self", "context")}
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔧 TOOL CALLED: %s(%s)", tool, ", ".join(f"{name}={kwargs[name]}" for name in log_fields))
+        result = _validate(kwargs) or getattr(self.service, tool.removesuffix("_data"))(**kwargs)
+        logger.info("🔧 TOOL RESULT: %s", result)
+        return result
+    
     @function_tool()
     async def set_user_action(
         self,
@@ -38,10 +78,7 @@ class InsuranceTools:
         Returns:
             Confirmation message with next steps
         """
-        logger.info(f"🔧 TOOL CALLED: set_user_action(action_type={action_type}, insurance_type={insurance_type})")
-        result = self.service.set_user_action(action_type, insurance_type)
-        logger.info(f"🔧 TOOL RESULT: {result}")
-        return result
+        return self._call_service("set_user_action", locals(), "action_type", "insurance_type")
     
     @function_tool()
     async def collect_home_insurance_data(
@@ -83,25 +120,7 @@ class InsuranceTools:
         Returns:
             Confirmation message
         """
-        logger.info(f"🔧 TOOL CALLED: collect_home_insurance_data(full_name={full_name})")
-        result = self.service.collect_home_insurance(
-            full_name=full_name,
-            date_of_birth=date_of_birth,
-            spouse_name=spouse_name,
-            spouse_dob=spouse_dob,
-            property_address=property_address,
-            has_solar_panels=has_solar_panels,
-            has_pool=has_pool,
-            roof_age=roof_age,
-            has_pets=has_pets,
-            current_provider=current_provider,
-            renewal_date=renewal_date,
-            renewal_premium=renewal_premium,
-            phone=phone,
-            email=email
-        )
-        logger.info(f"🔧 TOOL RESULT: {result}")
-        return result
+        return self._call_service("collect_home_insurance_data", locals(), "full_name")
     
     @function_tool()
     async def collect_auto_insurance_data(
@@ -145,26 +164,7 @@ class InsuranceTools:
         Returns:
             Confirmation message
         """
-        logger.info(f"🔧 TOOL CALLED: collect_auto_insurance_data(driver_name={driver_name})")
-        result = self.service.collect_auto_insurance(
-            driver_name=driver_name,
-            driver_dob=driver_dob,
-            license_number=license_number,
-            qualification=qualification,
-            profession=profession,
-            gpa=gpa,
-            vin=vin,
-            vehicle_make=vehicle_make,
-            vehicle_model=vehicle_model,
-            coverage_type=coverage_type,
-            current_provider=current_provider,
-            renewal_date=renewal_date,
-            renewal_premium=renewal_premium,
-            phone=phone,
-            email=email
-        )
-        logger.info(f"🔧 TOOL RESULT: {result}")
-        return result
+        return self._call_service("collect_auto_insurance_data", locals(), "driver_name")
     
     @function_tool()
     async def collect_flood_insurance_data(
@@ -184,14 +184,7 @@ class InsuranceTools:
         Returns:
             Confirmation message
         """
-        logger.info(f"🔧 TOOL CALLED: collect_flood_insurance_data(full_name={full_name}, home_address={home_address}, email={email})")
-        result = self.service.collect_flood_insurance(
-            full_name=full_name,
-            home_address=home_address,
-            email=email
-        )
-        logger.info(f"🔧 TOOL RESULT: {result}")
-        return result
+        return self._call_service("collect_flood_insurance_data", locals(), "full_name", "home_address", "email")
     
     @function_tool()
     async def collect_life_insurance_data(
@@ -219,18 +212,7 @@ class InsuranceTools:
         Returns:
             Confirmation message
         """
-        logger.info(f"🔧 TOOL CALLED: collect_life_insurance_data(full_name={full_name})")
-        result = self.service.collect_life_insurance(
-            full_name=full_name,
-            date_of_birth=date_of_birth,
-            appointment_requested=appointment_requested,
-            appointment_date=appointment_date,
-            phone=phone,
-            email=email,
-            policy_type=policy_type
-        )
-        logger.info(f"🔧 TOOL RESULT: {result}")
-        return result
+        return self._call_service("collect_life_insurance_data", locals(), "full_name")
     
     @function_tool()
     async def collect_commercial_insurance_data(
@@ -266,22 +248,7 @@ class InsuranceTools:
         Returns:
             Confirmation message
         """
-        logger.info(f"🔧 TOOL CALLED: collect_commercial_insurance_data(business_name={business_name})")
-        result = self.service.collect_commercial_insurance(
-            business_name=business_name,
-            business_type=business_type,
-            business_address=business_address,
-            inventory_limit=inventory_limit,
-            building_coverage=building_coverage,
-            building_coverage_limit=building_coverage_limit,
-            current_provider=current_provider,
-            renewal_date=renewal_date,
-            renewal_premium=renewal_premium,
-            phone=phone,
-            email=email
-        )
-        logger.info(f"🔧 TOOL RESULT: {result}")
-        return result
+        return self._call_service("collect_commercial_insurance_data", locals(), "business_name")
     
     @function_tool()
     async def submit_quote_request(self, context: RunContext) -> str:
@@ -290,8 +257,5 @@ class InsuranceTools:
         Returns:
             Confirmation message with next steps
         """
-        logger.info("🔧 TOOL CALLED: submit_quote_request()")
-        result = self.service.submit_quote_request()
-        logger.info(f"🔧 TOOL RESULT: {result}")
-        return result
+        return self._call_service("submit_quote_request", locals())
 
@@ -0,0 +1,108 @@
+"""
+Circuit breaker for outbound HTTP calls to upstream services.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger("telephony-agent")
+
+# Consecutive failures that open the circuit, and how long it stays open
+CIRCUIT_FAIL_MAX = int(os.getenv("CIRCUIT_FAIL_MAX", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+# Response statuses that mean the upstream itself is unavailable. A plain 500 is
+# left out: AMS360 reports SOAP faults (bad input) that way.
+BREAKER_FAILURE_STATUSES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+
+    After fail_max consecutive failures the circuit opens and calls fail
+    immediately for reset_timeout seconds. Then it half-opens: the next call goes
+    through as a single probe while other calls keep failing fast, and the probe's
+    outcome closes or re-opens the circuit. A probe that never reports an outcome
+    frees the slot for another one after reset_timeout.
+    """
+
+    def __init__(self, name: str, fail_max: int = CIRCUIT_FAIL_MAX, reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started = None  # set while the half-open trial call is in flight
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpenError if the circuit is open, or half-open with its probe in flight."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"{self.name} circuit open, skipping request")
+            if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                raise CircuitOpenError(f"{self.name} circuit half-open, waiting on trial request")
+            self._probe_started = now
+
+    def record_success(self):
+        """Reset the failure count, closing the circuit if it was open."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.warning(f"{self.name} circuit closed, upstream recovered")
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started = None
+
+    def record_failure(self):
+        """Count a failure, opening (or re-opening) the circuit at fail_max."""
+        with self._lock:
+            self._probe_started = None
+            self._failures += 1
+            if self._failures < self.fail_max:
+                return
+            if self._opened_at is None:
+                logger.warning(
+                    f"{self.name} circuit opened after {self._failures} consecutive failures, "
+                    f"failing fast for {self.reset_timeout:g}s"
+                )
+            self._opened_at = time.monotonic()
+
+
+class CircuitBreakerAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that routes every request through a CircuitBreaker.
+
+    Connection errors, timeouts and 502/503/504 responses count as failures once
+    the adapter's own retries are exhausted; any other response closes the circuit.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, *args, **kwargs):
+        self.breaker = breaker
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        self.breaker.before_call()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except requests.exceptions.RequestException:
+            self.breaker.record_failure()
+            raise
+
+        if response.status_code in BREAKER_FAILURE_STATUSES:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return response
@@ -2,33 +2,53 @@
 Logging utility functions for the application.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
 # Get the application logger
 logger = logging.getLogger("telephony-agent")
 
 
-def log_info(message: str):
-    """Log an info message."""
-    logger.info(message)
-
-
-def log_error(message: str):
-    """Log an error message."""
-    logger.error(message)
-
-
-def log_warning(message: str):
-    """Log a warning message."""
-    logger.warning(message)
-
-
-def log_debug(message: str):
-    """Log a debug message."""
-    logger.debug(message)
-
-
-def log_exception(message: str):
-    """Log an exception with traceback."""
-    logger.exception(message)
-
+# Direct aliases of the logger's methods: no wrapper frame per call, and %-style
+# args are only formatted if the level is enabled
+log_info = logger.info
+log_error = logger.error
+log_warning = logger.warning
+log_debug = logger.debug
+log_exception = logger.exception  # logs at ERROR with the current traceback
+
+
+def setup_queued_logging(*handlers: logging.Handler, level: int = logging.INFO,
+                         fmt: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s') -> logging.handlers.QueueListener:
+    """
+    Route root logging through a queue so handler I/O runs on a background thread.
+    
+    Log calls only enqueue the record; a QueueListener thread formats it and
+    writes to the given handlers (e.g. FileHandler, StreamHandler), so slow disk
+    writes never block the event loop.
+    
+    Args:
+        *handlers: Handlers that perform the actual output
+        level: Root logger level
+        fmt: Format applied to every handler
+    
+    Returns:
+        The started QueueListener (stopped automatically at exit)
+    """
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener